@@ -148,17 +148,15 @@ def search_artifacts(
         jenkinsurl, username=username, password=password, ssl_verify=ssl_verify
     )
     job = jenkinsci[jobname]
-    build_ids = job.get_build_ids()
     missing_artifacts = set()
-    for build_id in build_ids:
-        build = job.get_build(build_id)
-        artifacts = build.get_artifact_dict()
+    for build in job.get_builds(depth=0):
+        artifacts = build.get_artifact_dict(poll=False)
         if set(artifact_ids).issubset(set(artifacts.keys())):
             return dict((a, artifacts[a]) for a in artifact_ids)
         missing_artifacts = set(artifact_ids) - set(artifacts.keys())
         log.debug(
             msg="Artifacts %s missing from %s #%i"
-            % (", ".join(missing_artifacts), jobname, build_id)
+            % (", ".join(missing_artifacts), jobname, build.buildno)
         )
 
     raise ArtifactsMissing(missing_artifacts)
@@ -326,12 +324,8 @@ def search_artifact_by_regexp(
     )
     j = job[jobname]
 
-    build_ids = j.get_build_ids()
-
-    for build_id in build_ids:
-        build = j.get_build(build_id)
-
-        artifacts = build.get_artifact_dict()
+    for build in j.get_builds(depth=0):
+        artifacts = build.get_artifact_dict(poll=False)
         for name, art in artifacts.items():
             md_match = artifactRegExp.search(name)
 
@@ -0,0 +1,877 @@
+"""
+Asyncio flavoured counterparts of the core jenkinsapi objects.
+
+The classes in this module reuse the URL building, ``tree`` handling and
+payload parsing of their synchronous counterparts, but every method which
+talks to Jenkins is a coroutine. Objects are never polled on construction;
+the factory coroutines (``AsyncJenkins.get_job``, ``AsyncJob.get_build``
+etc.) return fully polled objects.
+
+Usage::
+
+    async with AsyncJenkins("http://localhost:8080") as jenkins:
+        jobs = await jenkins.get_jobs()
+        builds = await asyncio.gather(
+            *(job.get_last_build_or_none() for _, job in jobs)
+        )
+
+Only read operations are provided; use the synchronous
+:class:`jenkinsapi.jenkins.Jenkins` to create, modify or trigger things.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import warnings
+from collections import defaultdict
+from urllib.parse import quote, urljoin
+
+from requests import HTTPError
+
+from jenkinsapi.build import Build
+from jenkinsapi.constants import STATUS_SUCCESS
+from jenkinsapi.custom_exceptions import (
+    JenkinsAPIException,
+    NoBuildData,
+    NotBuiltYet,
+    NotFound,
+    UnknownJob,
+    UnknownNode,
+    UnknownQueueItem,
+)
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.job import STATUS_TREE, Job, JobStatus
+from jenkinsapi.jobs import Jobs
+from jenkinsapi.node import Node
+from jenkinsapi.nodes import Nodes
+from jenkinsapi.queue import Queue, QueueItem
+from jenkinsapi.utils.async_requester import AsyncRequester
+from jenkinsapi.utils.history_index import params_key, revision_from_actions
+from jenkinsapi.utils.single_flight import AsyncSingleFlight
+from jenkinsapi.utils.crumb_requester import CrumbRequester
+from jenkinsapi.utils.requester import Requester, request_key
+
+log = logging.getLogger(__name__)
+
+READ_ONLY = "%s is read-only, use jenkinsapi.jenkins.Jenkins to change it"
+
+
+def _not_async(message):
+    """
+    Return a method raising TypeError(message), in place of an inherited
+    synchronous method that cannot be used from asyncio code
+    """
+
+    def method(self, *args, **kwargs):
+        raise TypeError(message)
+
+    return method
+
+
+class AsyncJenkinsBase(JenkinsBase):
+    """
+    Coroutine versions of the JenkinsBase polling methods
+    """
+
+    async def poll(self, tree=None):
+        data = await self._poll(tree=tree)
+        if "jobs" in data:
+            data["jobs"] = await self.resolve_job_folders(data["jobs"])
+        if not tree:
+            self._data = data
+
+        return data
+
+    async def _poll(self, tree=None):
+        url = self.python_api_url(self.baseurl)
+        return await self.get_data(url, tree=tree)
+
+    async def get_data(self, url, params=None, tree=None):
+        requester = self.get_jenkins_obj().requester
+        params = self._merge_tree_param(params, tree)
+        single_flight = getattr(requester, "single_flight", None)
+        if not isinstance(single_flight, AsyncSingleFlight):
+            return await self._fetch_data(requester, url, params, tree)
+        data = await single_flight.do(
+            request_key(url, params),
+            lambda: self._fetch_data(requester, url, params, tree),
+        )
+        return copy.copy(data)
+
+    async def _fetch_data(self, requester, url, params, tree):
+        response = await requester.get_url(url, params)
+        return self._decode_and_report(requester, url, response, params, tree)
+
+    async def resolve_job_folders(self, jobs):
+        """
+        Replace every folder in jobs by the jobs it contains. Folders not
+        returned inline by a nested jobs_tree() are fetched concurrently.
+        """
+        return await self._resolve_folders(jobs, self.baseurl)
+
+    async def process_job_folder(self, folder, folder_path):
+        return await self._resolve_folders([folder], folder_path)
+
+    async def _resolve_folders(self, jobs, path):
+        contents = {}
+        level, unresolved = self._scan_folders([(path, jobs)], contents)
+        while level or unresolved:
+            tree = self.jobs_tree()
+            fetched = await asyncio.gather(
+                *(
+                    self.get_data(self.python_api_url(folder_path), tree=tree)
+                    for folder_path in unresolved
+                )
+            )
+            for folder_path, data in zip(unresolved, fetched):
+                contents[folder_path] = data.get("jobs", [])
+                level.append((folder_path, contents[folder_path]))
+            level, unresolved = self._scan_folders(level, contents)
+        return self._flatten_folders(jobs, path, contents)
+
+
+class AsyncJenkins(AsyncJenkinsBase):
+    """
+    Represents a jenkins environment, accessed from asyncio code.
+    """
+
+    # The URL helpers are shared with the synchronous client
+    base_server_url = Jenkins.base_server_url
+    get_create_url = Jenkins.get_create_url
+    get_queue_url = Jenkins.get_queue_url
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        baseurl: str,
+        username: str = "",
+        password: str = "",
+        requester=None,
+        lazy: bool = False,
+        ssl_verify: bool = True,
+        cert=None,
+        timeout: int = 10,
+        use_crumb: bool = True,
+        max_retries=None,
+        max_concurrency: int = 32,
+        rate_limiter=None,
+    ) -> None:
+        """
+        :param baseurl: baseurl for jenkins instance including port, str
+        :param username: username for jenkins auth, str
+        :param password: password for jenkins auth, str
+        :param requester: an AsyncRequester instance to use
+        :param lazy: if False, entering the context manager polls the
+            job list, bool
+        :param max_concurrency: maximum number of requests in flight, int
+        :param rate_limiter: RateLimiter used by the requester created for
+            this object (ignored when a requester is given)
+        :return: an AsyncJenkins obj
+        """
+        self.username = username
+        self.password = password
+        if requester is None:
+            self.requester = AsyncRequester(
+                username,
+                password,
+                baseurl=baseurl,
+                ssl_verify=ssl_verify,
+                cert=cert,
+                timeout=timeout,
+                max_retries=max_retries,
+                rate_limiter=rate_limiter,
+                requester_class=CrumbRequester if use_crumb else Requester,
+                max_concurrency=max_concurrency,
+            )
+        else:
+            self.requester = requester
+
+        self.requester.timeout = timeout
+        self.lazy = lazy
+        self.jobs_container = None
+        JenkinsBase.__init__(self, baseurl, poll=False)
+
+    async def __aenter__(self) -> "AsyncJenkins":
+        if not self.lazy:
+            await self.poll()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the worker threads and connections of the requester.
+        """
+        self.requester.close()
+
+    async def _poll(self, tree=None):
+        url = self.python_api_url(self.baseurl)
+        return await self.get_data(url, tree=tree or self.jobs_tree())
+
+    def __str__(self) -> str:
+        return "Jenkins server at %s" % self.baseurl
+
+    def get_jenkins_obj(self):
+        return self
+
+    @property
+    def jobs(self) -> "AsyncJobs":
+        if self.jobs_container is None:
+            self.jobs_container = AsyncJobs(self)
+
+        return self.jobs_container
+
+    async def get_job(self, jobname: str) -> "AsyncJob":
+        """
+        Get a polled job by name
+        :param jobname: name of the job, str
+        :return: AsyncJob obj
+        """
+        return await self.jobs[jobname]
+
+    async def get_job_by_url(self, url: str, job_name: str) -> "AsyncJob":
+        job = AsyncJob(url, job_name, self)
+        await job.poll()
+        return job
+
+    async def has_job(self, jobname: str) -> bool:
+        return await self.jobs.contains(jobname)
+
+    async def keys(self) -> list[str]:
+        return await self.jobs.keys()
+
+    async def get_jobs_list(self) -> list[str]:
+        return await self.jobs.keys()
+
+    async def get_jobs(self) -> list[tuple[str, "AsyncJob"]]:
+        """
+        Fetch all the jobs on this Jenkins server, concurrently.
+        :return: list of (job name, AsyncJob obj) pairs
+        """
+        return await self.jobs.items()
+
+    async def get_queue(self) -> "AsyncQueue":
+        queue = AsyncQueue(self.get_queue_url(), self)
+        await queue.poll()
+        return queue
+
+    async def get_nodes(self) -> "AsyncNodes":
+        nodes = AsyncNodes(self.baseurl, self)
+        await nodes.poll()
+        return nodes
+
+    async def get_node(self, nodename: str) -> "AsyncNode":
+        nodes = await self.get_nodes()
+        return await nodes.get_node(nodename)
+
+    async def has_node(self, nodename: str) -> bool:
+        nodes = await self.get_nodes()
+        return nodename in nodes
+
+    async def get_version(self) -> str:
+        """
+        Return version number of Jenkins
+        """
+        response = await self.requester.get_and_confirm_status(self.baseurl)
+        return response.headers.get("X-Jenkins", "0.0")
+
+
+class AsyncJobs(Jobs):
+    """
+    Container of all jobs on a server, accessed from asyncio code.
+
+    ``await jobs[name]`` returns a polled AsyncJob; membership has to be
+    checked with ``await jobs.contains(name)``.
+    """
+
+    async def poll(self, tree=None):
+        return await self.jenkins.poll(tree=tree or self.jenkins.jobs_tree())
+
+    async def _load(self):
+        if not self._data:
+            self._data = (await self.poll()).get("jobs", [])
+        return self._data
+
+    def __contains__(self, job_name: str) -> bool:
+        raise TypeError("Use 'await jobs.contains(name)' with AsyncJobs")
+
+    def __len__(self) -> int:
+        raise TypeError("Use 'len(await jobs.keys())' with AsyncJobs")
+
+    async def contains(self, job_name: str) -> bool:
+        """
+        True if job_name exists in Jenkins
+        """
+        await self._load()
+        return self._normalize_job_name(job_name) in self._get_index()
+
+    async def __getitem__(self, job_name: str) -> "AsyncJob":
+        normalized_name = self._normalize_job_name(job_name)
+        await self._load()
+        job_row = self._get_index().get(normalized_name)
+        if job_row is None:
+            raise UnknownJob(normalized_name)
+        return await self.jenkins.get_job_by_url(
+            Job.strip_trailing_slash(job_row["url"]), normalized_name
+        )
+
+    async def keys(self) -> list[str]:
+        """
+        Return a list of the names of all jobs
+        """
+        await self._load()
+        return list(self.iterkeys())
+
+    async def values(self) -> list["AsyncJob"]:
+        """
+        Return all jobs, polled concurrently
+        """
+        return [job for _, job in await self.items()]
+
+    async def items(self) -> list[tuple[str, "AsyncJob"]]:
+        """
+        Return (name, job) pairs for all jobs, polled concurrently
+        """
+        names = await self.keys()
+        jobs = [
+            AsyncJob(Job.strip_trailing_slash(row["url"]), name, self.jenkins)
+            for name, row in zip(names, self._data)
+        ]
+        await asyncio.gather(*(job.poll() for job in jobs))
+        return list(zip(names, jobs))
+
+
+class AsyncJob(AsyncJenkinsBase, Job):
+    """
+    Represents a jenkins job, accessed from asyncio code.
+    """
+
+    def __init__(self, url: str, name: str, jenkins_obj: AsyncJenkins) -> None:
+        Job.__init__(self, url, name, jenkins_obj, poll=False)
+
+    async def poll(self, tree=None):
+        data = await AsyncJenkinsBase.poll(self, tree=tree)
+        if not tree and not self.jenkins.lazy:
+            self._data = await self._add_missing_builds(self._data)
+
+        return data
+
+    async def _add_missing_builds(self, data):
+        if self._all_builds_loaded(data):
+            return data
+        response = await self.poll(tree="allBuilds[number,url]")
+        data["builds"] = response["allBuilds"]
+        return data
+
+    async def _buildid_for_type(self, buildtype):
+        assert buildtype in (
+            "lastStableBuild",
+            "lastSuccessfulBuild",
+            "lastBuild",
+            "lastCompletedBuild",
+            "firstBuild",
+            "lastFailedBuild",
+        ), "Unknown build info type: %s" % buildtype
+
+        data = await self.poll(tree="%s[number]" % buildtype)
+
+        if not data.get(buildtype):
+            raise NoBuildData(buildtype)
+        return data[buildtype]["number"]
+
+    async def get_build_dict(self):
+        builds, last_build = await asyncio.gather(
+            self.poll(tree="builds[number,url]"),
+            self.poll(tree="lastBuild[number,url]"),
+        )
+        if not builds:
+            raise NoBuildData(repr(self))
+        builds = await self._add_missing_builds(builds)
+        return self._make_build_dict(builds["builds"], last_build["lastBuild"])
+
+    async def get_build_ids(self):
+        """
+        Return a sorted list of all good builds as ints.
+        """
+        return list(reversed(sorted((await self.get_build_dict()).keys())))
+
+    async def get_build(self, buildnumber, depth=1) -> "AsyncBuild":
+        assert isinstance(buildnumber, int)
+        build = AsyncBuild(
+            self._build_url(buildnumber), buildnumber, job=self, depth=depth
+        )
+        try:
+            await build.poll()
+        except HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+            raise NotFound("Build #%s not found" % buildnumber)
+        return build
+
+    async def get_build_metadata(self, buildnumber) -> "AsyncBuild":
+        if not isinstance(buildnumber, int):
+            raise ValueError('Parameter "buildNumber" must be int')
+        return await self.get_build(buildnumber, depth=0)
+
+    async def __getitem__(self, buildnumber) -> "AsyncBuild":
+        return await self.get_build(buildnumber)
+
+    def __len__(self):
+        raise TypeError("Use 'len(await job.get_build_dict())' with AsyncJob")
+
+    async def get_last_build(self) -> "AsyncBuild":
+        return await self.get_build(await self.get_last_buildnumber())
+
+    async def get_first_build(self) -> "AsyncBuild":
+        return await self.get_build(await self.get_first_buildnumber())
+
+    async def get_last_good_build(self) -> "AsyncBuild":
+        return await self.get_build(await self.get_last_good_buildnumber())
+
+    async def get_last_stable_build(self) -> "AsyncBuild":
+        return await self.get_build(await self.get_last_stable_buildnumber())
+
+    async def get_last_completed_build(self) -> "AsyncBuild":
+        return await self.get_build(
+            await self.get_last_completed_buildnumber()
+        )
+
+    async def get_last_build_or_none(self) -> "AsyncBuild" | None:
+        try:
+            return await self.get_last_build()
+        except NoBuildData:
+            return None
+
+    async def status_snapshot(self) -> JobStatus:
+        return JobStatus.from_data(await self.poll(tree=STATUS_TREE))
+
+    async def is_queued(self) -> bool:
+        return (await self.status_snapshot()).in_queue
+
+    async def is_running(self) -> bool:
+        return (await self.status_snapshot()).building
+
+    async def is_queued_or_running(self) -> bool:
+        return (await self.status_snapshot()).is_queued_or_running
+
+    async def is_enabled(self) -> bool:
+        data = await self.poll(tree="color")
+        return "disabled" not in data.get("color", "")
+
+    async def get_config(self) -> str:
+        response = await self.jenkins.requester.get_and_confirm_status(
+            self.get_config_xml_url()
+        )
+        return response.text
+
+    async def load_config(self) -> None:
+        self._config = await self.get_config()
+
+    def _get_config_element_tree(self):
+        if self._config is None:
+            raise TypeError(
+                "Use 'await job.load_config()' before reading the "
+                "configuration of an AsyncJob"
+            )
+        return Job._get_config_element_tree(self)
+
+    async def get_queue_item(self) -> "AsyncQueueItem":
+        data = await self.poll(tree="inQueue,queueItem[url]")
+        if not data.get("inQueue") or not data.get("queueItem"):
+            raise UnknownQueueItem()
+        queue_item = AsyncQueueItem(
+            urljoin(self.jenkins.baseurl, data["queueItem"]["url"]),
+            self.jenkins,
+        )
+        await queue_item.poll()
+        return queue_item
+
+    async def has_queued_build(self, build_params) -> bool:
+        queue = await self.jenkins.get_queue()
+        items = await queue.get_queue_items_for_job(self.name)
+        return any(item.get_parameters() == build_params for item in items)
+
+    async def get_downstream_jobs(self) -> list["AsyncJob"]:
+        return list(
+            await asyncio.gather(
+                *(
+                    self.jenkins.get_job(name)
+                    for name in self.get_downstream_job_names()
+                )
+            )
+        )
+
+    async def get_upstream_jobs(self) -> list["AsyncJob"]:
+        return list(
+            await asyncio.gather(
+                *(
+                    self.jenkins.get_job(name)
+                    for name in self.get_upstream_job_names()
+                )
+            )
+        )
+
+    async def get_build_by_params(
+        self, build_params, order=1, max_workers=None
+    ) -> "AsyncBuild":
+        """
+        Return the first build, in the given order, whose parameters are
+        build_params, found with one allBuilds query.
+        """
+        if order != 1 and order != -1:
+            raise ValueError(
+                "Direction should be ascending or descending (1/-1)"
+            )
+        data = await self.poll(
+            tree="allBuilds[number,actions[parameters[name,value]]]"
+        )
+        key = params_key(build_params)
+        buildnumbers = sorted(
+            row["number"]
+            for row in data.get("allBuilds", [])
+            if params_key(Build.params_from_actions(row.get("actions"))) == key
+        )
+        for buildnumber in buildnumbers[::order]:
+            try:
+                return await self.get_build(buildnumber)
+            except NotFound:
+                continue
+        raise NoBuildData(
+            "No build with such params {params}".format(params=build_params)
+        )
+
+    async def get_revision_dict(self) -> dict[str, list[int]]:
+        """
+        Return a dict mapping git revisions to the numbers of their
+        builds, newest first, found with one allBuilds query.
+        """
+        data = await self.poll(
+            tree="allBuilds[number,actions[lastBuiltRevision[SHA1]]]"
+        )
+        if "allBuilds" not in data:
+            raise NoBuildData(repr(self))
+        revs = defaultdict(list)
+        for row in data["allBuilds"]:
+            revision = revision_from_actions(row.get("actions"))
+            if revision is not None:
+                revs[revision].append(row["number"])
+        return revs
+
+    async def get_buildnumber_for_revision(
+        self, revision, refresh=False
+    ) -> list[int]:
+        buildnumbers = (await self.get_revision_dict()).get(revision)
+        if not buildnumbers:
+            raise NotFound("Couldn't find a build with that revision")
+        return buildnumbers
+
+    get_history_index = _not_async(
+        "Use 'await job.get_build_by_params()' or "
+        "'await job.get_revision_dict()' with AsyncJob"
+    )
+    iter_builds = _not_async("Use 'await job.get_build_ids()' with AsyncJob")
+    get_builds = _not_async(
+        "Use 'asyncio.gather()' over 'job.get_build()' with AsyncJob"
+    )
+    invoke = _not_async(READ_ONLY % "AsyncJob")
+    delete_build = _not_async(READ_ONLY % "AsyncJob")
+    __delitem__ = _not_async(READ_ONLY % "AsyncJob")
+    toggle_keep_build = _not_async(READ_ONLY % "AsyncJob")
+    delete_from_queue = _not_async(READ_ONLY % "AsyncJob")
+    enable = _not_async(READ_ONLY % "AsyncJob")
+    disable = _not_async(READ_ONLY % "AsyncJob")
+    update_config = _not_async(READ_ONLY % "AsyncJob")
+    modify_scm_branch = _not_async(READ_ONLY % "AsyncJob")
+    modify_scm_url = _not_async(READ_ONLY % "AsyncJob")
+    recreate = _not_async(READ_ONLY % "AsyncJob")
+    wipe_out_workspace = _not_async(READ_ONLY % "AsyncJob")
+    trigger_scm_poll = _not_async(READ_ONLY % "AsyncJob")
+    change_description = _not_async(READ_ONLY % "AsyncJob")
+    set_concurrent_builds = _not_async(READ_ONLY % "AsyncJob")
+    block_build_when_downstream_building = _not_async(READ_ONLY % "AsyncJob")
+    unblock_build_when_downstream_building = _not_async(READ_ONLY % "AsyncJob")
+    block_build_when_upstream_building = _not_async(READ_ONLY % "AsyncJob")
+    unblock_build_when_upstream_building = _not_async(READ_ONLY % "AsyncJob")
+    restrict_to_node = _not_async(READ_ONLY % "AsyncJob")
+
+
+class AsyncBuild(AsyncJenkinsBase, Build):
+    """
+    Represents a Jenkins build, accessed from asyncio code.
+    """
+
+    def __init__(
+        self, url: str, buildno: int, job: AsyncJob, depth: int = 1
+    ) -> None:
+        Build.__init__(self, url, buildno, job, depth=depth, poll=False)
+
+    async def _poll(self, tree=None):
+        url = self.python_api_url(self.baseurl)
+        return await self.get_data(
+            url, params={"depth": self.depth}, tree=tree
+        )
+
+    async def is_running(self) -> bool:
+        data = await self.poll(tree="building")
+        return data.get("building", False)
+
+    async def is_good(self) -> bool:
+        if await self.is_running():
+            return False
+        self._data = await self._poll()
+        return self._data["result"] == STATUS_SUCCESS
+
+    async def block_until_complete(self, delay: int = 15) -> None:
+        while await self.is_running():
+            await asyncio.sleep(delay)
+
+    async def block(self) -> None:
+        await self.block_until_complete(delay=1)
+
+    async def get_artifacts(self, poll: bool = True) -> list:
+        if poll:
+            data = await self.poll(tree="artifacts[relativePath,fileName]")
+        else:
+            data = self._data
+        return list(self._make_artifacts(data))
+
+    async def get_artifact_dict(self, poll: bool = True) -> dict:
+        return {
+            artifact.relative_path: artifact
+            for artifact in await self.get_artifacts(poll=poll)
+        }
+
+    async def get_stages(self) -> list:
+        data = await self.poll(tree="stages")
+        return data.get("stages", [])
+
+    async def get_env_vars(self) -> dict:
+        url = self.python_api_url("%s/injectedEnvVars" % self.baseurl)
+        try:
+            data = await self.get_data(url, params={"depth": self.depth})
+        except HTTPError:
+            warnings.warn(
+                "Make sure the Environment Injector plugin is installed."
+            )
+            raise
+        return data["envMap"]
+
+    async def get_pending_input_actions(self) -> list:
+        url = "%s/wfapi/pendingInputActions" % self.baseurl
+        return await self.get_data(url)
+
+    async def _get_job_build(self, job_name, buildnumber):
+        if not job_name:
+            return None, None
+        job = await self.get_jenkins_obj().get_job(job_name)
+        if buildnumber is None:
+            return job, None
+        return job, await job.get_build(buildnumber)
+
+    async def get_upstream_job(self) -> AsyncJob | None:
+        job, _ = await self._get_job_build(self.get_upstream_job_name(), None)
+        return job
+
+    async def get_upstream_build(self) -> "AsyncBuild" | None:
+        _, build = await self._get_job_build(
+            self.get_upstream_job_name(), self.get_upstream_build_number()
+        )
+        return build
+
+    async def get_master_job(self) -> AsyncJob | None:
+        job, _ = await self._get_job_build(self.get_master_job_name(), None)
+        return job
+
+    async def get_master_build(self) -> "AsyncBuild" | None:
+        _, build = await self._get_job_build(
+            self.get_master_job_name(), self.get_master_build_number()
+        )
+        return build
+
+    async def get_downstream_jobs(self) -> list[AsyncJob]:
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_jenkins_obj().get_job(name)
+                    for name in self.get_downstream_job_names()
+                )
+            )
+        )
+
+    async def get_downstream_builds(self) -> list["AsyncBuild"]:
+        downstream_job_names = self.get_downstream_job_names()
+        builds = []
+        for fingerprint in self._data.get("fingerprint", []):
+            for job_usage in fingerprint["usage"]:
+                if job_usage["name"] not in downstream_job_names:
+                    continue
+                job = await self.get_jenkins_obj().get_job(job_usage["name"])
+                builds.extend(
+                    job.get_build(build_id)
+                    for job_range in job_usage["ranges"]["ranges"]
+                    for build_id in range(job_range["start"], job_range["end"])
+                )
+        return list(await asyncio.gather(*builds))
+
+    async def get_matrix_runs(self) -> list["AsyncBuild"]:
+        runs = [
+            AsyncBuild(rinfo["url"], rinfo["number"], self.job, self.depth)
+            for rinfo in self._data.get("runs", [])
+            if rinfo["number"] == self._data["number"]
+        ]
+        await asyncio.gather(*(run.poll() for run in runs))
+        return runs
+
+    async def stream_logs(self, interval=0):
+        """
+        Return an async generator which streams parts of text console.
+        """
+        url = "%s/logText/progressiveText" % self.baseurl
+        size = 0
+        more_data = True
+        while more_data:
+            response = await self.job.jenkins.requester.get_url(
+                url, params={"start": size}
+            )
+            content = response.content
+            if content:
+                if isinstance(content, bytes):
+                    content = content.decode(response.encoding or "ISO-8859-1")
+                yield content
+            size = response.headers["X-Text-Size"]
+            more_data = response.headers.get("X-More-Data")
+            await asyncio.sleep(interval)
+
+    get_resultset = _not_async(
+        "Result sets are not available from AsyncBuild, use "
+        "jenkinsapi.jenkins.Jenkins"
+    )
+    stop = _not_async(READ_ONLY % "AsyncBuild")
+    toggle_keep = _not_async(READ_ONLY % "AsyncBuild")
+
+    async def get_console(self) -> str:
+        url = "%s/consoleText" % self.baseurl
+        response = await self.job.jenkins.requester.get_url(url)
+        content = response.content
+        if isinstance(content, bytes):
+            return content.decode(response.encoding or "ISO-8859-1")
+        if isinstance(content, str):
+            return content
+        raise JenkinsAPIException("Unknown content type for console")
+
+
+class AsyncQueue(AsyncJenkinsBase, Queue):
+    """
+    The Jenkins queue, accessed from asyncio code.
+    """
+
+    def __init__(self, baseurl: str, jenkins_obj: AsyncJenkins) -> None:
+        Queue.__init__(self, baseurl, jenkins_obj, poll=False)
+
+    async def get_item(self, item_id) -> "AsyncQueueItem":
+        for item in self._data["items"]:
+            if item["id"] == item_id:
+                queue_item = AsyncQueueItem(
+                    self.get_queue_item_url(item), self.jenkins
+                )
+                await queue_item.poll()
+                return queue_item
+        raise UnknownQueueItem(item_id)
+
+    async def get_queue_items_for_job(
+        self, job_name: str
+    ) -> list["AsyncQueueItem"]:
+        items = [
+            AsyncQueueItem(self.get_queue_item_url(item), self.jenkins)
+            for item in self._get_queue_items_for_job(job_name)
+        ]
+        await asyncio.gather(*(item.poll() for item in items))
+        return items
+
+    async def delete_item_by_id(self, item_id: str):
+        deleteurl = "%s/cancelItem?id=%s" % (self.baseurl, item_id)
+        await self.get_jenkins_obj().requester.post_url(deleteurl)
+
+
+class AsyncQueueItem(AsyncJenkinsBase, QueueItem):
+    """An individual item in the queue, accessed from asyncio code"""
+
+    def __init__(self, baseurl: str, jenkins_obj: AsyncJenkins) -> None:
+        QueueItem.__init__(self, baseurl, jenkins_obj, poll=False)
+
+    async def get_job(self) -> AsyncJob:
+        return await self.jenkins.get_job_by_url(
+            urljoin(self.jenkins.baseurl, self._data["task"]["url"]),
+            self._data["task"]["name"],
+        )
+
+    async def get_build(self) -> AsyncBuild:
+        build_number = self.get_build_number()
+        job = await self.get_job()
+        return await job.get_build(build_number)
+
+    async def block_until_building(self, delay=5) -> AsyncBuild:
+        while True:
+            await self.poll()
+            try:
+                return await self.get_build()
+            except NotBuiltYet:
+                await asyncio.sleep(delay)
+
+
+class AsyncNodes(AsyncJenkinsBase, Nodes):
+    """
+    The nodes of a Jenkins server, accessed from asyncio code.
+    """
+
+    def __init__(self, baseurl: str, jenkins_obj: AsyncJenkins) -> None:
+        Nodes.__init__(self, baseurl, jenkins_obj, poll=False)
+
+    async def _poll(self, tree=None):
+        if not tree:
+            tree = "computer[displayName]"
+        return await AsyncJenkinsBase._poll(self, tree=tree)
+
+    def _make_node(self, nodename) -> "AsyncNode":
+        if nodename.lower() == "built-in node":
+            nodeurl = "%s/(%s)" % (self.baseurl, "built-in")
+        else:
+            nodeurl = "%s/%s" % (self.baseurl, nodename)
+        return AsyncNode(self.jenkins, nodeurl, nodename)
+
+    async def get_node(self, nodename: str) -> "AsyncNode":
+        if nodename not in self:
+            raise UnknownNode(nodename)
+        node = self._make_node(nodename)
+        await node.poll()
+        return node
+
+    async def __getitem__(self, nodename: str) -> "AsyncNode":
+        return await self.get_node(nodename)
+
+
+class AsyncNode(AsyncJenkinsBase, Node):
+    """
+    A single node, accessed from asyncio code.
+    """
+
+    def __init__(
+        self, jenkins_obj: AsyncJenkins, baseurl: str, nodename: str
+    ) -> None:
+        Node.__init__(
+            self, jenkins_obj, baseurl, nodename, node_dict={}, poll=False
+        )
+
+    async def is_online(self) -> bool:
+        return not (await self.poll(tree="offline"))["offline"]
+
+    async def is_temporarily_offline(self) -> bool:
+        data = await self.poll(tree="temporarilyOffline")
+        return data["temporarilyOffline"]
+
+    async def is_idle(self) -> bool:
+        return (await self.poll(tree="idle"))["idle"]
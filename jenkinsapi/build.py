@@ -24,7 +24,7 @@ from jenkinsapi.artifact import Artifact
 
 # from jenkinsapi.job import Job
 from jenkinsapi.result_set import ResultSet
-from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.jenkinsbase import JenkinsBase, ProjectedData
 from jenkinsapi.constants import STATUS_SUCCESS
 from jenkinsapi.custom_exceptions import NoResults
 from jenkinsapi.custom_exceptions import JenkinsAPIException
@@ -35,6 +35,21 @@ from requests import HTTPError
 
 log = logging.getLogger(__name__)
 
+_STATUS_FIELDS = (
+    "number,url,result,building,timestamp,duration,estimatedDuration,"
+    "displayName,fullDisplayName,description,builtOn,keepLog"
+)
+_ACTIONS_TREE = (
+    "actions[parameters[name,value],causes[shortDescription,upstreamBuild,"
+    "upstreamProject,upstreamUrl,userId,userName],lastBuiltRevision[SHA1,"
+    "branch[SHA1,name]],remoteUrls,remoteUrl,failCount,skipCount,"
+    "totalCount,urlName]"
+)
+_CHANGESET_ITEMS = (
+    "kind,items[affectedPaths,author[fullName],authorEmail,comment,"
+    "commitId,date,id,msg,paths[editType,file],revision,timestamp,user]"
+)
+
 
 class Build(JenkinsBase):
     """
@@ -46,8 +61,42 @@ class Build(JenkinsBase):
         "%s has status %s, and does not have any test results"
     )
 
+    # Projection profiles: the tree of the fields a build fetches when it
+    # polls, None for all of them
+    PROFILES = {
+        "minimal": "number,url,result,building",
+        "status": _STATUS_FIELDS,
+        "scm": "%s,%s,changeSet[%s],changeSets[%s]"
+        % (_STATUS_FIELDS, _ACTIONS_TREE, _CHANGESET_ITEMS, _CHANGESET_ITEMS),
+        "full": None,
+    }
+
+    # The tree fetching each field missing from a profile; the fields not
+    # listed fetch all the data of the build
+    FIELD_TREES = {
+        **{field: field for field in _STATUS_FIELDS.split(",")},
+        "id": "id",
+        "queueId": "queueId",
+        "inProgress": "inProgress",
+        "actions": _ACTIONS_TREE,
+        "artifacts": "artifacts[displayPath,fileName,relativePath]",
+        "changeSet": "changeSet[%s]" % _CHANGESET_ITEMS,
+        "changeSets": "changeSets[%s]" % _CHANGESET_ITEMS,
+        "culprits": "culprits[absoluteUrl,fullName]",
+        "fingerprint": "fingerprint[fileName,hash,usage[name,"
+        "ranges[ranges[end,start]]]]",
+        "runs": "runs[number,url]",
+    }
+
     def __init__(
-        self, url: str, buildno: int, job: "Job", depth: int = 1
+        self,
+        url: str,
+        buildno: int,
+        job: "Job",
+        depth: int = 1,
+        poll: bool = True,
+        lazy: bool | None = None,
+        profile: str | None = None,
     ) -> None:
         """
         depth=1 is for backward compatibility consideration
@@ -56,11 +105,24 @@ class Build(JenkinsBase):
         depth=0 is sufficient for you, don't go up to 1. For more
         information, see
         https://www.jenkins.io/doc/book/using/remote-access-api/#RemoteaccessAPI-Depthcontrol
+
+        profile selects the fields fetched by a poll, see profile_tree();
+        None follows the build_profile of the job and config.BUILD_PROFILE
         """
         self.buildno: int = buildno
         self.job: "Job" = job
         self.depth = depth
-        JenkinsBase.__init__(self, url)
+        self.profile = profile
+        JenkinsBase.__init__(self, url, poll=poll, lazy=lazy)
+
+    def poll(self, tree=None):
+        if tree is None:
+            profile_tree = self.profile_tree()
+            if profile_tree is not None:
+                data = ProjectedData(self._poll(tree=profile_tree), self)
+                self._data = data
+                return data
+        return super().poll(tree=tree)
 
     def _poll(self, tree=None):
         # For builds we need more information for downstream and
@@ -69,24 +131,61 @@ class Build(JenkinsBase):
         url = self.python_api_url(self.baseurl)
         return self.get_data(url, params={"depth": self.depth}, tree=tree)
 
+    def profile_tree(self) -> str | None:
+        """
+        Return the tree of the fields fetched when the build polls, None
+        for all of them. Fields outside it are fetched one at a time when
+        an accessor first reads them.
+        """
+        return self.resolve_profile(self.profile, self.job)
+
+    @classmethod
+    def resolve_profile(cls, profile=None, job=None) -> str | None:
+        """
+        Return the tree of a projection profile: a name from PROFILES or
+        a tree expression. Without one, the build_profile of the job, and
+        then config.BUILD_PROFILE, is used.
+        """
+        if profile is None:
+            profile = getattr(job, "build_profile", None)
+        if not isinstance(profile, str):
+            profile = config.BUILD_PROFILE
+        return cls.PROFILES.get(profile, profile)
+
+    def field_tree(self, field: str) -> str | None:
+        """Return the tree fetching a single field, see FIELD_TREES"""
+        return self.FIELD_TREES.get(field)
+
+    def _partial_data(self, data) -> ProjectedData:
+        return ProjectedData(data, self)
+
+    def _decode_and_report(self, requester, url, response, params, tree):
+        if response.status_code == 404:
+            # a missing build is an expected miss (see Job.get_build):
+            # raise it without logging a failed request
+            response.raise_for_status()
+        return super()._decode_and_report(
+            requester, url, response, params, tree
+        )
+
     def __str__(self) -> str:
-        return self._data["fullDisplayName"]
+        return self._fields("fullDisplayName")["fullDisplayName"]
 
     @property
     def name(self):
         return str(self)
 
     def get_description(self) -> str:
-        return self._data["description"]
+        return self._fields("description")["description"]
 
     def get_number(self) -> int:
-        return self._data["number"]
+        return self._fields("number")["number"]
 
     def get_status(self) -> str:
-        return self._data["result"]
+        return self._fields("result")["result"]
 
     def get_slave(self) -> str:
-        return self._data["builtOn"]
+        return self._fields("builtOn")["builtOn"]
 
     def get_revision(self) -> str:
         return getattr(self, f"_get_{self._get_vcs()}_rev", lambda: "")()
@@ -109,7 +208,14 @@ class Build(JenkinsBase):
         #     {'_class': 'hudson.model.StringParameterValue',
         #      'value': '12',
         #      'name': 'FOO_BAR_BAZ'}]}
-        actions = self._data.get("actions")
+        return self.params_from_actions(self._data.get("actions"))
+
+    @staticmethod
+    def params_from_actions(actions) -> dict[str, str]:
+        """
+        Return the parameters held by the actions of a build, as returned
+        by get_params().
+        """
         if actions:
             parameters = {}
             for elem in actions:
@@ -200,13 +306,25 @@ class Build(JenkinsBase):
         return result
 
     def get_duration(self) -> datetime.timedelta:
-        return datetime.timedelta(milliseconds=self._data["duration"])
+        return datetime.timedelta(
+            milliseconds=self._fields("duration")["duration"]
+        )
 
     def get_build_url(self) -> str:
         return self._data["url"]
 
-    def get_artifacts(self) -> Iterator[Artifact]:
-        data = self.poll(tree="artifacts[relativePath,fileName]")
+    def get_artifacts(self, poll: bool = True) -> Iterator[Artifact]:
+        """
+        :param poll: set to False to use the artifact list of the build data
+            which is already loaded instead of querying Jenkins again
+        """
+        if poll:
+            data = self.poll(tree="artifacts[relativePath,fileName]")
+        else:
+            data = self._data
+        return self._make_artifacts(data)
+
+    def _make_artifacts(self, data) -> Iterator[Artifact]:
         for afinfo in data["artifacts"]:
             url = "%s/artifact/%s" % (
                 self.baseurl,
@@ -220,8 +338,8 @@ class Build(JenkinsBase):
             )
             yield af
 
-    def get_artifact_dict(self) -> dict[str, Artifact]:
-        return {af.relative_path: af for af in self.get_artifacts()}
+    def get_artifact_dict(self, poll: bool = True) -> dict[str, Artifact]:
+        return {af.relative_path: af for af in self.get_artifacts(poll=poll)}
 
     def get_upstream_job_name(self) -> str | None:
         """
@@ -349,13 +467,16 @@ class Build(JenkinsBase):
                 for job_usage in fingerprint["usage"]:
                     if job_usage["name"] in downstream_job_names:
                         job = self.get_jenkins_obj().get_job(job_usage["name"])
-                        for job_range in job_usage["ranges"]["ranges"]:
+                        build_ids = [
+                            build_id
+                            for job_range in job_usage["ranges"]["ranges"]
                             for build_id in range(
                                 job_range["start"], job_range["end"]
-                            ):
-                                downstream_builds.append(
-                                    job.get_build(build_id)
-                                )
+                            )
+                        ]
+                        downstream_builds.extend(
+                            job._get_builds_by_number(build_ids)
+                        )
             return downstream_builds
         except (IndexError, KeyError):
             return []
@@ -367,10 +488,27 @@ class Build(JenkinsBase):
         :return: Generator of Build
         """
         if "runs" in self._data:
-            for rinfo in self._data["runs"]:
-                number: int = rinfo["number"]
-                if number == self._data["number"]:
-                    yield Build(rinfo["url"], number, self.job)
+            runs = [
+                rinfo
+                for rinfo in self._data["runs"]
+                if rinfo["number"] == self._data["number"]
+            ]
+            results = self.get_data_many(
+                [self.python_api_url(rinfo["url"]) for rinfo in runs],
+                params={"depth": self.depth},
+            )
+            for rinfo, result in zip(runs, results):
+                if result.error is not None:
+                    raise result.error
+                run = Build(
+                    rinfo["url"],
+                    rinfo["number"],
+                    self.job,
+                    depth=self.depth,
+                    poll=False,
+                )
+                run._data = result.data
+                yield run
 
     def is_running(self) -> bool:
         """
@@ -390,7 +528,7 @@ class Build(JenkinsBase):
         """
         if self.is_running():
             return False
-        self._data = self._poll()
+        self.poll()
         return self._data["result"] == STATUS_SUCCESS
 
     def block_until_complete(self, delay: int = 15) -> None:
@@ -469,7 +607,7 @@ class Build(JenkinsBase):
         """
         # Java timestamps are given in miliseconds since the epoch start!
         naive_timestamp = datetime.datetime(
-            *time.gmtime(self._data["timestamp"] / 1000.0)[:6]
+            *time.gmtime(self._fields("timestamp")["timestamp"] / 1000.0)[:6]
         )
         return pytz.utc.localize(naive_timestamp)
 
@@ -520,7 +658,7 @@ class Build(JenkinsBase):
         Return the estimated build duration (in seconds) or none.
         """
         try:
-            eta_ms = self._data["estimatedDuration"]
+            eta_ms = self._fields("estimatedDuration")["estimatedDuration"]
             return max(0, eta_ms / 1000.0)
         except KeyError:
             return None
@@ -610,7 +748,7 @@ class Build(JenkinsBase):
         """
         url: str = "%s/toggleLogKeep" % self.baseurl
         self.get_jenkins_obj().requester.post_and_confirm_status(url, data={})
-        self._data = self._poll()
+        self.poll()
 
     def is_kept_forever(self) -> bool:
         return self._data["keepLog"]
@@ -2,6 +2,61 @@
 Jenkins configuration
 """
 
-JENKINS_API = r"api/python"
+JENKINS_API = r"api/json"
 
 LOAD_TIMEOUT = 30
+
+# Create JenkinsBase objects unpolled; they fetch their data on first use
+LAZY_POLL = False
+
+# Folder levels resolved by the job listing request itself, deeper folders
+# are fetched separately
+FOLDER_TREE_DEPTH = 4
+
+# Job fields fetched by Jenkins.iter_jobs() by default, besides name, color
+# and url
+ITER_JOBS_FIELDS = (
+    "lastBuild[number,result,timestamp]",
+    "healthReport[score]",
+)
+
+# Build fields fetched by Job.iter_builds() by default, besides number and
+# url
+ITER_BUILDS_FIELDS = ("result", "timestamp", "building")
+
+# Builds requested at once by Job.iter_builds()
+BUILDS_PAGE_SIZE = 100
+
+# Projection profile of the data fetched by Build objects: a name from
+# Build.PROFILES ("minimal", "status", "scm" or "full") or a tree
+# expression. Job.build_profile and the profile argument of Job.get_build()
+# take precedence
+BUILD_PROFILE = "full"
+
+# Build numbers a Job remembers as existing, so that get_build() does not
+# check them again when builds are created lazily
+KNOWN_BUILDS_CACHE_SIZE = 64
+
+# Seconds the nodes, views, plugins and credentials collections of a
+# Jenkins object are reused before they are fetched again. 0, the default,
+# always fetches them: a cached collection misses changes made by other
+# clients until it expires
+COLLECTION_TTL = {
+    "nodes": 0,
+    "views": 0,
+    "plugins": 0,
+    "credentials": 0,
+    "credentials_by_id": 0,
+}
+
+# Seconds a job snapshot (see Jenkins snapshot_path) is used to warm-start
+# a client
+SNAPSHOT_MAX_AGE = 24 * 60 * 60
+
+# Keep the job and build listings of Jenkins, Jobs and Job objects in the
+# compact types of jenkinsapi.utils.compact_index instead of lists of dicts.
+# They save memory on large servers but are not dict and list instances
+COMPACT_LISTINGS = False
+
+# Builds of a job requested at once by a JenkinsMirror sync
+MIRROR_PAGE_SIZE = 100
@@ -20,6 +20,7 @@ from jenkinsapi.credential import FileCredentials
 from jenkinsapi.credential import DockerServerCredentials
 from jenkinsapi.jenkinsbase import JenkinsBase
 from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.utils.collection_cache import collection_changed
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -142,6 +143,9 @@ class Credentials(JenkinsBase):
                 )
 
         self.poll()
+        collection_changed(
+            self.jenkins, self, "credentials", "credentials_by_id"
+        )
         self.credentials = self._data["credentials"]
         if description not in self:
             raise JenkinsAPIException("Problem creating/updating credential.")
@@ -170,6 +174,9 @@ class Credentials(JenkinsBase):
                 "credentials. Original exception: %s" % str(jae)
             )
         self.poll()
+        collection_changed(
+            self.jenkins, self, "credentials", "credentials_by_id"
+        )
         self.credentials = self._data["credentials"]
         if description in self:
             raise JenkinsAPIException("Problem deleting credential.")
@@ -140,3 +140,19 @@ class AlreadyExists(JenkinsAPIException):
     """
 
     pass
+
+
+class CircuitOpen(JenkinsAPIException):
+    """
+    Request refused because the circuit breaker for the host is open
+    """
+
+    pass
+
+
+class RequestBudgetExceeded(JenkinsAPIException):
+    """
+    An operation traced with a request budget tried to exceed it
+    """
+
+    pass
@@ -17,7 +17,12 @@ class Executor(JenkinsBase):
     """
 
     def __init__(
-        self, baseurl: str, nodename: str, jenkins_obj: "Jenkins", number: int
+        self,
+        baseurl: str,
+        nodename: str,
+        jenkins_obj: "Jenkins",
+        number: int,
+        lazy: bool | None = None,
     ) -> None:
         """
         Init a node object by providing all relevant pointers to it
@@ -30,7 +35,7 @@ class Executor(JenkinsBase):
         self.number: int = number
         self.jenkins: "Jenkins" = jenkins_obj
         self.baseurl: str = baseurl
-        JenkinsBase.__init__(self, baseurl)
+        JenkinsBase.__init__(self, baseurl, lazy=lazy)
 
     def __str__(self) -> str:
         return f"{self.nodename} {self.number}"
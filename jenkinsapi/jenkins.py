@@ -7,6 +7,7 @@ from __future__ import annotations
 import time
 import logging
 import warnings
+from contextlib import contextmanager
 
 from urllib.parse import urlparse
 from urllib.request import Request, HTTPRedirectHandler, build_opener
@@ -33,9 +34,12 @@ from jenkinsapi.utils.requester import Requester
 from jenkinsapi.views import Views
 from jenkinsapi.queue import Queue
 from jenkinsapi.fingerprint import Fingerprint
-from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.jenkinsbase import JenkinsBase, PartialData
 from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.utils.collection_cache import CollectionCache
 from jenkinsapi.utils.crumb_requester import CrumbRequester
+from jenkinsapi.utils.job_snapshot import load_snapshot
+from jenkinsapi.utils.trace import RequestTrace
 
 
 log = logging.getLogger(__name__)
@@ -59,11 +63,30 @@ class Jenkins(JenkinsBase):
         timeout: int = 10,
         use_crumb: bool = True,
         max_retries=None,
+        rate_limiter=None,
+        lazy_poll: bool = False,
+        collection_ttl=None,
+        prefetch: bool = False,
+        snapshot_path: str | None = None,
     ) -> None:
         """
         :param baseurl: baseurl for jenkins instance including port, str
         :param username: username for jenkins auth, str
         :param password: password for jenkins auth, str
+        :param rate_limiter: RateLimiter shared by the requester created
+            for this object (ignored when a requester is given), and by its
+            clones
+        :param lazy_poll: create jobs, builds, views, nodes, executors and
+            queue items unpolled; they fetch their data on first use
+        :param collection_ttl: seconds the nodes, views, plugins and
+            credentials collections are reused, a number or a dict by
+            collection name (see config.COLLECTION_TTL; not reused by
+            default)
+        :param prefetch: return without polling and fetch the job list in
+            a background thread; lookups needing it wait until it is loaded
+        :param snapshot_path: file keeping the last job list; with
+            prefetch, a recent enough snapshot serves lookups until the
+            job list is fetched
         :return: a Jenkins obj
         """
         self.username = username
@@ -82,32 +105,67 @@ class Jenkins(JenkinsBase):
                 cert=cert,
                 timeout=timeout,
                 max_retries=max_retries,
+                rate_limiter=rate_limiter,
             )
         else:
             self.requester = requester
 
         self.requester.timeout = timeout
         self.lazy = lazy
+        self.lazy_poll = lazy_poll
         self.jobs_container = None
-        JenkinsBase.__init__(self, baseurl, poll=not lazy)
+        self.collection_cache = CollectionCache(collection_ttl)
+        self.snapshot_path = snapshot_path
+        JenkinsBase.__init__(self, baseurl, poll=not (lazy or prefetch))
+        if prefetch:
+            self.jobs.prefetch(
+                load_snapshot(snapshot_path, self.baseurl)
+                if snapshot_path
+                else None
+            )
 
     def _poll(self, tree=None):
         url = self.python_api_url(self.baseurl)
-        return self.get_data(
-            url, tree="jobs[name,color,url]" if not tree else tree
-        )
+        return self.get_data(url, tree=tree or self.jobs_tree())
 
     def _poll_if_needed(self):
         if self.lazy and self._data is None:
             self.poll()
 
     def _clone(self):
-        return Jenkins(
+        clone = Jenkins(
             self.baseurl,
             username=self.username,
             password=self.password,
             requester=self.requester,
+            lazy_poll=self.lazy_poll,
         )
+        # the clone reuses, and invalidates, the collections of this object
+        clone.collection_cache = self.collection_cache
+        return clone
+
+    @contextmanager
+    def trace(self, max_requests=None, n_plus_one_threshold=5):
+        """
+        Record the requests made inside the block, tagged with the
+        jenkinsapi method that made them::
+
+            with jenkins.trace(max_requests=3) as trace:
+                jenkins["my_job"].get_build(42)
+            print(trace.report())
+
+        :param max_requests: raise RequestBudgetExceeded instead of
+            sending more requests than this, None for no budget
+        :param n_plus_one_threshold: number of requests to the same
+            endpoint pattern reported by ``trace.n_plus_one()``
+        :return: RequestTrace
+        """
+        request_trace = RequestTrace(max_requests, n_plus_one_threshold)
+        self.requester.add_hook(request_trace)
+        try:
+            yield request_trace
+        finally:
+            self.requester.remove_hook(request_trace)
 
     def base_server_url(self):
         if config.JENKINS_API in self.baseurl:
@@ -132,7 +190,13 @@ class Jenkins(JenkinsBase):
         return self
 
     def get_jenkins_obj_from_url(self, url: str):
-        return Jenkins(url, self.username, self.password, self.requester)
+        return Jenkins(
+            url,
+            self.username,
+            self.password,
+            self.requester,
+            lazy_poll=self.lazy_poll,
+        )
 
     def get_create_url(self) -> str:
         # This only ever needs to work on the base object
@@ -155,6 +219,34 @@ class Jenkins(JenkinsBase):
         """
         return self.jobs.iteritems()
 
+    def iter_jobs(self, fields=None):
+        """
+        Iterate over all jobs, including the jobs in folders, fetched with
+        a single request (plus one per level of folders deeper than
+        config.FOLDER_TREE_DEPTH).
+
+        The Job objects hold the fields of that request: reading any other
+        field of a job fetches its full data.
+
+        :param fields: job fields to fetch besides name, color and url, as
+            ``tree`` expressions; default config.ITER_JOBS_FIELDS
+        :return: iterator of Job obj
+        """
+        if fields is None:
+            fields = config.ITER_JOBS_FIELDS
+        tree = self.jobs_tree(fields=fields)
+        data = self.get_data(self.python_api_url(self.baseurl), tree=tree)
+        rows = self._resolve_folders(data.get("jobs", []), self.baseurl, tree)
+        for row in rows:
+            job = Job(
+                Job.strip_trailing_slash(row["url"]),
+                row["name"],
+                self,
+                poll=False,
+            )
+            job._data = PartialData(row, job)
+            yield job
+
     def get_jobs_info(self):
         """
         Get the jobs information
@@ -263,7 +355,7 @@ class Jenkins(JenkinsBase):
 
     @property
     def views(self):
-        return Views(self)
+        return self.collection_cache.get("views", lambda: Views(self))
 
     def get_view_by_url(self, view_url: str):
         # for nested view
@@ -273,6 +365,7 @@ class Jenkins(JenkinsBase):
     def delete_view_by_url(self, viewurl: str):
         url = f"{viewurl}/doDelete"
         self.requester.post_and_confirm_status(url, data="")
+        self.collection_cache.invalidate("views")
         self.poll()
         return self
 
@@ -326,7 +419,7 @@ class Jenkins(JenkinsBase):
 
     @property
     def nodes(self):
-        return self.get_nodes()
+        return self.collection_cache.get("nodes", self.get_nodes)
 
     def has_node(self, nodename: str) -> bool:
         """
@@ -334,7 +427,6 @@ class Jenkins(JenkinsBase):
         :param nodename: string, hostname
         :return: boolean
         """
-        self.poll()
         return nodename in self.nodes
 
     def delete_node(self, nodename: str) -> None:
@@ -392,7 +484,7 @@ class Jenkins(JenkinsBase):
 
     def get_plugins_url(self, depth):
         # This only ever needs to work on the base object
-        return f"{self.baseurl}/pluginManager/api/python?depth={depth}"
+        return f"{self.baseurl}/pluginManager/api/json?depth={depth}"
 
     def install_plugin(
         self,
@@ -414,6 +506,7 @@ class Jenkins(JenkinsBase):
         if not isinstance(plugin, Plugin):
             plugin = Plugin(plugin)
         self.plugins[plugin.shortName] = plugin
+        self._plugins_changed()
         if force_restart or (restart and self.plugins.restart_required):
             self.safe_restart(wait_for_reboot=wait_for_reboot)
         elif self.plugins.restart_required and not no_reboot_warning:
@@ -477,6 +570,7 @@ class Jenkins(JenkinsBase):
         elif isinstance(plugin, Plugin):
             plugin = plugin.shortName
         del self.plugins[plugin]
+        self._plugins_changed()
         if force_restart or (restart and self.plugins.restart_required):
             self.safe_restart(wait_for_reboot=wait_for_reboot)
         elif self.plugins.restart_required and not no_reboot_warning:
@@ -512,6 +606,10 @@ class Jenkins(JenkinsBase):
                 "Please reboot manually."
             )
 
+    def _plugins_changed(self) -> None:
+        # The credentials API depends on the credentials plugin
+        self.collection_cache.invalidate("credentials", "credentials_by_id")
+
     def safe_restart(self, wait_for_reboot: bool = True):
         """restarts jenkins when no jobs are running"""
         # NB: unlike other methods, the value of resp.status_code
@@ -521,6 +619,7 @@ class Jenkins(JenkinsBase):
         resp = self.requester.post_and_confirm_status(
             url, data="", valid=valid
         )
+        self.collection_cache.clear()
         if wait_for_reboot:
             self._wait_for_reboot()
         return resp
@@ -650,7 +749,7 @@ class Jenkins(JenkinsBase):
 
     @property
     def plugins(self):
-        return self.get_plugins()
+        return self.collection_cache.get("plugins", self.get_plugins)
 
     def get_plugins(self, depth: int = 1) -> Plugins:
         url = self.get_plugins_url(depth=depth)
@@ -659,12 +758,26 @@ class Jenkins(JenkinsBase):
     def has_plugin(self, plugin_name: str) -> bool:
         return plugin_name in self.plugins
 
+    def _get_plugin_version(self, plugin_name: str) -> str | None:
+        """
+        Return the version of an installed plugin, or None, from a single
+        request selecting only the names and versions of the plugins.
+        """
+        data = self.get_data(
+            f"{self.baseurl}/pluginManager/api/json",
+            tree="plugins[shortName,version]",
+        )
+        for plugin in data.get("plugins", []):
+            if plugin.get("shortName") == plugin_name:
+                return plugin.get("version")
+        return None
+
     def get_executors(self, nodename: str) -> Executors:
         url = f"{self.baseurl}/computer/{nodename}"
         return Executors(url, nodename, self)
 
     def get_master_data(self):
-        url = f"{self.baseurl}/computer/api/python"
+        url = f"{self.baseurl}/computer/api/json"
         return self.get_data(url)
 
     @property
@@ -680,11 +793,11 @@ class Jenkins(JenkinsBase):
         """
         Return credentials
         """
-
-        if "credentials" not in self.plugins:
+        version = self._get_plugin_version("credentials")
+        if version is None:
             raise JenkinsAPIException("Credentials plugin not installed")
 
-        if self.plugins["credentials"].version.startswith("1."):
+        if version.startswith("1."):
             url = f"{self.baseurl}/credential-store/domain/_/"
             return Credentials(url, self)
 
@@ -693,15 +806,19 @@ class Jenkins(JenkinsBase):
 
     @property
     def credentials(self):
-        return self.get_credentials(Credentials2x)
+        return self.collection_cache.get(
+            "credentials", lambda: self.get_credentials(Credentials2x)
+        )
 
     @property
     def credentials_by_id(self):
-        return self.get_credentials(CredentialsById)
+        return self.collection_cache.get(
+            "credentials_by_id", lambda: self.get_credentials(CredentialsById)
+        )
 
     @property
     def is_quieting_down(self) -> bool:
-        url = "%s/api/python?tree=quietingDown" % (self.baseurl,)
+        url = "%s/api/json?tree=quietingDown" % (self.baseurl,)
         data = self.get_data(url=url)
         return data.get("quietingDown", False)
 
@@ -859,5 +976,6 @@ class Jenkins(JenkinsBase):
         url = "%s/reload" % self.baseurl
         valid = self.requester.VALID_STATUS_CODES + [503, 500]
         self.requester.post_and_confirm_status(url, data="", valid=valid)
+        self.collection_cache.clear()
         if wait_for_completion:
             self._wait_for_reboot()
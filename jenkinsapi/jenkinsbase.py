@@ -4,16 +4,156 @@ Module for JenkinsBase class
 
 from __future__ import annotations
 
-import json
+import copy
 import pprint
 import logging
+import time
 from urllib.parse import quote
 from jenkinsapi import config
 from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.utils import json_decoder
+from jenkinsapi.utils.compact_index import compact_job_rows
+from jenkinsapi.utils.requester import request_key
+from jenkinsapi.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
+def tree_fields(tree) -> dict[str, bool]:
+    """
+    Return the top-level fields of a tree expression, mapped to True for
+    the fields selecting only part of their value (``field[...]``).
+    """
+    fields = {}
+    depth = 0
+    start = 0
+    for index, char in enumerate(tree + ","):
+        if char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            field = tree[start:index].strip()
+            name = field.split("[", 1)[0].split("{", 1)[0]
+            if name:
+                fields[name] = name != field
+            start = index + 1
+    return fields
+
+
+class PartialData(dict):
+    """
+    API data of an object holding only some of its fields, as fetched by a
+    projection. The first lookup of a field it does not hold fetches all
+    the data of the object.
+    """
+
+    def __init__(self, data, owner):
+        super().__init__(data)
+        self._owner = owner
+        self.current = True
+        # fields the object does not have, as found by a projection
+        self._absent = set()
+        # results of trees selecting part of a field, see project()
+        self._projections = {}
+
+    def _complete(self):
+        owner, self._owner = self._owner, None
+        try:
+            owner.poll()
+        except Exception:
+            self._owner = owner
+            raise
+        self.update(owner._data)
+        self.current = False
+
+    def __missing__(self, key):
+        if self._owner is None or key in self._absent:
+            raise KeyError(key)
+        self._complete()
+        return self[key]
+
+    def __contains__(self, key):
+        if not dict.__contains__(self, key) and self._wants(key):
+            self._complete()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if not dict.__contains__(self, key) and self._wants(key):
+            self._complete()
+        return dict.get(self, key, default)
+
+    def _wants(self, key) -> bool:
+        return self._owner is not None and key not in self._absent
+
+    @property
+    def is_complete(self) -> bool:
+        return self._owner is None
+
+    def project(self, tree, fetch):
+        """
+        Return data holding the fields of tree, fetched with fetch(tree)
+        unless they were fetched before. Plain fields are merged in;
+        fields selecting only part of their value are kept apart, by
+        tree, so that they are never mistaken for the whole value.
+        """
+        fields = tree_fields(tree)
+        if any(fields.values()):
+            if tree not in self._projections:
+                self._projections[tree] = fetch(tree)
+            return self._projections[tree]
+        if any(
+            not dict.__contains__(self, field) and field not in self._absent
+            for field in fields
+        ):
+            self.update(fetch(tree))
+            self._absent.update(
+                field for field in fields if not dict.__contains__(self, field)
+            )
+        return self
+
+
+class ProjectedData(PartialData):
+    """
+    API data of an object fetched with a projection profile. The first
+    lookup of a field it does not hold fetches only that field, with the
+    tree given by the owner's field_tree(), and merges it in; fields
+    without such a tree fetch all the data of the object.
+    """
+
+    def _fetch(self, key) -> bool:
+        """Fetch a missing field, return False if the object has none"""
+        if self._owner is None or key in self._absent:
+            return False
+        tree = self._owner.field_tree(key)
+        if tree is None:
+            owner, self._owner = self._owner, None
+            try:
+                self.update(owner._poll())
+            except Exception:
+                self._owner = owner
+                raise
+        else:
+            self.update(self._owner._poll(tree=tree))
+        if not dict.__contains__(self, key):
+            self._absent.add(key)
+            return False
+        return True
+
+    def __missing__(self, key):
+        if not self._fetch(key):
+            raise KeyError(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or self._fetch(key)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key) or self._fetch(key):
+            return dict.__getitem__(self, key)
+        return default
+
+
 class JenkinsBase(object):
     """
     This appears to be the base object that all other jenkins objects are
@@ -30,14 +170,105 @@ class JenkinsBase(object):
     def __str__(self):
         raise NotImplementedError
 
-    def __init__(self, baseurl: str, poll: bool = True):
+    def __init__(
+        self, baseurl: str, poll: bool = True, lazy: bool | None = None
+    ):
         """
         Initialize a jenkins connection
+
+        :param poll: fetch the data of the object
+        :param lazy: defer that fetch until the data is first used; None
+            to follow config.LAZY_POLL and the ``lazy_poll`` flag of the
+            Jenkins object
         """
         self._data = None
         self.baseurl = self.strip_trailing_slash(baseurl)
         if poll:
-            self.poll()
+            if lazy is None:
+                lazy = self._lazy_default()
+            if lazy:
+                self._pending_poll = True
+            else:
+                self.poll()
+
+    def _lazy_default(self) -> bool:
+        if config.LAZY_POLL:
+            return True
+        try:
+            jenkins = self.get_jenkins_obj()
+        except (AttributeError, NotImplementedError):
+            return False
+        return getattr(jenkins, "lazy_poll", False) is True
+
+    @property
+    def _data(self):
+        """
+        The API data of the object; lazily created objects poll on first
+        access.
+        """
+        if self.__dict__.get("_pending_poll"):
+            self._pending_poll = False
+            try:
+                self.poll()
+            except Exception:
+                self._pending_poll = True
+                raise
+        return self.__dict__.get("_raw_data")
+
+    @_data.setter
+    def _data(self, value):
+        self._pending_poll = False
+        self._raw_data = value
+
+    @property
+    def is_hydrated(self) -> bool:
+        """False until a lazily created object fetched its data"""
+        return self.__dict__.get("_raw_data") is not None
+
+    def _fields(self, tree):
+        """
+        Return the API data. An object that has not fetched its data yet
+        requests only the fields of tree instead of all of it, and keeps
+        them as partial data (see PartialData.project), so that each
+        field is fetched once.
+        """
+
+        def fetch(tree):
+            return self.poll(tree=tree)
+
+        if self.__dict__.get("_pending_poll"):
+            data = self._partial_data({})
+            fields = data.project(tree, fetch)
+            self._data = data
+            return fields
+        data = self.__dict__.get("_raw_data")
+        if isinstance(data, PartialData) and not data.is_complete:
+            return data.project(tree, fetch)
+        return self._data
+
+    def _partial_data(self, data) -> PartialData:
+        """Return the partial API data of the object, see _fields()"""
+        return PartialData(data, self)
+
+    def _listed_fields(self, tree, *fields):
+        """
+        Return poll(tree), unless the object was created from a listing
+        holding fields (see Jenkins.iter_jobs) and has not changed since.
+        """
+        data = self.__dict__.get("_raw_data")
+        if (
+            isinstance(data, PartialData)
+            and data.current
+            and all(dict.__contains__(data, field) for field in fields)
+        ):
+            return data
+        return self.poll(tree=tree)
+
+    def _listing_changed(self):
+        """Stop answering from the listing the object was created from"""
+        data = self.__dict__.get("_raw_data")
+        if isinstance(data, PartialData):
+            data.current = False
 
     def get_jenkins_obj(self):
         raise NotImplementedError(
@@ -63,6 +294,8 @@ class JenkinsBase(object):
         data = self._poll(tree=tree)
         if "jobs" in data:
             data["jobs"] = self.resolve_job_folders(data["jobs"])
+            if config.COMPACT_LISTINGS:
+                data["jobs"] = compact_job_rows(data["jobs"])
         if not tree:
             self._data = data
 
@@ -74,13 +307,98 @@ class JenkinsBase(object):
 
     def get_data(self, url, params=None, tree=None):
         requester = self.get_jenkins_obj().requester
+        params = self._merge_tree_param(params, tree)
+        single_flight = getattr(requester, "single_flight", None)
+        if not isinstance(single_flight, SingleFlight):
+            return self._fetch_data(requester, url, params, tree)
+        # Identical concurrent reads share one request and its payload
+        data = single_flight.do(
+            request_key(url, params),
+            lambda: self._fetch_data(requester, url, params, tree),
+        )
+        return copy.copy(data)
+
+    def _fetch_data(self, requester, url, params, tree):
+        response = requester.get_url(url, params)
+        return self._decode_and_report(requester, url, response, params, tree)
+
+    def get_data_many(
+        self, urls, params=None, tree=None, max_workers=None, ordered=True
+    ):
+        """
+        Fetch and decode many API urls concurrently.
+
+        Accepts the same arguments as :meth:`Requester.get_many`, plus a
+        ``tree`` applied to every url. Yields BatchResult objects whose
+        ``data`` holds the decoded payload; HTTP and parsing errors are
+        attached to ``error`` instead of being raised.
+        """
+        requester = self.get_jenkins_obj().requester
+        if tree:
+            if params is None or isinstance(params, dict):
+                params = self._merge_tree_param(dict(params or {}), tree)
+            else:
+                params = [
+                    self._merge_tree_param(dict(item or {}), tree)
+                    for item in params
+                ]
+        for result in requester.get_many(
+            urls, params=params, max_workers=max_workers, ordered=ordered
+        ):
+            if result.error is None:
+                try:
+                    result.data = self._decode_and_report(
+                        requester,
+                        result.url,
+                        result.response,
+                        result.params,
+                        tree,
+                    )
+                except Exception as error:  # pylint: disable=broad-except
+                    result.error = error
+            yield result
+
+    @staticmethod
+    def _merge_tree_param(params, tree):
+        """
+        Add a ``tree`` projection to the query parameters, if one is given.
+        """
         if tree:
             if not params:
                 params = {"tree": tree}
             else:
                 params.update({"tree": tree})
+        return params
 
-        response = requester.get_url(url, params)
+    def _decode_and_report(self, requester, url, response, params, tree):
+        """
+        Parse an API response, reporting the decode time to the requester.
+        """
+        start = time.perf_counter()
+        data = self._parse_data_response(url, response, params, tree)
+        report = getattr(requester, "response_decoded", None)
+        if report is not None:
+            report(url, params, time.perf_counter() - start, response)
+        return data
+
+    @classmethod
+    def _parse_data_response(cls, url, response, params=None, tree=None):
+        """
+        Check the status of an API response and decode its payload.
+
+        Responses served by a ResponseCache keep their decoded payload, a
+        (shallow) copy of which is returned on later hits.
+        """
+        cached_data = getattr(response, "cached_data", None)
+        if cached_data is not None:
+            return copy.copy(cached_data)
+        data = cls._decode_data_response(url, response, params, tree)
+        if hasattr(response, "cached_data"):
+            response.cached_data = copy.copy(data)
+        return data
+
+    @staticmethod
+    def _decode_data_response(url, response, params=None, tree=None):
         if response.status_code != 200:
             logger.error(
                 "Failed request at %s with params: %s %s",
@@ -90,17 +408,12 @@ class JenkinsBase(object):
             )
             response.raise_for_status()
         try:
-            return json.loads(response.text)
-        except json.JSONDecodeError:
-            # Fallback: Some Jenkins API endpoints return Python literal syntax
-            # (True, False, None) instead of JSON (true, false, null)
+            return json_decoder.loads(response.content)
+        except json_decoder.DECODE_ERRORS:
+            # Fallback: the legacy api/python endpoints return Python literal
+            # syntax (True, False, None) instead of JSON (true, false, null)
             try:
-                converted = (
-                    response.text.replace("True", "true")
-                    .replace("False", "false")
-                    .replace("None", "null")
-                )
-                return json.loads(converted)
+                return json_decoder.loads_python_literal(response.content)
             except Exception:
                 logger.exception("Inappropriate content found at %s", url)
                 raise JenkinsAPIException("Cannot parse %s" % response.content)
@@ -114,30 +427,120 @@ class JenkinsBase(object):
         """
         pprint.pprint(self._data)
 
+    @staticmethod
+    def jobs_tree(depth=None, fields=()) -> str:
+        """
+        Return a ``tree`` selecting the jobs of an item and, nested up to
+        depth levels (default: config.FOLDER_TREE_DEPTH), of its folders:
+        ``jobs[name,color,url,jobs[name,color,url,...]]``.
+
+        :param fields: further job fields to select, as ``tree``
+            expressions, e.g. ``["lastBuild[number,result]"]``
+        """
+        if depth is None:
+            depth = config.FOLDER_TREE_DEPTH
+        selected = ",".join(["name", "color", "url"] + list(fields))
+        tree = "jobs[%s]" % selected
+        for _ in range(max(depth, 1) - 1):
+            tree = "jobs[%s,%s]" % (selected, tree)
+        return tree
+
     def resolve_job_folders(self, jobs):
-        for job in list(jobs):
-            if "color" not in job.keys():
-                jobs.remove(job)
-                jobs += self.process_job_folder(job, self.baseurl)
+        """
+        Return a new list in which every folder in jobs is replaced by the
+        jobs it contains (after all non-folder jobs).
 
-        return jobs
+        Folders whose contents were returned by a nested jobs_tree() are
+        resolved without requests; the others are fetched concurrently, one
+        level at a time.
+        """
+        return self._resolve_folders(jobs, self.baseurl)
 
     def process_job_folder(self, folder, folder_path):
-        logger.debug("Processing folder %s in %s", folder["name"], folder_path)
-        folder_path += "/job/%s" % quote(folder["name"])
-        data = self.get_data(
-            self.python_api_url(folder_path), tree="jobs[name,color]"
-        )
+        """
+        Return the jobs in folder and its subfolders; folder_path is the
+        url of the item containing the folder.
+        """
+        return self._resolve_folders([folder], folder_path)
+
+    def _resolve_folders(self, jobs, path, tree=None):
+        contents = {}
+        level, unresolved = self._scan_folders([(path, jobs)], contents)
+        while level or unresolved:
+            for folder_path, folder_jobs in self._fetch_folders(
+                unresolved, tree
+            ):
+                contents[folder_path] = folder_jobs
+                level.append((folder_path, folder_jobs))
+            level, unresolved = self._scan_folders(level, contents)
+        return self._flatten_folders(jobs, path, contents)
+
+    @staticmethod
+    def _scan_folders(level, contents):
+        """
+        Record in contents the jobs of the folders in level (a list of
+        ``(path, jobs)``) that were returned inline. Return the next level
+        and the paths of the folders that still have to be fetched.
+        """
+        next_level = []
+        unresolved = []
+        for path, entries in level:
+            for entry in entries:
+                if "color" in entry:
+                    continue
+                folder_path = "%s/job/%s" % (path, quote(entry["name"]))
+                if "jobs" in entry:
+                    contents[folder_path] = entry["jobs"]
+                    next_level.append((folder_path, entry["jobs"]))
+                else:
+                    unresolved.append(folder_path)
+        return next_level, unresolved
 
-        result = []
-        for job in data.get("jobs", []):
-            if "color" not in job.keys():
-                result += self.process_job_folder(job, folder_path)
+    @staticmethod
+    def _flatten_folders(jobs, path, contents):
+        """
+        Replace the folders in jobs by their contents, in a single pass.
+        """
+        resolved = [job for job in jobs if "color" in job]
+        stack = [
+            (path, folder)
+            for folder in reversed(jobs)
+            if "color" not in folder
+        ]
+        while stack:
+            path, entry = stack.pop()
+            item_path = "%s/job/%s" % (path, quote(entry["name"]))
+            if "color" in entry:
+                job = dict(entry, url=item_path)
+                job.pop("jobs", None)
+                resolved.append(job)
             else:
-                job["url"] = "%s/job/%s" % (folder_path, quote(job["name"]))
-                result.append(job)
+                stack.extend(
+                    (item_path, child)
+                    for child in reversed(contents.get(item_path, []))
+                )
+        return resolved
 
-        return result
+    def _fetch_folders(self, folder_paths, tree=None):
+        """
+        Yield ``(folder_path, jobs)`` for every folder path, fetching
+        several folders concurrently.
+        """
+        tree = tree or self.jobs_tree()
+        if len(folder_paths) == 1:
+            (folder_path,) = folder_paths
+            logger.debug("Processing folder %s", folder_path)
+            data = self.get_data(self.python_api_url(folder_path), tree=tree)
+            yield folder_path, data.get("jobs", [])
+            return
+        urls = [self.python_api_url(path) for path in folder_paths]
+        logger.debug("Processing %d folders", len(urls))
+        for folder_path, result in zip(
+            folder_paths, self.get_data_many(urls, tree=tree)
+        ):
+            if result.error is not None:
+                raise result.error
+            yield folder_path, result.data.get("jobs", [])
 
     @classmethod
     def python_api_url(cls, url: str) -> str:
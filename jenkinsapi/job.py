@@ -9,7 +9,10 @@ import logging
 import xml.etree.ElementTree as ET
 import urllib.parse as urlparse
 
-from collections import defaultdict
+from dataclasses import dataclass
+from collections import OrderedDict, defaultdict
+from requests import HTTPError
+from jenkinsapi import config
 from jenkinsapi.build import Build
 from jenkinsapi.credentials import Credentials2x
 from jenkinsapi.custom_exceptions import (
@@ -21,9 +24,11 @@ from jenkinsapi.custom_exceptions import (
     UnknownQueueItem,
     BadParams,
 )
-from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.jenkinsbase import JenkinsBase, PartialData, ProjectedData
 from jenkinsapi.mutable_jenkins_thing import MutableJenkinsThing
 from jenkinsapi.queue import QueueItem
+from jenkinsapi.utils.compact_index import BuildList
+from jenkinsapi.utils.history_index import BuildHistoryIndex
 
 
 SVN_URL = "./scm/locations/hudson.scm.SubversionSCM_-ModuleLocation/remote"
@@ -33,19 +38,76 @@ GIT_BRANCH = "./scm/branches/hudson.plugins.git.BranchSpec/name"
 HG_BRANCH = "./scm/branch"
 DEFAULT_HG_BRANCH_NAME = "default"
 
+# Everything Job.status_snapshot() needs, fetched in one request
+STATUS_TREE = (
+    "inQueue,queueItem[id],"
+    "lastBuild[number,building,result,timestamp,estimatedDuration],color"
+)
+
 log = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class JobStatus:
+    """
+    The queue and last build status of a job at one point in time, as
+    returned by Job.status_snapshot().
+
+    timestamp and estimated_duration are in milliseconds, as reported by
+    Jenkins; the last build fields are None if the job has no builds.
+    """
+
+    in_queue: bool = False
+    queue_id: int | None = None
+    last_build_number: int | None = None
+    building: bool = False
+    result: str | None = None
+    timestamp: int | None = None
+    estimated_duration: int | None = None
+    color: str | None = None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "JobStatus":
+        queue_item = data.get("queueItem") or {}
+        last_build = data.get("lastBuild") or {}
+        return cls(
+            in_queue=bool(data.get("inQueue", False)),
+            queue_id=queue_item.get("id"),
+            last_build_number=last_build.get("number"),
+            building=bool(last_build.get("building", False)),
+            result=last_build.get("result"),
+            timestamp=last_build.get("timestamp"),
+            estimated_duration=last_build.get("estimatedDuration"),
+            color=data.get("color"),
+        )
+
+    @property
+    def is_queued_or_running(self) -> bool:
+        return self.in_queue or self.building
+
+
 class Job(JenkinsBase, MutableJenkinsThing):
     """
     Represents a jenkins job
     A job can hold N builds which are the actual execution environments
     """
 
-    def __init__(self, url: str, name: str, jenkins_obj: "Jenkins") -> None:
+    def __init__(
+        self,
+        url: str,
+        name: str,
+        jenkins_obj: "Jenkins",
+        poll: bool = True,
+        lazy: bool | None = None,
+    ) -> None:
         self.name: str = name
         self.jenkins: "Jenkins" = jenkins_obj
-        self._revmap = None
+        self._history_index = None
+        # numbers of builds known to exist, most recently used last
+        self._known_builds = OrderedDict()
+        # projection profile of the builds of this job, see
+        # Build.profile_tree(); None for config.BUILD_PROFILE
+        self.build_profile = None
         self._config = None
         self._element_tree = None
         self._scm_prefix = ""
@@ -72,13 +134,13 @@ class Job(JenkinsBase, MutableJenkinsThing):
             None: lambda element_tree: [],
         }
         self.url: str = url
-        JenkinsBase.__init__(self, self.url)
+        JenkinsBase.__init__(self, self.url, poll=poll, lazy=lazy)
 
     def __str__(self) -> str:
         return self.name
 
     def get_description(self) -> str:
-        return self._data["description"]
+        return self._fields("description")["description"]
 
     def get_jenkins_obj(self) -> "Jenkins":
         return self.jenkins
@@ -108,6 +170,10 @@ class Job(JenkinsBase, MutableJenkinsThing):
         data = super(Job, self).poll(tree=tree)
         if not tree and not self.jenkins.lazy:
             self._data = self._add_missing_builds(self._data)
+        if not tree and config.COMPACT_LISTINGS:
+            builds = self._data.get("builds")
+            if isinstance(builds, list):
+                self._data["builds"] = BuildList(builds)
 
         return data
 
@@ -121,8 +187,19 @@ class Job(JenkinsBase, MutableJenkinsThing):
         all builds information. This method checks if all builds are loaded
         in the data object and updates it with the missing builds if needed.
         """
-        if not data.get("builds"):
+        if self._all_builds_loaded(data):
             return data
+        response = self.poll(tree="allBuilds[number,url]")
+        data["builds"] = response["allBuilds"]
+        return data
+
+    def _all_builds_loaded(self, data):
+        """
+        Return True if the "builds" list of data reaches back to the first
+        build of the job, i.e. no "allBuilds" query is required.
+        """
+        if not data.get("builds"):
+            return True
         # do not call _buildid_for_type here: it would poll and do an infinite
         # loop
         oldest_loaded_build_number = data["builds"][-1]["number"]
@@ -130,12 +207,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
             first_build_number = oldest_loaded_build_number
         else:
             first_build_number = self._data["firstBuild"]["number"]
-        all_builds_loaded = oldest_loaded_build_number == first_build_number
-        if all_builds_loaded:
-            return data
-        response = self.poll(tree="allBuilds[number,url]")
-        data["builds"] = response["allBuilds"]
-        return data
+        return oldest_loaded_build_number == first_build_number
 
     def _get_config_element_tree(self):
         """
@@ -234,6 +306,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
             valid=[200, 201, 303],
             allow_redirects=False,
         )
+        self._listing_changed()
 
         redirect_url = response.headers["location"]
 
@@ -283,7 +356,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
             "Unknown build info type: %s" % buildtype
         )
 
-        data = self.poll(tree="%s[number]" % buildtype)
+        data = self._listed_fields("%s[number]" % buildtype, buildtype)
 
         if not data.get(buildtype):
             raise NoBuildData(buildtype)
@@ -332,31 +405,252 @@ class Job(JenkinsBase, MutableJenkinsThing):
         builds = self._add_missing_builds(builds)
         builds = builds["builds"]
         last_build = self.poll(tree="lastBuild[number,url]")["lastBuild"]
+        return self._make_build_dict(builds, last_build)
+
+    @staticmethod
+    def _make_build_dict(builds, last_build):
+        """
+        Map build numbers to build urls, making sure the last build (which
+        may be missing from a freshly polled "builds" list) is included.
+        """
+        build_dict = {}
         if (
             builds
             and last_build
             and builds[0]["number"] != last_build["number"]
         ):
-            builds = [last_build] + builds
+            build_dict[last_build["number"]] = last_build["url"]
         # FIXME SO how is this supposed to work if build is false-y?
         # I don't think that builds *can* be false here, so I don't
         # understand the test above.
-        return dict((build["number"], build["url"]) for build in builds)
+        build_dict.update((build["number"], build["url"]) for build in builds)
+        return build_dict
+
+    def get_builds(
+        self,
+        buildnumbers=None,
+        depth=1,
+        order=-1,
+        max_workers=None,
+        profile=None,
+    ):
+        """
+        Iterate over Build objects whose data is fetched concurrently.
+
+        :param buildnumbers: build numbers to fetch, defaults to all builds
+        :param depth: depth of the build data, see Build
+        :param order: 1 for oldest first, -1 for newest first
+        :param max_workers: maximum number of requests in flight
+        :param profile: projection profile of the build data, see
+            Build.profile_tree(); default the build_profile of the job
+        :return: generator of Build, in the requested order. Stopping the
+            iteration early cancels the requests not yet started.
+        """
+        build_dict = self.get_build_dict()
+        if buildnumbers is None:
+            buildnumbers = sorted(build_dict)[::order]
+        missing = [num for num in buildnumbers if num not in build_dict]
+        if missing:
+            raise NotFound("Build #%s not found" % missing[0])
+        yield from self._fetch_builds(
+            [(num, build_dict[num]) for num in buildnumbers],
+            depth,
+            profile,
+            max_workers,
+        )
+
+    def _get_builds_by_number(
+        self, buildnumbers, depth=1, max_workers=None, profile=None
+    ):
+        """
+        Iterate over the Build objects of build numbers, fetched
+        concurrently from their urls, ``<job url>/<number>/``, without
+        listing the builds of the job: one request per build.
+        """
+        return self._fetch_builds(
+            [(num, self._build_url(num)) for num in buildnumbers],
+            depth,
+            profile,
+            max_workers,
+        )
 
-    def get_build_by_params(self, build_params, order=1):
-        first_build_number = self.get_first_buildnumber()
-        last_build_number = self.get_last_buildnumber()
+    def _fetch_builds(self, build_urls, depth, profile, max_workers):
+        urls = [self.python_api_url(url) for _, url in build_urls]
+        tree = Build.resolve_profile(profile, self)
+        results = self.get_data_many(
+            urls, params={"depth": depth}, tree=tree, max_workers=max_workers
+        )
+        for (buildnumber, url), result in zip(build_urls, results):
+            error = result.error
+            if error is not None:
+                response = getattr(error, "response", None)
+                if response is not None and response.status_code == 404:
+                    raise NotFound("Build #%s not found" % buildnumber)
+                raise error
+            build = Build(
+                url,
+                buildnumber,
+                job=self,
+                depth=depth,
+                poll=False,
+                profile=profile,
+            )
+            if tree is None:
+                build._data = result.data
+            else:
+                build._data = ProjectedData(result.data, build)
+            yield build
+
+    def iter_builds(self, fields=None, newest_first=True, page_size=None):
+        """
+        Iterate over the builds of the job, fetched a page at a time with
+        ranged ``allBuilds[...]{M,N}`` queries. A page is only requested
+        when the previous one has been consumed, so stopping the iteration
+        stops the requests, and the whole history is never held at once.
+
+        The Build objects hold the fields of their page: reading any other
+        field of a build fetches its full data. Builds started during the
+        iteration may or may not be included, but do not cause any build
+        to be skipped or repeated.
+
+        :param fields: build fields to fetch besides number and url, as
+            ``tree`` expressions; default config.ITER_BUILDS_FIELDS
+        :param newest_first: False to start from the oldest build, which
+            takes a few requests of one build number each to locate
+        :param page_size: builds per request, default
+            config.BUILDS_PAGE_SIZE
+        :return: iterator of Build obj
+        """
+        for row in self._iter_build_rows(fields, newest_first, page_size):
+            build = Build(row["url"], row["number"], job=self, poll=False)
+            build._data = PartialData(row, build)
+            yield build
+
+    def _iter_build_rows(self, fields=None, newest_first=True, page_size=None):
+        """
+        Iterate over the rows of allBuilds, a page at a time; see
+        iter_builds. Positions in allBuilds count from the newest build:
+        builds started meanwhile shift them, deleting the oldest builds
+        does not.
+        """
+        if fields is None:
+            fields = config.ITER_BUILDS_FIELDS
+        page_size = page_size or config.BUILDS_PAGE_SIZE
+        selected = ",".join(("number", "url") + tuple(fields))
+        last = None
+        if newest_first:
+            start = 0
+            while True:
+                page = self._get_builds_page(selected, start, page_size)
+                for row in page:
+                    # rows shifted into this page by new builds were
+                    # already yielded
+                    if last is None or row["number"] < last:
+                        last = row["number"]
+                        yield row
+                if len(page) < page_size:
+                    return
+                start += page_size
+
+        end = self._count_all_builds(page_size)
+        while end > 0:
+            start = max(end - page_size, 0)
+            if last is None:
+                page = self._get_builds_page(selected, start, end - start)
+            else:
+                # the page overlaps the last build yielded, which moves
+                # to a later position when builds are started
+                size = end + 1 - start
+                page = self._get_builds_page(selected, start, size)
+                if len(page) == size and page[-1]["number"] > last:
+                    end = self._find_build_position(last, end, page_size)
+                    continue
+            for row in reversed(page):
+                if last is None or row["number"] > last:
+                    last = row["number"]
+                    yield row
+            end = start
+
+    def _get_builds_page(self, selected, start, size):
+        tree = "allBuilds[%s]{%d,%d}" % (selected, start, start + size)
+        return self.poll(tree=tree).get("allBuilds") or []
+
+    def _count_all_builds(self, page_size):
+        """
+        Return the number of builds in allBuilds. The span of the first
+        and last build numbers is exact unless builds were deleted in
+        between; otherwise the count is found by bisection.
+        """
+        data = self.poll(tree="firstBuild[number],lastBuild[number]")
+        if not data.get("lastBuild"):
+            return 0
+        first = (data.get("firstBuild") or {"number": 1})["number"]
+        upper = data["lastBuild"]["number"] - first + 1
+        if self._get_builds_page("number", upper - 1, 1):
+            return upper
+        lower = 0
+        upper -= 1
+        while lower < upper:
+            middle = (lower + upper + 1) // 2
+            if self._get_builds_page("number", middle - 1, 1):
+                lower = middle
+            else:
+                upper = middle - 1
+        return lower
+
+    def _find_build_position(self, number, start, page_size):
+        """
+        Return the position of the first build from start on that is not
+        newer than number, or the number of builds if there is none.
+        """
+        while True:
+            page = self._get_builds_page("number", start, page_size)
+            for offset, row in enumerate(page):
+                if row["number"] <= number:
+                    return start + offset
+            if len(page) < page_size:
+                return start + len(page)
+            start += page_size
+
+    def get_history_index(self, update=True):
+        """
+        Return the BuildHistoryIndex of the job, which maps parameter sets
+        and git revisions to build numbers. It is created, from paged
+        allBuilds queries, on first use and then updated incrementally.
+
+        :param update: False to use the index as it is, without checking
+            for new builds (unless it does not exist yet)
+        :return: BuildHistoryIndex
+        """
+        if self._history_index is None:
+            self._history_index = BuildHistoryIndex(self)
+            update = True
+        if update:
+            self._history_index.update()
+        return self._history_index
+
+    def get_build_by_params(self, build_params, order=1, max_workers=None):
+        """
+        Return the first build, in the given order, whose parameters are
+        build_params, looked up in the history index of the job (see
+        get_history_index). max_workers is accepted for compatibility.
+
+        :param build_params: dict of parameter names and values
+        :param order: 1 for oldest first, -1 for newest first
+        :return: Build obj
+        """
         if order != 1 and order != -1:
             raise ValueError(
                 "Direction should be ascending or descending (1/-1)"
             )
 
-        for number in range(first_build_number, last_build_number + 1)[
-            ::order
-        ]:
-            build = self.get_build(number)
-            if build.get_params() == build_params:
-                return build
+        index = self.get_history_index()
+        for buildnumber in index.builds_with_params(build_params)[::order]:
+            try:
+                return self.get_build(buildnumber)
+            except NotFound:
+                # deleted since it was indexed
+                index.discard(buildnumber)
 
         raise NoBuildData(
             "No build with such params {params}".format(params=build_params)
@@ -370,23 +664,22 @@ class Job(JenkinsBase, MutableJenkinsThing):
         revs = defaultdict(list)
         if "builds" not in self._data:
             raise NoBuildData(repr(self))
-        for buildnumber in self.get_build_ids():
-            rev = self.get_build(buildnumber).get_revision()
-            if rev is not None:
-                revs[rev].append(buildnumber)
+        for rev, buildnumbers in self.get_history_index().revisions().items():
+            revs[rev] = buildnumbers[::-1]
         return revs
 
     def get_build_ids(self):
         """
-        Return a sorted list of all good builds as ints.
+        Iterate over the numbers of all builds, newest first, fetched a
+        page at a time.
         """
-        return reversed(sorted(self.get_build_dict().keys()))
+        return (row["number"] for row in self._iter_build_rows(fields=()))
 
     def get_next_build_number(self):
         """
         Return the next build number that Jenkins will assign.
         """
-        return self._data.get("nextBuildNumber", 0)
+        return self._fields("nextBuildNumber").get("nextBuildNumber", 0)
 
     def get_last_stable_build(self):
         """
@@ -441,20 +734,62 @@ class Job(JenkinsBase, MutableJenkinsThing):
         """
         if self.get_scm_type() == "svn" and not isinstance(revision, int):
             revision = int(revision)
-        if self._revmap is None or refresh:
-            self._revmap = self.get_revision_dict()
-        try:
-            return self._revmap[revision]
-        except KeyError:
+        index = self.get_history_index(update=refresh)
+        buildnumbers = index.builds_for_revision(revision)
+        if not buildnumbers:
             raise NotFound("Couldn't find a build with that revision")
+        return buildnumbers[::-1]
+
+    def get_build(self, buildnumber, profile=None):
+        """
+        Return the Build of a number.
 
-    def get_build(self, buildnumber):
+        :param profile: projection profile of the build data, see
+            Build.profile_tree(); default the build_profile of the job
+        """
         assert isinstance(buildnumber, int)
+        return self._get_build(buildnumber, profile=profile)
+
+    def _build_url(self, buildnumber):
+        return "%s/%d/" % (self.baseurl, buildnumber)
+
+    def _get_build(self, buildnumber, depth=1, profile=None):
+        """
+        Return the Build of a number from its url, ``<job url>/<number>/``,
+        without listing the builds of the job. A missing build is detected
+        by the 404 of its own poll; a lazily created build that is not
+        known to exist is checked with a poll of its number only, which is
+        kept as its partial data.
+        """
         try:
-            url = self.get_build_dict()[buildnumber]
-            return Build(url, buildnumber, job=self)
-        except KeyError:
+            build = Build(
+                self._build_url(buildnumber),
+                buildnumber,
+                job=self,
+                depth=depth,
+                profile=profile,
+            )
+            if not build.is_hydrated and not self._is_known_build(buildnumber):
+                build._data = build._partial_data(build.poll(tree="number"))
+        except HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+            self._known_builds.pop(buildnumber, None)
             raise NotFound("Build #%s not found" % buildnumber)
+        self._remember_build(buildnumber)
+        return build
+
+    def _is_known_build(self, buildnumber):
+        if buildnumber not in self._known_builds:
+            return False
+        self._known_builds.move_to_end(buildnumber)
+        return True
+
+    def _remember_build(self, buildnumber):
+        self._known_builds[buildnumber] = True
+        self._known_builds.move_to_end(buildnumber)
+        while len(self._known_builds) > config.KNOWN_BUILDS_CACHE_SIZE:
+            self._known_builds.popitem(last=False)
 
     def delete_build(self, build_number):
         """
@@ -463,13 +798,15 @@ class Job(JenkinsBase, MutableJenkinsThing):
         :param int build_number:    Build number
         :raises NotFound:           When build is not found
         """
-        try:
-            url = self.get_build_dict()[build_number]
-            url = "%s/doDelete" % url
-            self.jenkins.requester.post_and_confirm_status(url, data="")
-            self.jenkins.poll()
-        except KeyError:
+        requester = self.jenkins.requester
+        url = "%sdoDelete" % self._build_url(build_number)
+        response = requester.post_and_confirm_status(
+            url, data="", valid=list(requester.VALID_STATUS_CODES) + [404]
+        )
+        self._known_builds.pop(build_number, None)
+        if response.status_code == 404:
             raise NotFound("Build #%s not found" % build_number)
+        self.jenkins.poll()
 
     def get_build_metadata(self, buildnumber):
         """
@@ -480,11 +817,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
         if not isinstance(buildnumber, int):
             raise ValueError('Parameter "buildNumber" must be int')
 
-        try:
-            url = self.get_build_dict()[buildnumber]
-            return Build(url, buildnumber, job=self, depth=0)
-        except KeyError:
-            raise NotFound("Build #%s not found" % buildnumber)
+        return self._get_build(buildnumber, depth=0)
 
     def __delitem__(self, build_number):
         self.delete_build(build_number)
@@ -495,12 +828,18 @@ class Job(JenkinsBase, MutableJenkinsThing):
     def __len__(self):
         return len(self.get_build_dict())
 
+    def status_snapshot(self) -> JobStatus:
+        """
+        Return the queue and last build status of the job, read in a
+        single request
+        """
+        return JobStatus.from_data(self.poll(tree=STATUS_TREE))
+
     def is_queued_or_running(self):
-        return self.is_queued() or self.is_running()
+        return self.status_snapshot().is_queued_or_running
 
     def is_queued(self):
-        data = self.poll(tree="inQueue")
-        return data.get("inQueue", False)
+        return self.status_snapshot().in_queue
 
     def get_queue_item(self):
         """
@@ -516,17 +855,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
         return QueueItem(qi_url, self.jenkins)
 
     def is_running(self):
-        # self.poll()
-        try:
-            build = self.get_last_build_or_none()
-            if build is not None:
-                return build.is_running()
-        except NoBuildData:
-            log.info(
-                "No build info available for %s, assuming not running.",
-                str(self),
-            )
-        return False
+        return self.status_snapshot().building
 
     def get_config(self):
         """
@@ -688,7 +1017,9 @@ class Job(JenkinsBase, MutableJenkinsThing):
         """
         downstream_jobs = []
         try:
-            for j in self._data["downstreamProjects"]:
+            for j in self._fields("downstreamProjects[name]")[
+                "downstreamProjects"
+            ]:
                 downstream_jobs.append(self.get_jenkins_obj()[j["name"]])
         except KeyError:
             return []
@@ -701,7 +1032,9 @@ class Job(JenkinsBase, MutableJenkinsThing):
         """
         downstream_jobs = []
         try:
-            for j in self._data["downstreamProjects"]:
+            for j in self._fields("downstreamProjects[name]")[
+                "downstreamProjects"
+            ]:
                 downstream_jobs.append(j["name"])
         except KeyError:
             return []
@@ -714,7 +1047,9 @@ class Job(JenkinsBase, MutableJenkinsThing):
         """
         upstream_jobs = []
         try:
-            for j in self._data["upstreamProjects"]:
+            for j in self._fields("upstreamProjects[name]")[
+                "upstreamProjects"
+            ]:
                 upstream_jobs.append(j["name"])
         except KeyError:
             return []
@@ -727,14 +1062,16 @@ class Job(JenkinsBase, MutableJenkinsThing):
         """
         upstream_jobs = []
         try:
-            for j in self._data["upstreamProjects"]:
+            for j in self._fields("upstreamProjects[name]")[
+                "upstreamProjects"
+            ]:
                 upstream_jobs.append(self.get_jenkins_obj().get_job(j["name"]))
         except KeyError:
             return []
         return upstream_jobs
 
     def is_enabled(self):
-        data = self.poll(tree="color")
+        data = self._listed_fields("color", "color")
         return "disabled" not in data.get("color", "")
 
     def disable(self):
@@ -742,6 +1079,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
         Disable job
         """
         url = "%s/disable" % self.baseurl
+        self._listing_changed()
         return self.get_jenkins_obj().requester.post_url(url, data="")
 
     def enable(self):
@@ -749,6 +1087,7 @@ class Job(JenkinsBase, MutableJenkinsThing):
         Enable job
         """
         url = "%s/enable" % self.baseurl
+        self._listing_changed()
         return self.get_jenkins_obj().requester.post_url(url, data="")
 
     def delete_from_queue(self):
@@ -756,9 +1095,10 @@ class Job(JenkinsBase, MutableJenkinsThing):
         Delete a job from the queue only if it's enqueued
         :raise NotInQueue if the job is not in the queue
         """
-        if not self.is_queued():
+        status = self.status_snapshot()
+        if not status.in_queue or status.queue_id is None:
             raise NotInQueue()
-        queue_id = self._data["queueItem"]["id"]
+        queue_id = status.queue_id
         url = urlparse.urljoin(
             self.get_jenkins_obj().get_queue().baseurl,
             "queue/cancelItem?id=%s" % queue_id,
@@ -802,13 +1142,13 @@ class Job(JenkinsBase, MutableJenkinsThing):
         """
         If job has parameters, returns True, else False
         """
-        if any(
-            "parameterDefinitions" in a for a in (self._data["actions"]) if a
-        ):
+        data = self._fields(
+            "actions[parameterDefinitions[name]],"
+            "property[parameterDefinitions[name]]"
+        )
+        if any("parameterDefinitions" in a for a in (data["actions"]) if a):
             return True
-        if any(
-            "parameterDefinitions" in a for a in (self._data["property"]) if a
-        ):
+        if any("parameterDefinitions" in a for a in (data["property"]) if a):
             return True
         return False
 
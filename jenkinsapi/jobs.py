@@ -5,17 +5,40 @@ interface for all of the jobs defined on a single Jenkins server.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Iterator
 import logging
+import sys
+import threading
 import time
+import xml.etree.ElementTree as ET
 from urllib.parse import quote, unquote
 
+from jenkinsapi import config
 from jenkinsapi.job import Job
 from jenkinsapi.custom_exceptions import JenkinsAPIException, UnknownJob
+from jenkinsapi.utils.compact_index import compact_job_rows
+from jenkinsapi.utils.job_snapshot import SNAPSHOT_KEYS, save_snapshot
 
 log = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class JobEvent:
+    """
+    A change of the job list, as found by Jobs.refresh().
+
+    kind is "added", "removed" or "changed" (the color of the job changed,
+    from previous_color to color).
+    """
+
+    kind: str
+    name: str
+    url: str
+    color: str | None = None
+    previous_color: str | None = None
+
+
 class Jobs(object):
     """
     This class provides a container-like API which gives
@@ -27,20 +50,177 @@ class Jobs(object):
     def __init__(self, jenkins: "Jenkins") -> None:
         self.jenkins = jenkins
         self._data = []
+        self._index = {}
+        self._shadowed = {}
+        self._indexed_data = None
+        self._prefetch_thread = None
+
+    def _load(self) -> list:
+        if not self._data:
+            self._wait_prefetch()
+        if not self._data:
+            self._data = self.poll().get("jobs", [])
+            self._save_snapshot()
+        return self._data
+
+    def prefetch(self, rows=None) -> None:
+        """
+        Fetch the job list in a background thread; lookups that need it
+        wait until it is loaded.
+
+        :param rows: job rows (e.g. of a snapshot) used meanwhile; a name
+            missing from them waits for the job list
+        """
+        if self._prefetch_thread is not None:
+            return
+        if rows:
+            self._data = (
+                compact_job_rows(rows) if config.COMPACT_LISTINGS else rows
+            )
+        self._prefetch_thread = threading.Thread(
+            target=self._run_prefetch, name="jenkinsapi-prefetch", daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def _run_prefetch(self) -> None:
+        try:
+            data = self.jenkins.poll()
+        except Exception:  # pylint: disable=broad-except
+            log.warning("Prefetching the job list failed", exc_info=True)
+            # lookups fetch the job list themselves, and report the error
+            self._data = []
+            return
+        self._data = list(data.get("jobs", []))
+        self._save_snapshot()
+
+    def _wait_prefetch(self) -> None:
+        thread = self._prefetch_thread
+        if thread is not None:
+            thread.join()
+            self._prefetch_thread = None
+
+    def _save_snapshot(self) -> None:
+        path = getattr(self.jenkins, "snapshot_path", None)
+        if not path:
+            return
+        try:
+            save_snapshot(
+                path,
+                self.jenkins.baseurl,
+                [
+                    {key: row[key] for key in SNAPSHOT_KEYS if key in row}
+                    for row in self._data
+                ],
+            )
+        except (OSError, TypeError, ValueError):
+            log.warning("Cannot save the job snapshot %s", path, exc_info=True)
+
+    def _get_index(self) -> dict:
+        """
+        Return a dict mapping the normalized short and full name of every
+        job to its row (the first one, for duplicate short names). It is
+        rebuilt when _data is replaced and updated by mutations.
+
+        The other rows sharing a key are kept, in order, in _shadowed so
+        that removing the indexed row promotes the next one.
+        """
+        if self._indexed_data is not self._data:
+            self._index = {}
+            self._shadowed = {}
+            self._indexed_data = self._data
+            for row in self._data:
+                self._index_row(row)
+        return self._index
+
+    def _row_keys(self, row: dict) -> set[str]:
+        return {
+            self._normalize_job_name(row.get("name", "")),
+            self._get_full_name_from_row(row),
+        }
+
+    def _index_row(self, row: dict) -> None:
+        for key in self._row_keys(row):
+            key = sys.intern(key)
+            if self._index.setdefault(key, row) is not row:
+                self._shadowed.setdefault(key, []).append(row)
+
+    def _unindex_row(self, row: dict) -> None:
+        for key in self._row_keys(row):
+            shadowed = self._shadowed.get(key)
+            if self._index.get(key) is row:
+                if shadowed:
+                    # another job shares the short name
+                    self._index[key] = shadowed.pop(0)
+                else:
+                    del self._index[key]
+            elif shadowed:
+                shadowed[:] = [other for other in shadowed if other is not row]
+            if shadowed is not None and not shadowed:
+                del self._shadowed[key]
+
+    def _find_row(self, normalized_name: str) -> dict | None:
+        self._load()
+        row = self._get_index().get(normalized_name)
+        if row is None and self._prefetch_thread is not None:
+            # the job may be newer than the snapshot being used
+            self._wait_prefetch()
+            self._load()
+            row = self._get_index().get(normalized_name)
+        return row
+
+    def _find_url(self, normalized_name: str) -> str | None:
+        """
+        Return the url of a job, or None if there is no such job.
+
+        Until the job list is loaded, the job is requested directly at the
+        url built from its name. Only a short name not found at the top
+        level (it may name a job in a folder) requires the job list.
+        """
+        if not self._data and normalized_name:
+            job_url = self._probe_job(normalized_name)
+            if job_url is not None or "/" in normalized_name:
+                return job_url
+        row = self._find_row(normalized_name)
+        if row is None:
+            return None
+        return Job.strip_trailing_slash(row["url"])
+
+    def _probe_job(self, full_name: str) -> str | None:
+        """
+        Check with one projected request that full_name is a job (and not,
+        say, a folder). Return its url, or None.
+        """
+        job_url = self._build_job_url(full_name)
+        api_url = self.jenkins.python_api_url(job_url)
+        params = {"tree": "name,color"}
+        response = self.jenkins.requester.get_url(api_url, params)
+        if response.status_code == 404:
+            return None
+        data = self.jenkins._parse_data_response(api_url, response, params)
+        return job_url if "color" in data else None
+
+    def _add_row(self, row: dict) -> None:
+        """Add the row of a job created by this client"""
+        self._wait_prefetch()
+        if self._data:
+            self._get_index()
+            self._data.append(row)
+            self._index_row(row)
 
     def _del_data(self, job_name: str) -> None:
+        self._wait_prefetch()
         if not self._data:
             return
-        for num, job_data in enumerate(self._data):
-            if job_data["name"] == job_name:
-                del self._data[num]
-                return
+        row = self._get_index().get(job_name)
+        if row is not None:
+            self._unindex_row(row)
+            self._data.remove(row)
 
     def __len__(self) -> int:
         return len(self.keys())
 
-    def poll(self, tree="jobs[name,color,url]"):
-        return self.jenkins.poll(tree=tree)
+    def poll(self, tree=None):
+        return self.jenkins.poll(tree=tree or self.jenkins.jobs_tree())
 
     def __delitem__(self, job_name: str) -> None:
         """
@@ -83,22 +263,10 @@ class Jobs(object):
 
     def __getitem__(self, job_name: str) -> "Job":
         normalized_name = self._normalize_job_name(job_name)
-        if normalized_name in self:
-            job_data = next(
-                job_row
-                for job_row in self._data
-                if self._job_row_matches_name(job_row, normalized_name)
-            )
-            name = self._normalize_job_name(job_data["name"])
-            if name != normalized_name:
-                name = normalized_name
-            return Job(
-                Job.strip_trailing_slash(job_data["url"]),
-                name,
-                self.jenkins,
-            )
-        else:
+        job_url = self._find_url(normalized_name)
+        if job_url is None:
             raise UnknownJob(normalized_name)
+        return Job(job_url, normalized_name, self.jenkins)
 
     def iteritems(self) -> Iterator[str, "Job"]:
         """
@@ -115,19 +283,15 @@ class Jobs(object):
         True if job_name exists in Jenkins
         """
         normalized_name = self._normalize_job_name(job_name)
-        if not self._data:
-            self._data = self.poll().get("jobs", [])
-        return any(
-            self._job_row_matches_name(job_row, normalized_name)
-            for job_row in self._data
-        )
+        return self._find_url(normalized_name) is not None
 
     def iterkeys(self) -> Iterator[str]:
         """
         Iterate over the names of all available jobs
         """
+        self._wait_prefetch()
         if not self._data:
-            self._data = self.poll().get("jobs", [])
+            self._load()
         for row in self._data:
             row_name = self._normalize_job_name(row["name"])
             full_name = self._get_full_name_from_row(row)
@@ -142,8 +306,9 @@ class Jobs(object):
         """
         Iterate over all available jobs
         """
+        self._wait_prefetch()
         if not self._data:
-            self._data = self.poll().get("jobs", [])
+            self._load()
         for row in self._data:
             yield Job(
                 Job.strip_trailing_slash(row["url"]),
@@ -157,6 +322,71 @@ class Jobs(object):
         """
         return list(self.iterkeys())
 
+    def refresh(self) -> Iterator[JobEvent]:
+        """
+        Fetch the job list again and replace it. Rows of jobs still listed
+        are kept and updated; the name index is rebuilt once.
+
+        :return: iterator of the JobEvent found since the previous listing
+            (all jobs are "added" if none was loaded)
+        """
+        self._wait_prefetch()
+        if not self._data:
+            return (
+                JobEvent(
+                    "added",
+                    self._get_full_name_from_row(row),
+                    row["url"],
+                    row.get("color"),
+                )
+                for row in list(self._load())
+            )
+
+        # the name index also holds short names: a top level job and a job
+        # in a folder may share one, so rows are matched by full name only
+        by_full_name = {
+            self._get_full_name_from_row(row): row for row in self._data
+        }
+        events = []
+        listed = []
+        kept = set()
+        for row in self.poll().get("jobs", []):
+            full_name = self._get_full_name_from_row(row)
+            old = by_full_name.get(full_name)
+            if old is None:
+                events.append(
+                    JobEvent("added", full_name, row["url"], row.get("color"))
+                )
+                listed.append(row)
+                continue
+            if old.get("color") != row.get("color"):
+                events.append(
+                    JobEvent(
+                        "changed",
+                        full_name,
+                        row["url"],
+                        row.get("color"),
+                        old.get("color"),
+                    )
+                )
+            old.update(row)
+            kept.add(id(old))
+            listed.append(old)
+
+        removed = [row for row in self._data if id(row) not in kept]
+        self._data = listed
+        self._get_index()
+        for row in removed:
+            events.append(
+                JobEvent(
+                    "removed",
+                    self._get_full_name_from_row(row),
+                    row["url"],
+                    row.get("color"),
+                )
+            )
+        return iter(events)
+
     def create(self, job_name: str, config: str | bytes) -> "Job":
         """
         Create a job
@@ -180,8 +410,11 @@ class Jobs(object):
         self.jenkins.requester.post_xml_and_confirm_status(
             create_url, data=config, params=params
         )
-        # Reset to get it refreshed from Jenkins
-        self._data = []
+        if self._is_folder_config(config):
+            # Reset to get its jobs from Jenkins
+            self._data = []
+        else:
+            self._add_row(self._new_row(full_name))
 
         return Job(self._build_job_url(full_name), full_name, self.jenkins)
 
@@ -263,10 +496,33 @@ class Jobs(object):
             self._get_create_url(folder_parts), params=params, data=""
         )
 
-        self._data = []
+        if self._data and self._find_row(full_source_name) is not None:
+            self._add_row(self._new_row(full_target_name))
+        else:
+            # A folder was copied, or nothing is loaded yet
+            self._data = []
 
         return self[full_target_name]
 
+    def _new_row(self, full_name: str) -> dict:
+        return {
+            "name": full_name.rpartition("/")[2],
+            "url": self._build_job_url(full_name),
+            "color": "notbuilt",
+        }
+
+    @staticmethod
+    def _is_folder_config(config: str) -> bool:
+        """
+        True if config creates an item containing jobs (a folder or a
+        multibranch project) or cannot be parsed.
+        """
+        try:
+            tag = ET.fromstring(config).tag.lower()
+        except ET.ParseError:
+            return True
+        return any(kind in tag for kind in ("folder", "multibranch"))
+
     @staticmethod
     def _normalize_job_name(job_name: str) -> str:
         name = (job_name or "").strip().strip("/")
@@ -290,6 +546,14 @@ class Jobs(object):
         path = url.replace(self.jenkins.baseurl, "").strip("/")
         if path:
             tokens = path.split("/")
+            if len(tokens) % 2 == 0 and tokens[0::2] == ["job"] * (
+                len(tokens) // 2
+            ):
+                # the usual job/a/job/b form
+                return "/".join(
+                    unquote(part) if "%" in part else part
+                    for part in tokens[1::2]
+                )
             parts = []
             idx = 0
             while idx < len(tokens):
@@ -331,14 +595,27 @@ class Jobs(object):
         :returns Job: new Job object
         """
         params = {"newName": new_job_name}
-        rename_job_url = self[job_name].get_rename_url()
+        job = self[job_name]
         self.jenkins.requester.post_and_confirm_status(
-            rename_job_url, params=params, data=""
+            job.get_rename_url(), params=params, data=""
         )
 
-        self._data = []
+        full_name = self._get_full_name_from_row({"url": job.baseurl})
+        parent = full_name.rpartition("/")[0]
+        new_full_name = self._normalize_job_name(
+            "%s/%s" % (parent, new_job_name) if parent else new_job_name
+        )
+        self._wait_prefetch()
+        row = self._get_index().get(job.name) if self._data else None
+        if row is not None:
+            self._unindex_row(row)
+            row["name"] = new_full_name.rpartition("/")[2]
+            row["url"] = self._build_job_url(new_full_name)
+            self._index_row(row)
+        else:
+            self._data = []
 
-        return self[new_job_name]
+        return self[new_full_name]
 
     def build(self, job_name: str, params=None, **kwargs) -> "QueueItem":
         """
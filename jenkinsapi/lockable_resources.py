@@ -129,7 +129,7 @@ class LockableResources(JenkinsBase, Mapping[str, LockableResource]):
         poll_after_post: bool = True,
     ):
         self.jenkins = jenkins_obj
-        baseurl = jenkins_obj.baseurl + "/lockable-resources/api/python"
+        baseurl = jenkins_obj.baseurl + "/lockable-resources/api/json"
         JenkinsBase.__init__(self, baseurl, poll=poll)
         self.poll_after_post = poll_after_post
 
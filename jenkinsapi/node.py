@@ -31,6 +31,7 @@ class Node(JenkinsBase):
         nodename: str,
         node_dict,
         poll: bool = True,
+        lazy: bool | None = None,
     ) -> None:
         """
         Init a node object by providing all relevant pointers to it
@@ -44,6 +45,8 @@ class Node(JenkinsBase):
             refresh from Jenkins is not required. Default is True.
             If baseurl parameter is set to None - poll parameter will be
             set to False
+        :param lazy: defer polling until the node data is first used, see
+            JenkinsBase
 
         JNLP Node:
             {
@@ -103,7 +106,7 @@ class Node(JenkinsBase):
         if not baseurl:
             poll = False
             baseurl = f"{self.jenkins.baseurl}/computer/{self.name}"
-        JenkinsBase.__init__(self, baseurl, poll=poll)
+        JenkinsBase.__init__(self, baseurl, poll=poll, lazy=lazy)
         self.node_attributes: dict = node_dict
         self._element_tree = None
         self._config = None
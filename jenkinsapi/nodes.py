@@ -14,6 +14,7 @@ from jenkinsapi.jenkinsbase import JenkinsBase
 from jenkinsapi.custom_exceptions import JenkinsAPIException
 from jenkinsapi.custom_exceptions import UnknownNode
 from jenkinsapi.custom_exceptions import PostRequired
+from jenkinsapi.utils.collection_cache import collection_changed
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -23,7 +24,9 @@ class Nodes(JenkinsBase):
     Class to hold information on a collection of nodes
     """
 
-    def __init__(self, baseurl: str, jenkins_obj: "Jenkins") -> None:
+    def __init__(
+        self, baseurl: str, jenkins_obj: "Jenkins", poll: bool = True
+    ) -> None:
         """
         Handy access to all of the nodes on your Jenkins server
         """
@@ -35,6 +38,7 @@ class Nodes(JenkinsBase):
                 if "/computer" in baseurl
                 else baseurl.rstrip("/") + "/computer"
             ),
+            poll=poll,
         )
 
     def get_jenkins_obj(self) -> "Jenkins":
@@ -139,6 +143,7 @@ class Nodes(JenkinsBase):
                 # Latest Jenkins requires POST here. GET kept for compatibility
                 self.jenkins.requester.post_and_confirm_status(url, data={})
             self.poll()
+            collection_changed(self.jenkins, self, "nodes")
         else:
             if item != "Built-In Node":
                 raise UnknownNode("Node %s does not exist" % item)
@@ -178,6 +183,7 @@ class Nodes(JenkinsBase):
         data = {"json": urlencode(node.get_node_attributes())}
         self.jenkins.requester.post_and_confirm_status(url, data=data)
         self.poll()
+        collection_changed(self.jenkins, self, "nodes")
         return self[name]
 
     def create_node_with_config(self, name: str, config: dict) -> Node | None:
@@ -202,4 +208,5 @@ class Nodes(JenkinsBase):
         data = {"json": urlencode(config)}
         self.jenkins.requester.post_and_confirm_status(url, data=data)
         self.poll()
+        collection_changed(self.jenkins, self, "nodes")
         return self[name]
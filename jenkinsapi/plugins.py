@@ -17,6 +17,7 @@ from jenkinsapi.plugin import Plugin
 from jenkinsapi.jenkinsbase import JenkinsBase
 from jenkinsapi.custom_exceptions import UnknownPlugin
 from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.utils.collection_cache import collection_changed
 from jenkinsapi.utils.jsonp_to_json import jsonp_to_json
 from jenkinsapi.utils.manifest import Manifest, read_manifest
 
@@ -99,6 +100,7 @@ class Plugins(JenkinsBase):
         else:
             self._install_specific_version(plugin)
         self._wait_until_plugin_installed(plugin)
+        collection_changed(self.jenkins_obj, self, "plugins")
 
     def _install_plugin_from_updatecenter(self, plugin: "Plugin") -> None:
         """
@@ -281,6 +283,7 @@ class Plugins(JenkinsBase):
         )
 
         self.poll()
+        collection_changed(self.jenkins_obj, self, "plugins")
         if not self[shortName].deleted:
             raise JenkinsAPIException(
                 "Problem uninstalling plugin '%s'." % shortName
@@ -19,14 +19,17 @@ class Queue(JenkinsBase):
     Class that represents the Jenkins queue
     """
 
-    def __init__(self, baseurl: str, jenkins_obj: "Jenkins") -> None:
+    def __init__(
+        self, baseurl: str, jenkins_obj: "Jenkins", poll: bool = True
+    ) -> None:
         """
         Init the Jenkins queue object
         :param baseurl: basic url for the queue
         :param jenkins_obj: ref to the jenkins obj
+        :param poll: set to False to skip the initial poll
         """
         self.jenkins: "Jenkins" = jenkins_obj
-        JenkinsBase.__init__(self, baseurl)
+        JenkinsBase.__init__(self, baseurl, poll=poll)
 
     def __str__(self) -> str:
         return self.baseurl
@@ -67,7 +70,7 @@ class Queue(JenkinsBase):
         else:
             raise UnknownQueueItem(item_id)
 
-    def _get_queue_items_for_job(self, job_name: str) -> Iterator["QueueItem"]:
+    def _get_queue_items_for_job(self, job_name: str) -> Iterator[dict]:
         def normalize(name: str) -> str:
             name = (name or "").strip().strip("/")
             if not name:
@@ -84,12 +87,13 @@ class Queue(JenkinsBase):
                 "name" in item["task"]
                 and normalize(item["task"]["name"]) == normalized_name
             ):
-                yield QueueItem(
-                    self.get_queue_item_url(item), jenkins_obj=self.jenkins
-                )
+                yield item
 
     def get_queue_items_for_job(self, job_name: str):
-        return list(self._get_queue_items_for_job(job_name))
+        return [
+            QueueItem(self.get_queue_item_url(item), jenkins_obj=self.jenkins)
+            for item in self._get_queue_items_for_job(job_name)
+        ]
 
     def get_queue_item_url(self, item: str) -> str:
         return "%s/item/%i" % (self.baseurl, item["id"])
@@ -105,9 +109,15 @@ class Queue(JenkinsBase):
 class QueueItem(JenkinsBase):
     """An individual item in the queue"""
 
-    def __init__(self, baseurl: str, jenkins_obj: "Jenkins") -> None:
+    def __init__(
+        self,
+        baseurl: str,
+        jenkins_obj: "Jenkins",
+        poll: bool = True,
+        lazy: bool | None = None,
+    ) -> None:
         self.jenkins: "Jenkins" = jenkins_obj
-        JenkinsBase.__init__(self, baseurl)
+        JenkinsBase.__init__(self, baseurl, poll=poll, lazy=lazy)
 
     @property
     def queue_id(self):
@@ -0,0 +1,188 @@
+"""
+Asyncio aware Requester
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from jenkinsapi.utils.requester import Requester
+
+
+class AsyncRequester(object):
+    """
+    A class which carries out HTTP requests for asyncio code.
+
+    Every call is a coroutine which does not block the event loop: the
+    request itself is executed by a wrapped :class:`Requester` on a bounded
+    pool of worker threads which share a single ``requests.Session``. This
+    keeps authentication, crumbs, SSL settings and any custom Requester
+    subclass working exactly as they do for the synchronous client, while
+    allowing one event loop to keep up to ``max_concurrency`` requests in
+    flight.
+
+    Usage::
+
+        requester = AsyncRequester("user", "password", baseurl=url)
+        response = await requester.get_url(url)
+        requester.close()
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Accepts the same arguments as :class:`Requester`, plus:
+
+        :param requester: an existing (synchronous) Requester instance to
+            wrap; when given, all other Requester arguments are ignored
+        :param requester_class: Requester class to instantiate when no
+            requester is given, defaults to Requester
+        :param max_concurrency: maximum number of requests in flight, int
+        :param single_flight: an AsyncSingleFlight coalescing identical
+            concurrent API reads made through this requester
+        """
+        requester = kwargs.pop("requester", None)
+        self.single_flight = kwargs.pop("single_flight", None)
+        requester_class = kwargs.pop("requester_class", Requester)
+        self.max_concurrency = kwargs.pop("max_concurrency", 32)
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if requester is None:
+            requester = requester_class(*args, **kwargs)
+        self.requester = requester
+        self._size_connection_pool()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="jenkinsapi-async",
+        )
+
+    def _size_connection_pool(self):
+        """
+        Make sure the session can keep one connection per worker alive,
+        otherwise urllib3 discards (and re-opens) connections under load.
+        """
+        if hasattr(self.requester, "ensure_pool_size"):
+            self.requester.ensure_pool_size(self.max_concurrency)
+
+    @property
+    def VALID_STATUS_CODES(self):
+        return self.requester.VALID_STATUS_CODES
+
+    @property
+    def hooks(self):
+        return self.requester.hooks
+
+    def add_hook(self, hook):
+        self.requester.add_hook(hook)
+
+    def remove_hook(self, hook):
+        self.requester.remove_hook(hook)
+
+    def response_decoded(self, url, params, seconds, response=None):
+        self.requester.response_decoded(url, params, seconds, response)
+
+    @property
+    def timeout(self):
+        return self.requester.timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self.requester.timeout = value
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_url(
+        self,
+        url,
+        params=None,
+        headers=None,
+        allow_redirects=True,
+        stream=False,
+    ):
+        return await self._run(
+            self.requester.get_url,
+            url,
+            params=params,
+            headers=headers,
+            allow_redirects=allow_redirects,
+            stream=stream,
+        )
+
+    async def post_url(
+        self,
+        url,
+        params=None,
+        data=None,
+        files=None,
+        headers=None,
+        allow_redirects=True,
+        **kwargs,
+    ):
+        return await self._run(
+            self.requester.post_url,
+            url,
+            params=params,
+            data=data,
+            files=files,
+            headers=headers,
+            allow_redirects=allow_redirects,
+            **kwargs,
+        )
+
+    async def post_xml_and_confirm_status(
+        self, url, params=None, data=None, valid=None
+    ):
+        return await self._run(
+            self.requester.post_xml_and_confirm_status,
+            url,
+            params=params,
+            data=data,
+            valid=valid,
+        )
+
+    async def post_and_confirm_status(
+        self,
+        url,
+        params=None,
+        data=None,
+        files=None,
+        headers=None,
+        valid=None,
+        allow_redirects=True,
+    ):
+        return await self._run(
+            self.requester.post_and_confirm_status,
+            url,
+            params=params,
+            data=data,
+            files=files,
+            headers=headers,
+            valid=valid,
+            allow_redirects=allow_redirects,
+        )
+
+    async def get_and_confirm_status(
+        self, url, params=None, headers=None, valid=None, stream=False
+    ):
+        return await self._run(
+            self.requester.get_and_confirm_status,
+            url,
+            params=params,
+            headers=headers,
+            valid=valid,
+            stream=stream,
+        )
+
+    def close(self):
+        """
+        Shut down the worker threads and close the underlying session.
+        """
+        self._executor.shutdown(wait=False)
+        session = getattr(self.requester, "session", None)
+        if session is not None:
+            session.close()
@@ -0,0 +1,143 @@
+"""
+Time-bounded cache of the collections (nodes, views, plugins, credentials)
+of a Jenkins object
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from jenkinsapi import config
+
+
+class CollectionCache(object):
+    """
+    Keep the collection objects of a Jenkins object for a ``ttl`` per
+    collection, instead of building (and polling) a new one on every
+    attribute access.
+
+    Mutating calls of the Jenkins object invalidate the collections they
+    change; changes made by other clients show up once the ttl expired.
+    A ttl of 0 disables caching of a collection.
+
+    Usage::
+
+        jenkins = Jenkins(url, collection_ttl={"nodes": 60})
+        for name in names:
+            jenkins.nodes[name]  # the node list is fetched once
+        print(jenkins.collection_cache.stats())
+    """
+
+    def __init__(self, ttl=None):
+        """
+        :param ttl: seconds a collection is kept, either a number for all
+            collections or a dict mapping collection names to seconds,
+            merged over config.COLLECTION_TTL
+        """
+        self.ttl = dict(config.COLLECTION_TTL)
+        self.default_ttl = 0
+        if isinstance(ttl, dict):
+            self.ttl.update(ttl)
+        elif ttl is not None:
+            self.ttl = dict.fromkeys(self.ttl, ttl)
+            self.default_ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters as a dict; ``misses`` includes the
+        ``expirations`` of collections kept longer than their ttl.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def ttl_for(self, name) -> float:
+        return self.ttl.get(name, self.default_ttl)
+
+    def _is_fresh(self, name, created_at) -> bool:
+        return time.monotonic() - created_at < self.ttl_for(name)
+
+    def get(self, name, factory):
+        """
+        Return the cached collection name, or a new one made by factory.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                if self._is_fresh(name, entry[1]):
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[name]
+                self.expirations += 1
+            self.misses += 1
+        collection = factory()
+        if self.ttl_for(name):
+            with self._lock:
+                self._entries[name] = (collection, time.monotonic())
+        return collection
+
+    def is_current(self, name, collection) -> bool:
+        """
+        True if collection is the cached collection name, within its ttl.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            return (
+                entry is not None
+                and entry[0] is collection
+                and self._is_fresh(name, entry[1])
+            )
+
+    def invalidate(self, *names) -> None:
+        """
+        Drop the named collections, or all of them if no name is given.
+        """
+        with self._lock:
+            for name in names or list(self._entries):
+                if self._entries.pop(name, None) is not None:
+                    self.invalidations += 1
+
+    def changed(self, collection, *names) -> None:
+        """
+        Record that the named collections were changed through collection
+        (None if through another object). Cached collections other than
+        collection are dropped; collection re-polled itself and is kept.
+        """
+        with self._lock:
+            for name in names:
+                entry = self._entries.get(name)
+                if entry is None:
+                    continue
+                if entry[0] is collection:
+                    self._entries[name] = (collection, time.monotonic())
+                else:
+                    del self._entries[name]
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidate()
+
+
+def collection_changed(jenkins, collection, *names) -> None:
+    """
+    Tell the collection cache of jenkins, if it has one, that the named
+    collections were changed (see CollectionCache.changed).
+    """
+    cache = getattr(jenkins, "collection_cache", None)
+    if isinstance(cache, CollectionCache):
+        cache.changed(collection, *names)
@@ -0,0 +1,285 @@
+"""
+Compact representations of job and build listings.
+
+A decoded listing holds a dict per job or per build, each with its own
+copy of the server url and of every color or class name. The types of
+this module keep the same data with interned strings, urls split into a
+shared (interned) prefix and a relative path, and build numbers in an
+``array('l')``, while behaving as the dicts and lists they replace.
+
+They are used for the listings kept by Jenkins, Jobs and Job objects
+when config.COMPACT_LISTINGS is True.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import MutableMapping, MutableSequence
+
+# dict keys of a job row kept in slots, and their slot
+_JOB_SLOTS = {"_class": "_klass", "name": "_name", "color": "_color"}
+# the keys of a build row whose url follows the usual <job url>/<number>/
+_BUILD_KEYS = {"_class", "number", "url"}
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def split_url(url: str) -> tuple[str, str]:
+    """
+    Split a url into an interned prefix (the part before the first
+    ``/job/``, shared by all jobs of a server) and the rest.
+    """
+    idx = url.find("/job/")
+    if idx < 0:
+        return "", url
+    return sys.intern(url[:idx]), url[idx:]
+
+
+class JobRow(MutableMapping):
+    """
+    A row of a job listing, ``{"_class", "name", "url", "color", ...}``,
+    with interned strings and a url rebuilt from an interned prefix and a
+    relative path. It behaves as the dict it replaces; fields besides
+    these are kept in a dict.
+    """
+
+    __slots__ = ("_klass", "_name", "_color", "_prefix", "_path", "_extra")
+
+    def __init__(self, row=()):
+        self._extra = None
+        if type(row) is not dict:
+            self.update(row)
+            return
+        for key, value in row.items():
+            # the usual fields of a listing, without the checks of
+            # __setitem__
+            if type(value) is not str:
+                self[key] = value
+            elif key == "url":
+                self._prefix, self._path = split_url(value)
+            elif key == "name":
+                self._name = sys.intern(value)
+            elif key == "color":
+                self._color = sys.intern(value)
+            elif key == "_class":
+                self._klass = sys.intern(value)
+            else:
+                self[key] = value
+
+    def __getitem__(self, key):
+        if key == "url":
+            path = getattr(self, "_path", None)
+            if path is not None:
+                return self._prefix + path
+        else:
+            slot = _JOB_SLOTS.get(key)
+            if slot is not None and hasattr(self, slot):
+                return getattr(self, slot)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._discard(key)
+        if key == "url" and type(value) is str:
+            self._prefix, self._path = split_url(value)
+        elif key in _JOB_SLOTS and (value is None or type(value) is str):
+            setattr(self, _JOB_SLOTS[key], _intern(value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[_intern(key)] = value
+
+    def __delitem__(self, key):
+        if not self._discard(key):
+            raise KeyError(key)
+
+    def _discard(self, key) -> bool:
+        if key == "url" and hasattr(self, "_path"):
+            del self._prefix, self._path
+            return True
+        slot = _JOB_SLOTS.get(key)
+        if slot is not None and hasattr(self, slot):
+            delattr(self, slot)
+            return True
+        if self._extra is not None and key in self._extra:
+            del self._extra[key]
+            return True
+        return False
+
+    def __iter__(self):
+        for key, slot in _JOB_SLOTS.items():
+            if hasattr(self, slot):
+                yield key
+        if hasattr(self, "_path"):
+            yield "url"
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return "JobRow(%r)" % dict(self)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class BuildList(MutableSequence):
+    """
+    A list of build rows, ``{"_class", "number", "url"}``, newest first as
+    listed by Jenkins. The numbers are kept in an ``array('l')`` and the
+    urls rebuilt from the job url; rows that do not follow the usual form
+    are kept as they are. Items are dicts created on access.
+    """
+
+    def __init__(self, builds=()):
+        self.numbers = array("l")
+        self._klass = None
+        self._prefix = None
+        self._others = {}
+        for position, build in enumerate(builds):
+            self.numbers.append(build["number"])
+            if not self._is_usual(build):
+                self._others[position] = dict(build)
+        self._descending = None
+
+    def _is_descending(self) -> bool:
+        if self._descending is None:
+            numbers = self.numbers
+            self._descending = all(
+                numbers[idx] > numbers[idx + 1]
+                for idx in range(len(numbers) - 1)
+            )
+        return self._descending
+
+    def _is_usual(self, build) -> bool:
+        url = build.get("url")
+        if type(url) is not str or not build.keys() <= _BUILD_KEYS:
+            return False
+        if self._prefix is None:
+            self._prefix = sys.intern(url[: url.rstrip("/").rfind("/") + 1])
+            self._klass = _intern(build.get("_class"))
+        return (
+            url == "%s%d/" % (self._prefix, build["number"])
+            and build.get("_class") == self._klass
+        )
+
+    def _row(self, position):
+        other = self._others.get(position)
+        if other is not None:
+            return dict(other)
+        number = self.numbers[position]
+        row = {"number": number, "url": "%s%d/" % (self._prefix, number)}
+        if self._klass is not None:
+            row = {"_class": self._klass, **row}
+        return row
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(pos) for pos in range(*index.indices(len(self)))]
+        return self._row(self._check_index(index))
+
+    def __setitem__(self, index, build):
+        if isinstance(index, slice):
+            builds = list(self)
+            builds[index] = build
+            self.__init__(builds)
+            return
+        index = self._check_index(index)
+        self.numbers[index] = build["number"]
+        self._others.pop(index, None)
+        if not self._is_usual(build):
+            self._others[index] = dict(build)
+        self._descending = None
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            builds = list(self)
+            del builds[index]
+            self.__init__(builds)
+            return
+        index = self._check_index(index)
+        del self.numbers[index]
+        self._shift_others(index, -1)
+        self._descending = None
+
+    def insert(self, index, build):
+        index = min(
+            max(index + len(self) if index < 0 else index, 0), len(self)
+        )
+        self.numbers.insert(index, build["number"])
+        self._shift_others(index, 1)
+        if not self._is_usual(build):
+            self._others[index] = dict(build)
+        self._descending = None
+
+    def _check_index(self, index):
+        if index < 0:
+            index += len(self.numbers)
+        if not 0 <= index < len(self.numbers):
+            raise IndexError("build index out of range")
+        return index
+
+    def _shift_others(self, index, delta):
+        """Move the unusual rows at or after index by delta positions"""
+        self._others = {
+            (pos + delta if pos >= index else pos): row
+            for pos, row in self._others.items()
+            if delta > 0 or pos != index
+        }
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, BuildList)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "BuildList(%r)" % list(self)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def position(self, number: int) -> int | None:
+        """Return the position of the build number, None if not listed"""
+        if self._is_descending():
+            # binary search in the decreasing numbers
+            lo, hi = 0, len(self.numbers)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self.numbers[mid] > number:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < len(self.numbers) and self.numbers[lo] == number:
+                return lo
+            return None
+        try:
+            return self.numbers.index(number)
+        except ValueError:
+            return None
+
+    def get_url(self, number: int, default=None):
+        """Return the url of the build number"""
+        position = self.position(number)
+        if position is None:
+            return default
+        return self._row(position)["url"]
+
+    def to_dict(self) -> dict:
+        """Return a dict mapping build numbers to urls"""
+        return {row["number"]: row["url"] for row in self}
+
+
+def compact_job_rows(rows) -> list:
+    """Return a list of the JobRow of rows"""
+    return [row if isinstance(row, JobRow) else JobRow(row) for row in rows]
@@ -1,7 +1,7 @@
 # Code from https://github.com/ros-infrastructure/ros_buildfarm
 # (c) Open Source Robotics Foundation
-import ast
 import logging
+from jenkinsapi.utils import json_decoder
 from jenkinsapi.utils.requester import Requester
 
 logger = logging.getLogger(__name__)
@@ -57,13 +57,13 @@ class CrumbRequester(Requester):
         )
 
     def _get_crumb_data(self):
-        response = self.get_url(self._baseurl + "/crumbIssuer/api/python")
+        response = self.get_url(self._baseurl + "/crumbIssuer/api/json")
         if response.status_code in [404]:
             logger.warning("The Jenkins master does not require a crumb")
             return False
         if response.status_code not in [200]:
             raise RuntimeError("Failed to fetch crumb: %s" % response.text)
-        crumb_issuer_response = ast.literal_eval(response.text)
+        crumb_issuer_response = json_decoder.loads(response.content)
         crumb_request_field = crumb_issuer_response["crumbRequestField"]
         crumb = crumb_issuer_response["crumb"]
         logger.debug("Fetched crumb: %s", crumb)
@@ -0,0 +1,992 @@
+"""
+An in-process fake Jenkins controller for tests and benchmarks.
+
+It serves synthetic but realistically shaped ``api/json`` and ``api/python``
+documents (with working ``tree=`` projections and ``{M,N}`` ranges) for
+thousands of jobs, nested folders, any number of builds per job, nodes and
+queue items. Builds are generated on demand, so even 100k builds cost no
+memory until they are requested.
+
+Usage::
+
+    with FakeJenkins(jobs=1000, builds=100, folders=10) as server:
+        jenkins = Jenkins(server.baseurl, use_crumb=False)
+        ...
+        print(server.request_count, server.bytes_sent)
+
+or from the command line::
+
+    python -m jenkinsapi.utils.fake_jenkins --jobs 1000 --port 8080
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+JENKINS_VERSION = "2.440.3"
+BUILDS_LIMIT = 100  # Jenkins caps the "builds" field at 100 entries
+BASE_TIMESTAMP = 1700000000000
+BUILD_ALIASES = (
+    "firstBuild",
+    "lastBuild",
+    "lastCompletedBuild",
+    "lastFailedBuild",
+    "lastStableBuild",
+    "lastSuccessfulBuild",
+    "lastUnstableBuild",
+    "lastUnsuccessfulBuild",
+)
+
+_PY_LITERALS = re.compile(r'"(?:\\.|[^"\\])*"|\btrue\b|\bfalse\b|\bnull\b')
+_PY_REPLACEMENTS = {"true": "True", "false": "False", "null": "None"}
+
+
+class TreeError(ValueError):
+    """Raised for a malformed ``tree`` query parameter."""
+
+
+def parse_tree(spec):
+    """
+    Parse a Jenkins ``tree`` expression such as
+    ``jobs[name,builds[number]{0,10}],description`` into a list of
+    ``(name, subtree or None, slice or None)`` tuples.
+    """
+    items, pos = _parse_tree_items(spec, 0)
+    if pos != len(spec):
+        raise TreeError("Unexpected %r at %d in tree" % (spec[pos], pos))
+    return items
+
+
+def _parse_tree_items(spec, pos):
+    items = []
+    while True:
+        start = pos
+        while pos < len(spec) and spec[pos] not in ",[]{}":
+            pos += 1
+        name = spec[start:pos].strip()
+        subtree = None
+        selection = None
+        if pos < len(spec) and spec[pos] == "[":
+            subtree, pos = _parse_tree_items(spec, pos + 1)
+            if pos >= len(spec) or spec[pos] != "]":
+                raise TreeError("Unbalanced [ in tree")
+            pos += 1
+        if pos < len(spec) and spec[pos] == "{":
+            end = spec.find("}", pos)
+            if end < 0:
+                raise TreeError("Unbalanced { in tree")
+            selection = _parse_range(spec[pos + 1 : end])
+            pos = end + 1
+        if name:
+            items.append((name, subtree, selection))
+        if pos < len(spec) and spec[pos] == ",":
+            pos += 1
+            continue
+        return items, pos
+
+
+def _parse_range(text):
+    try:
+        if "," not in text:
+            index = int(text)
+            return slice(index, index + 1)
+        lower, upper = text.split(",", 1)
+        return slice(
+            int(lower) if lower.strip() else 0,
+            int(upper) if upper.strip() else None,
+        )
+    except ValueError:
+        raise TreeError("Invalid range {%s} in tree" % text)
+
+
+def apply_tree(value, tree):
+    """
+    Project a document onto a parsed tree, the way Jenkins does.
+    """
+    if isinstance(value, dict):
+        result = {}
+        if "_class" in value:
+            result["_class"] = value["_class"]
+        for name, subtree, selection in tree:
+            if name in value:
+                result[name] = _project(value[name], subtree, selection)
+        return result
+    return _project(value, tree, None)
+
+
+def _project(value, subtree, selection):
+    if isinstance(value, TreeOnly):
+        value = value.value
+    if isinstance(value, (list, LazyList)):
+        if selection is not None:
+            value = value[selection]
+        return [_project(item, subtree, None) for item in value]
+    if isinstance(value, dict):
+        return apply_tree(value, subtree or [])
+    return value
+
+
+def materialize(value):
+    """
+    Return a document as served without a tree: TreeOnly fields are
+    dropped and lazy lists are expanded.
+    """
+    if isinstance(value, dict):
+        return {
+            key: materialize(item)
+            for key, item in value.items()
+            if not isinstance(item, TreeOnly)
+        }
+    if isinstance(value, (list, LazyList)):
+        return [materialize(item) for item in value]
+    return value
+
+
+def to_python_literal(text):
+    """
+    Convert a JSON document to the syntax of Jenkins' ``api/python``.
+    """
+    return _PY_LITERALS.sub(
+        lambda match: _PY_REPLACEMENTS.get(match.group(0), match.group(0)),
+        text,
+    )
+
+
+class TreeOnly(object):
+    """
+    A field only returned when a tree asks for it; its value may be
+    computed by a factory when asked for.
+    """
+
+    def __init__(self, value=None, factory=None):
+        self._value = value
+        self.factory = factory
+
+    @property
+    def value(self):
+        if self.factory is not None:
+            return self.factory()
+        return self._value
+
+
+class LazyList(object):
+    """A read-only sequence whose items are generated on access."""
+
+    def __init__(self, length, factory):
+        self.length = length
+        self.factory = factory
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self.factory(idx) for idx in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        return self.factory(index)
+
+    def __iter__(self):
+        return (self.factory(idx) for idx in range(self.length))
+
+
+class FakeItem(object):
+    """A job or a folder of the fake controller."""
+
+    def __init__(self, full_name, is_folder=False, builds=0):
+        self.full_name = full_name
+        self.name = full_name.rsplit("/", 1)[-1]
+        self.is_folder = is_folder
+        self.builds = builds
+        self.children = []
+        self.path = "".join(
+            "/job/%s" % quote(part) for part in full_name.split("/")
+        )
+
+
+class FakeJenkinsData(object):
+    """
+    Synthetic controller state and the documents describing it.
+
+    :param jobs: number of top level jobs
+    :param folders: number of top level folders
+    :param folder_depth: levels of nested folders below each top level
+        folder
+    :param jobs_per_folder: number of jobs in every folder
+    :param builds: number of builds of every job
+    :param nodes: number of agents, besides the built-in node
+    :param queue_items: number of queued items (spread over the jobs)
+    :param artifacts: number of artifacts of every build
+    :param test_cases: number of test cases in the test report of every
+        completed build, 0 for builds without a test report
+    :param running_polls: number of times the last build of a job reports
+        itself as running before it completes
+    """
+
+    def __init__(
+        self,
+        jobs=100,
+        folders=0,
+        folder_depth=1,
+        jobs_per_folder=10,
+        builds=10,
+        nodes=2,
+        queue_items=0,
+        artifacts=1,
+        running_polls=0,
+        test_cases=0,
+    ):
+        self.baseurl = ""
+        self.builds = builds
+        self.artifacts = artifacts
+        self.test_cases = test_cases
+        self.running_polls = running_polls
+        self._polls = Counter()
+        self._lock = threading.Lock()
+        self.root = FakeItem("", is_folder=True)
+        self.items = {}
+        for idx in range(jobs):
+            self._add(self.root, "job_%05d" % idx, builds=builds)
+        for idx in range(folders):
+            folder = self._add(self.root, "folder_%03d" % idx, is_folder=True)
+            for depth in range(folder_depth):
+                for job_idx in range(jobs_per_folder):
+                    self._add(folder, "job_%05d" % job_idx, builds=builds)
+                if depth + 1 < folder_depth:
+                    folder = self._add(
+                        folder, "sub_%d" % (depth + 1), is_folder=True
+                    )
+        self.nodes = ["Built-In Node"] + [
+            "agent-%03d" % idx for idx in range(nodes)
+        ]
+        all_jobs = self.jobs()
+        self.queue = {}
+        for idx in range(queue_items):
+            if all_jobs:
+                self.queue[idx + 1] = all_jobs[idx % len(all_jobs)]
+        self.queued_jobs = set(self.queue.values())
+
+    def _add(self, parent, name, is_folder=False, builds=0):
+        full_name = (
+            "%s/%s" % (parent.full_name, name) if parent.full_name else name
+        )
+        item = FakeItem(full_name, is_folder=is_folder, builds=builds)
+        parent.children.append(item)
+        self.items[full_name] = item
+        return item
+
+    def jobs(self):
+        return [item for item in self.items.values() if not item.is_folder]
+
+    # Changes
+
+    def add_job(self, full_name, builds=0):
+        """Add a job to an existing folder (or the top level)"""
+        parent_name, _, name = full_name.rpartition("/")
+        parent = self.items[parent_name] if parent_name else self.root
+        return self._add(parent, name, builds=builds)
+
+    def remove_item(self, full_name):
+        """Remove a job, or a folder and everything in it"""
+        item = self.items.pop(full_name)
+        parent_name = full_name.rpartition("/")[0]
+        parent = self.items[parent_name] if parent_name else self.root
+        parent.children.remove(item)
+        for name in list(self.items):
+            if name.startswith(full_name + "/"):
+                del self.items[name]
+
+    def add_build(self, full_name):
+        """Add a (completed) build to a job and return its number"""
+        item = self.items[full_name]
+        item.builds += 1
+        return item.builds
+
+    # Documents
+
+    def url(self, path):
+        return "%s%s/" % (self.baseurl, path)
+
+    def item_ref(self, item):
+        ref = {
+            "_class": self.item_class(item),
+            "name": item.name,
+            "url": self.url(item.path),
+        }
+        if item.is_folder:
+            children = item.children
+            ref["jobs"] = TreeOnly(
+                LazyList(
+                    len(children), lambda idx: self.item_ref(children[idx])
+                )
+            )
+        else:
+            ref["color"] = self.job_color(item)
+            ref["lastBuild"] = TreeOnly(
+                factory=lambda: self.build_ref(item, item.builds or None)
+            )
+            ref["healthReport"] = TreeOnly(
+                factory=lambda: self.health_report(item)
+            )
+        return ref
+
+    @staticmethod
+    def item_class(item):
+        if item.is_folder:
+            return "com.cloudbees.hudson.plugins.folder.Folder"
+        return "hudson.model.FreeStyleProject"
+
+    def root_document(self):
+        return {
+            "_class": "hudson.model.Hudson",
+            "assignedLabels": [{"name": "built-in"}],
+            "mode": "NORMAL",
+            "nodeDescription": "the Jenkins controller's built-in node",
+            "nodeName": "",
+            "numExecutors": 2,
+            "description": None,
+            "jobs": [self.item_ref(item) for item in self.root.children],
+            "primaryView": {
+                "_class": "hudson.model.AllView",
+                "name": "all",
+                "url": self.url(""),
+            },
+            "quietingDown": False,
+            "slaveAgentPort": 50000,
+            "useCrumbs": False,
+            "useSecurity": False,
+            "views": [
+                {
+                    "_class": "hudson.model.AllView",
+                    "name": "all",
+                    "url": self.url(""),
+                }
+            ],
+        }
+
+    def view_document(self, name):
+        if name != "all":
+            return None
+        return {
+            "_class": "hudson.model.AllView",
+            "description": None,
+            "jobs": [self.item_ref(item) for item in self.root.children],
+            "name": "all",
+            "property": [],
+            "url": self.url(""),
+        }
+
+    def folder_document(self, item):
+        return {
+            "_class": self.item_class(item),
+            "description": None,
+            "displayName": item.name,
+            "fullDisplayName": item.full_name.replace("/", " » "),
+            "fullName": item.full_name,
+            "name": item.name,
+            "url": self.url(item.path),
+            "jobs": [self.item_ref(child) for child in item.children],
+            "primaryView": {"name": "All", "url": self.url(item.path)},
+            "views": [{"name": "All", "url": self.url(item.path)}],
+        }
+
+    def build_result(self, number):
+        return "FAILURE" if number % 10 == 0 else "SUCCESS"
+
+    def is_running(self, item, number, count_poll=False):
+        if number != item.builds or not self.running_polls:
+            return False
+        with self._lock:
+            polls = self._polls[item.full_name]
+            if count_poll:
+                self._polls[item.full_name] += 1
+        return polls < self.running_polls
+
+    def reset_running(self):
+        """Make the last build of every job report running_polls again"""
+        with self._lock:
+            self._polls.clear()
+
+    def job_color(self, item):
+        if not item.builds:
+            return "notbuilt"
+        color = (
+            "red" if self.build_result(item.builds) == "FAILURE" else "blue"
+        )
+        if self.is_running(item, item.builds):
+            color += "_anime"
+        return color
+
+    def health_report(self, item):
+        if not item.builds:
+            return []
+        failed = sum(
+            self.build_result(number) == "FAILURE"
+            for number in range(item.builds, max(0, item.builds - 5), -1)
+        )
+        return [
+            {
+                "description": "Build stability: %d out of the last 5 "
+                "builds failed." % failed,
+                "score": 100 - 20 * failed,
+            }
+        ]
+
+    def build_ref(self, item, number):
+        if number is None:
+            return None
+
+        def build_field(key):
+            return TreeOnly(
+                factory=lambda: self.build_document(
+                    item, number, count_poll=False
+                )[key]
+            )
+
+        return {
+            "_class": "hudson.model.FreeStyleBuild",
+            "number": number,
+            "url": self.url("%s/%d" % (item.path, number)),
+            "result": TreeOnly(
+                factory=lambda: (
+                    None
+                    if self.is_running(item, number)
+                    else self.build_result(number)
+                )
+            ),
+            "timestamp": TreeOnly(BASE_TIMESTAMP + number * 60000),
+            "actions": build_field("actions"),
+            "artifacts": build_field("artifacts"),
+            "building": build_field("building"),
+            "duration": build_field("duration"),
+        }
+
+    def resolve_alias(self, item, alias):
+        """Return the build number a permalink such as lastBuild points at"""
+        last = item.builds or None
+        if alias == "firstBuild":
+            return 1 if last else None
+        if alias == "lastBuild":
+            return last
+        if last and self.is_running(item, last):
+            last -= 1
+        successful = [
+            number
+            for number in range(last or 0, max(0, (last or 0) - 10), -1)
+            if self.build_result(number) == "SUCCESS"
+        ]
+        failed = [
+            number
+            for number in range(last or 0, max(0, (last or 0) - 10), -1)
+            if self.build_result(number) == "FAILURE"
+        ]
+        if alias == "lastCompletedBuild":
+            return last or None
+        if alias in ("lastSuccessfulBuild", "lastStableBuild"):
+            return successful[0] if successful else None
+        if alias in ("lastFailedBuild", "lastUnsuccessfulBuild"):
+            return failed[0] if failed else None
+        return None
+
+    def job_document(self, item):
+        builds = item.builds
+        document = {
+            "_class": self.item_class(item),
+            "actions": [{}],
+            "description": "",
+            "displayName": item.name,
+            "fullDisplayName": item.full_name.replace("/", " » "),
+            "fullName": item.full_name,
+            "name": item.name,
+            "url": self.url(item.path),
+            "buildable": True,
+            "builds": [
+                self.build_ref(item, number)
+                for number in range(builds, max(0, builds - BUILDS_LIMIT), -1)
+            ],
+            "allBuilds": TreeOnly(
+                LazyList(
+                    builds, lambda idx: self.build_ref(item, builds - idx)
+                )
+            ),
+            "color": self.job_color(item),
+            "concurrentBuild": False,
+            "disabled": False,
+            "downstreamProjects": [],
+            "healthReport": self.health_report(item),
+            "inQueue": item in self.queued_jobs,
+            "keepDependencies": False,
+            "nextBuildNumber": builds + 1,
+            "property": [],
+            "queueItem": None,
+            "scm": {"_class": "hudson.scm.NullSCM"},
+            "upstreamProjects": [],
+        }
+        for alias in BUILD_ALIASES:
+            document[alias] = self.build_ref(
+                item, self.resolve_alias(item, alias)
+            )
+        for queue_id, queued in self.queue.items():
+            if queued is item:
+                document["queueItem"] = self.queue_item_document(queue_id)
+                break
+        return document
+
+    def build_document(self, item, number, count_poll=True):
+        running = self.is_running(item, number, count_poll=count_poll)
+        sha = hashlib.sha1(
+            ("%s:%d" % (item.full_name, number)).encode("utf-8")
+        ).hexdigest()
+        document = {
+            "_class": "hudson.model.FreeStyleBuild",
+            "actions": [
+                {
+                    "_class": "hudson.model.ParametersAction",
+                    "parameters": [
+                        {
+                            "_class": "hudson.model.StringParameterValue",
+                            "name": "BRANCH",
+                            "value": "branch-%d" % (number % 5),
+                        }
+                    ],
+                },
+                {
+                    "_class": "hudson.model.CauseAction",
+                    "causes": [
+                        {
+                            "_class": "hudson.model.Cause$UserIdCause",
+                            "shortDescription": "Started by user admin",
+                            "userId": "admin",
+                            "userName": "admin",
+                        }
+                    ],
+                },
+                {
+                    "_class": "hudson.plugins.git.util.BuildData",
+                    "lastBuiltRevision": {
+                        "SHA1": sha,
+                        "branch": [
+                            {
+                                "SHA1": sha,
+                                "name": "refs/remotes/origin/main",
+                            }
+                        ],
+                    },
+                    "remoteUrls": ["https://git.example.com/repo.git"],
+                    "scmName": "",
+                },
+            ],
+            "artifacts": [
+                {
+                    "displayPath": "artifact_%d.txt" % idx,
+                    "fileName": "artifact_%d.txt" % idx,
+                    "relativePath": "out/artifact_%d.txt" % idx,
+                }
+                for idx in range(self.artifacts)
+            ],
+            "building": running,
+            "builtOn": "",
+            "changeSet": {
+                "_class": "hudson.scm.EmptyChangeLogSet",
+                "items": [],
+                "kind": None,
+            },
+            "culprits": [],
+            "description": None,
+            "displayName": "#%d" % number,
+            "duration": 0 if running else 1000 + number % 1000,
+            "estimatedDuration": 1500,
+            "executor": {} if running else None,
+            "fullDisplayName": "%s #%d"
+            % (item.full_name.replace("/", " » "), number),
+            "id": str(number),
+            "keepLog": False,
+            "number": number,
+            "queueId": number,
+            "result": None if running else self.build_result(number),
+            "timestamp": BASE_TIMESTAMP + number * 60000,
+            "url": self.url("%s/%d" % (item.path, number)),
+        }
+        if self.test_cases and not running:
+            report = self.test_report_document(number)
+            document["actions"].append(
+                {
+                    "_class": "hudson.tasks.junit.TestResultAction",
+                    "failCount": report["failCount"],
+                    "skipCount": report["skipCount"],
+                    "totalCount": self.test_cases,
+                    "urlName": "testReport",
+                }
+            )
+        return document
+
+    def test_report_document(self, number):
+        failed = self.build_result(number) == "FAILURE"
+        cases = [
+            {
+                "className": "tests.test_module_%d" % (idx // 10),
+                "name": "test_%d" % idx,
+                "status": "FAILED" if failed and idx == 0 else "PASSED",
+                "duration": 0.001 * (idx + 1),
+            }
+            for idx in range(self.test_cases)
+        ]
+        return {
+            "_class": "hudson.tasks.junit.TestResult",
+            "failCount": int(failed),
+            "passCount": self.test_cases - int(failed),
+            "skipCount": 0,
+            "suites": [{"name": "tests", "cases": cases}],
+        }
+
+    def computer_path(self, name):
+        if name == "Built-In Node":
+            return "/computer/(built-in)"
+        return "/computer/%s" % quote(name)
+
+    def node_document(self, name):
+        return {
+            "_class": "hudson.model.Hudson$MasterComputer"
+            if name == "Built-In Node"
+            else "hudson.slaves.SlaveComputer",
+            "actions": [],
+            "assignedLabels": [{"name": name}],
+            "description": "",
+            "displayName": name,
+            "executors": [
+                {
+                    "currentExecutable": None,
+                    "idle": True,
+                    "likelyStuck": False,
+                    "number": number,
+                    "progress": -1,
+                }
+                for number in range(2)
+            ],
+            "icon": "symbol-computer",
+            "idle": True,
+            "jnlpAgent": name != "Built-In Node",
+            "launchSupported": True,
+            "manualLaunchAllowed": True,
+            "monitorData": {
+                "hudson.node_monitors.DiskSpaceMonitor": {
+                    "path": "/var/lib/jenkins",
+                    "size": 123456789012,
+                },
+                "hudson.node_monitors.ResponseTimeMonitor": {"average": 5},
+            },
+            "numExecutors": 2,
+            "offline": False,
+            "offlineCause": None,
+            "offlineCauseReason": "",
+            "temporarilyOffline": False,
+        }
+
+    def computers_document(self):
+        return {
+            "_class": "hudson.model.ComputerSet",
+            "busyExecutors": 0,
+            "computer": [self.node_document(name) for name in self.nodes],
+            "displayName": "Nodes",
+            "totalExecutors": 2 * len(self.nodes),
+        }
+
+    def queue_item_document(self, queue_id):
+        item = self.queue[queue_id]
+        return {
+            "_class": "hudson.model.Queue$BuildableItem",
+            "actions": [],
+            "blocked": False,
+            "buildable": True,
+            "id": queue_id,
+            "inQueueSince": BASE_TIMESTAMP,
+            "params": "",
+            "stuck": False,
+            "task": {
+                "_class": self.item_class(item),
+                "name": item.name,
+                "url": self.url(item.path),
+                "color": self.job_color(item),
+            },
+            "url": "queue/item/%d/" % queue_id,
+            "why": "Waiting for next available executor",
+            "executable": None,
+        }
+
+    def queue_document(self):
+        return {
+            "_class": "hudson.model.Queue",
+            "discoverableItems": [],
+            "items": [
+                self.queue_item_document(queue_id) for queue_id in self.queue
+            ],
+        }
+
+    # Routing
+
+    def route(self, path):
+        """
+        Return ``(document, text)`` for a request path: a document for API
+        urls, text (or bytes) for other resources, None when not found.
+        """
+        parts = [unquote(part) for part in path.split("/") if part]
+        api = parts[-2:] in (["api", "json"], ["api", "python"])
+        if api:
+            parts = parts[:-2]
+
+        item = self.root
+        while len(parts) >= 2 and parts[0] == "job":
+            child = next(
+                (child for child in item.children if child.name == parts[1]),
+                None,
+            )
+            if child is None:
+                return None, None
+            item = child
+            parts = parts[2:]
+
+        if item is not self.root:
+            return self._route_item(item, parts, api)
+        if not parts:
+            return (self.root_document(), None) if api else (None, "<html/>")
+        if parts == ["computer"] and api:
+            return self.computers_document(), None
+        if len(parts) == 2 and parts[0] == "computer" and api:
+            name = "Built-In Node" if parts[1] == "(built-in)" else parts[1]
+            if name in self.nodes:
+                return self.node_document(name), None
+        if parts == ["queue"] and api:
+            return self.queue_document(), None
+        if len(parts) == 3 and parts[:2] == ["queue", "item"] and api:
+            if parts[2].isdigit() and int(parts[2]) in self.queue:
+                return self.queue_item_document(int(parts[2])), None
+        if len(parts) == 2 and parts[0] == "view" and api:
+            return self.view_document(parts[1]), None
+        if parts == ["pluginManager"] and api:
+            return {"_class": "hudson.LocalPluginManager", "plugins": []}, None
+        return None, None
+
+    def _route_item(self, item, parts, api):
+        if item.is_folder:
+            if not parts and api:
+                return self.folder_document(item), None
+            return None, None
+        if not parts:
+            return (self.job_document(item), None) if api else (None, "")
+        if parts == ["config.xml"] and not api:
+            return None, "<project><description/></project>"
+        number = parts[0]
+        if number in BUILD_ALIASES:
+            number = self.resolve_alias(item, number)
+        elif number.isdigit():
+            number = int(number)
+        else:
+            return None, None
+        if number is None or not 1 <= number <= item.builds:
+            return None, None
+        rest = parts[1:]
+        if not rest and api:
+            return self.build_document(item, number), None
+        if rest == ["testReport"] and api and self.test_cases:
+            if not self.is_running(item, number):
+                return self.test_report_document(number), None
+        if rest == ["consoleText"] and not api:
+            return None, "Started by user admin\nFinished: %s\n" % (
+                self.build_result(number)
+            )
+        if len(rest) >= 2 and rest[0] == "artifact" and not api:
+            return None, ("contents of %s\n" % "/".join(rest[1:])).encode()
+        return None, None
+
+
+class FakeJenkinsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "FakeJenkins"
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self._send(405, b"", "text/plain", send_body=True)
+
+    def _respond(self, send_body):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        split = urlsplit(self.path)
+        query = parse_qs(split.query)
+        document, text = server.data.route(split.path)
+        if document is not None:
+            if "tree" in query:
+                try:
+                    document = apply_tree(
+                        document, parse_tree(query["tree"][0])
+                    )
+                except TreeError as error:
+                    self._send(
+                        400, str(error).encode(), "text/plain", send_body
+                    )
+                    return
+            else:
+                document = materialize(document)
+            body = json.dumps(document, separators=(",", ":"))
+            if split.path.rstrip("/").endswith("api/python"):
+                body = to_python_literal(body)
+            self._send(
+                200,
+                body.encode("utf-8"),
+                "application/json;charset=utf-8",
+                send_body,
+            )
+        elif text is not None:
+            if isinstance(text, str):
+                text = text.encode("utf-8")
+            self._send(200, text, "text/plain;charset=utf-8", send_body)
+        else:
+            self._send(404, b"", "text/plain", send_body)
+
+    def _send(self, status, body, content_type, send_body):
+        # Count before responding so that clients never see stale stats
+        self.server.record(
+            self.command, self.path, len(body) if send_body else 0
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Jenkins", JENKINS_VERSION)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=W0622
+        pass
+
+
+class FakeJenkinsServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, data, latency=0.0):
+        super().__init__(address, FakeJenkinsHandler)
+        self.data = data
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def record(self, method, path, size):
+        with self.lock:
+            self.request_count += 1
+            self.bytes_sent += size
+            self.request_log.append((method, path))
+
+    def reset_stats(self):
+        with self.lock:
+            self.request_count = 0
+            self.bytes_sent = 0
+            self.request_log = []
+
+
+class FakeJenkins(object):
+    """
+    Run a :class:`FakeJenkinsData` controller on a background thread.
+
+    Accepts the arguments of FakeJenkinsData, plus:
+
+    :param latency: seconds every response is delayed, to simulate a
+        network round-trip
+    :param host: interface to listen on
+    :param port: port to listen on, 0 for any free port
+    """
+
+    def __init__(self, latency=0.0, host="127.0.0.1", port=0, **kwargs):
+        self.data = FakeJenkinsData(**kwargs)
+        self.server = FakeJenkinsServer((host, port), self.data, latency)
+        self.data.baseurl = self.baseurl
+        # a short poll interval keeps stop() fast, servers are often
+        # created per test
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+    @property
+    def baseurl(self):
+        host, port = self.server.server_address[:2]
+        return "http://%s:%d" % (host, port)
+
+    @property
+    def request_count(self):
+        return self.server.request_count
+
+    @property
+    def bytes_sent(self):
+        return self.server.bytes_sent
+
+    @property
+    def request_log(self):
+        return list(self.server.request_log)
+
+    def reset_stats(self):
+        self.server.reset_stats()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--latency", type=float, default=0.0)
+    for option, default in (
+        ("jobs", 100),
+        ("folders", 0),
+        ("folder-depth", 1),
+        ("jobs-per-folder", 10),
+        ("builds", 10),
+        ("nodes", 2),
+        ("queue-items", 0),
+        ("artifacts", 1),
+        ("running-polls", 0),
+        ("test-cases", 0),
+    ):
+        parser.add_argument("--" + option, type=int, default=default)
+    args = vars(parser.parse_args(argv))
+    server = FakeJenkins(**{key: value for key, value in args.items()})
+    print("Serving fake Jenkins at %s" % server.baseurl)
+    server.server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
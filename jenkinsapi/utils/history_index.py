@@ -0,0 +1,178 @@
+"""
+An in-memory index of the build history of a job, by build parameters and
+by git revision.
+
+The index is built from paged ``allBuilds`` tree queries holding only the
+parameters, revision and result of every build (see Job.iter_builds), and
+kept up to date incrementally: an update checks the last build number and
+only reads the builds started since the previous one, plus the builds that
+were still running then.
+
+Usage::
+
+    index = job.get_history_index()
+    numbers = index.builds_with_params({"BRANCH": "main"})
+    numbers = index.builds_for_revision("3f786850e387550fdab836ed7e6dc881de23001b")
+"""
+
+from __future__ import annotations
+
+from bisect import insort
+
+from jenkinsapi import config
+from jenkinsapi.build import Build
+
+# The fields of every build read by the index
+INDEX_FIELDS = (
+    "result",
+    "actions[parameters[name,value],lastBuiltRevision[SHA1,branch[name]]]",
+)
+
+
+def _freeze(value):
+    """Return a hashable version of a parameter value"""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
+def params_key(params: dict) -> frozenset:
+    """Return the key of a set of build parameters in the index"""
+    return frozenset((name, _freeze(value)) for name, value in params.items())
+
+
+def revision_from_actions(actions) -> str | None:
+    """Return the git revision built, held by the actions of a build"""
+    for action in actions or []:
+        if action and "lastBuiltRevision" in action:
+            return action["lastBuiltRevision"]["SHA1"]
+    return None
+
+
+class BuildHistoryIndex(object):
+    """
+    Map the parameter sets and git revisions of the builds of a job to
+    their build numbers (oldest first). Builds deleted since they were
+    indexed stay in the index until they are discarded or the index is
+    rebuilt.
+
+    :param job: the Job indexed
+    :param page_size: builds per request, default config.BUILDS_PAGE_SIZE
+    """
+
+    def __init__(self, job, page_size=None):
+        self.job = job
+        self.page_size = page_size
+        self._clear()
+
+    def _clear(self):
+        self.watermark = 0
+        self._entries = {}  # number -> (params key, revision)
+        self._by_params = {}
+        self._by_revision = {}
+        self._running = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, number):
+        return number in self._entries
+
+    def update(self) -> int:
+        """
+        Index the builds started since the last update and the builds
+        that were running then; return the number of builds read. An
+        unchanged job costs one request for its last build number.
+        """
+        last = self.job.poll(tree="lastBuild[number]").get("lastBuild")
+        if last is None:
+            self._clear()
+            return 0
+        last_number = last["number"]
+        if last_number < self.watermark:
+            # the job was recreated: its history starts over
+            self._clear()
+        elif last_number == self.watermark and not self._running:
+            return 0
+        # rows above the boundary are read again
+        boundary = min(self._running, default=self.watermark + 1) - 1
+        page_size = self.page_size or config.BUILDS_PAGE_SIZE
+        # numbers are unique: at most last_number - boundary builds are new
+        page_size = max(min(page_size, last_number - boundary), 1)
+        rows = []
+        for row in self.job._iter_build_rows(
+            fields=INDEX_FIELDS, page_size=page_size
+        ):
+            if row["number"] <= boundary:
+                break
+            rows.append(self._entry(row))
+            if row["number"] == boundary + 1:
+                # no build can be left to read
+                break
+        # running builds that were not listed again have been deleted
+        for number in self._running - {entry[0] for entry in rows}:
+            self.discard(number)
+        # oldest first, so that the numbers are appended in order
+        for entry in reversed(rows):
+            self._add(*entry)
+        self.watermark = max(self.watermark, last_number)
+        return len(rows)
+
+    def rebuild(self) -> int:
+        """Index the whole history again, see update()"""
+        self._clear()
+        return self.update()
+
+    @staticmethod
+    def _entry(row):
+        actions = row.get("actions")
+        return (
+            row["number"],
+            params_key(Build.params_from_actions(actions)),
+            revision_from_actions(actions),
+            row.get("result") is None,
+        )
+
+    def _add(self, number, key, revision, running):
+        self.discard(number)
+        self._entries[number] = (key, revision)
+        insort(self._by_params.setdefault(key, []), number)
+        if revision is not None:
+            insort(self._by_revision.setdefault(revision, []), number)
+        if running:
+            self._running.add(number)
+
+    def discard(self, number):
+        """Remove a build, e.g. one that was deleted, from the index"""
+        entry = self._entries.pop(number, None)
+        self._running.discard(number)
+        if entry is None:
+            return
+        key, revision = entry
+        self._remove(self._by_params, key, number)
+        if revision is not None:
+            self._remove(self._by_revision, revision, number)
+
+    @staticmethod
+    def _remove(index, key, number):
+        numbers = index[key]
+        numbers.remove(number)
+        if not numbers:
+            del index[key]
+
+    def builds_with_params(self, params: dict) -> list[int]:
+        """Return the numbers of the builds run with exactly params"""
+        return list(self._by_params.get(params_key(params), ()))
+
+    def builds_for_revision(self, revision: str) -> list[int]:
+        """Return the numbers of the builds of a git revision"""
+        return list(self._by_revision.get(revision, ()))
+
+    def revisions(self) -> dict[str, list[int]]:
+        """Return a dict mapping git revisions to build numbers"""
+        return {
+            revision: list(numbers)
+            for revision, numbers in self._by_revision.items()
+        }
@@ -0,0 +1,71 @@
+"""
+On-disk snapshot of the job list of a Jenkins server, to warm-start a
+client before the job list is fetched again
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+from jenkinsapi import config
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+# the fields of a job row kept in a snapshot
+SNAPSHOT_KEYS = ("name", "url", "color")
+
+
+def save_snapshot(path, baseurl, jobs) -> None:
+    """
+    Write the job rows of the server at baseurl to path, atomically.
+    """
+    document = {
+        "version": SNAPSHOT_VERSION,
+        "baseurl": baseurl,
+        "saved_at": time.time(),
+        "jobs": jobs,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w") as snapshot:
+            json.dump(document, snapshot, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_snapshot(path, baseurl, max_age=None) -> list | None:
+    """
+    Return the job rows saved at path, or None if there is no usable
+    snapshot: missing, unreadable, of another format or server, or older
+    than max_age seconds (default config.SNAPSHOT_MAX_AGE).
+    """
+    if max_age is None:
+        max_age = config.SNAPSHOT_MAX_AGE
+    try:
+        with open(path) as snapshot:
+            document = json.load(snapshot)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        log.warning("Ignoring unreadable job snapshot %s", path)
+        return None
+    if not isinstance(document, dict) or (
+        document.get("version") != SNAPSHOT_VERSION
+        or document.get("baseurl") != baseurl
+        or not isinstance(document.get("jobs"), list)
+    ):
+        log.info("Ignoring job snapshot %s of another server", path)
+        return None
+    age = time.time() - document.get("saved_at", 0)
+    if not 0 <= age <= max_age:
+        log.info("Ignoring job snapshot %s, %d seconds old", path, age)
+        return None
+    return document["jobs"]
@@ -0,0 +1,86 @@
+"""
+Pluggable JSON decoding of Jenkins API responses.
+
+Payloads are decoded straight from the raw response bytes. The fastest
+available decoder is used: msgspec or orjson when installed, otherwise the
+standard library json module. Another decoder can be selected with
+:func:`set_decoder`, either by name or as any callable accepting bytes.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+DECODERS: dict[str, Callable[[bytes], Any]] = {"json": json.loads}
+DECODE_ERRORS: tuple = (ValueError,)
+
+if msgspec is not None:
+    DECODERS["msgspec"] = msgspec.json.Decoder().decode
+    DECODE_ERRORS += (msgspec.DecodeError,)
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+_decoder_name = next(
+    name for name in ("msgspec", "orjson", "json") if name in DECODERS
+)
+_decoder = DECODERS[_decoder_name]
+
+
+def get_decoder() -> str:
+    """
+    Return the name of the decoder in use.
+    """
+    return _decoder_name
+
+
+def set_decoder(decoder: str | Callable[[bytes], Any]) -> str:
+    """
+    Select the function used to decode API responses.
+
+    :param decoder: one of the names in DECODERS, or a callable which
+        decodes bytes and raises ValueError on invalid input
+    :return: name of the previously used decoder
+    """
+    global _decoder, _decoder_name  # pylint: disable=global-statement
+    previous = _decoder_name
+    if callable(decoder):
+        _decoder = decoder
+        _decoder_name = getattr(decoder, "__name__", repr(decoder))
+    elif decoder in DECODERS:
+        _decoder = DECODERS[decoder]
+        _decoder_name = decoder
+    else:
+        raise ValueError(
+            "Unknown decoder %r, available: %s"
+            % (decoder, ", ".join(sorted(DECODERS)))
+        )
+    return previous
+
+
+def loads(content: bytes) -> Any:
+    """
+    Decode a JSON document with the selected decoder.
+    """
+    return _decoder(content)
+
+
+def loads_python_literal(content: bytes) -> Any:
+    """
+    Decode a payload in Python literal syntax (True, False, None), as
+    served by the legacy ``api/python`` endpoints.
+
+    This is only used as a fallback when a payload is not valid JSON.
+    """
+    return ast.literal_eval(content.decode("utf-8"))
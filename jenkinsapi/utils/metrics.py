@@ -0,0 +1,317 @@
+"""
+Per-request instrumentation for the Requester: hooks and endpoint metrics
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+# Segments followed by a user chosen name or an id
+NAMED_SEGMENTS = frozenset(
+    ["job", "view", "computer", "user", "item", "label", "credential"]
+)
+# Segments followed by an arbitrary file path
+PATH_SEGMENTS = frozenset(["artifact", "ws", "execution"])
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def endpoint_pattern(url, params=None) -> str:
+    """
+    Reduce a request url to a low-cardinality endpoint pattern, e.g.
+    ``http://host/job/a/job/b/12/api/json?tree=x`` becomes
+    ``job/*/job/*/*/api/json?tree=...``.
+    """
+    parts = urlsplit(url)
+    pattern = []
+    segments = [segment for segment in parts.path.split("/") if segment]
+    previous = None
+    for segment in segments:
+        if previous in PATH_SEGMENTS:
+            pattern.append("**")
+            break
+        if previous in NAMED_SEGMENTS or segment.isdigit():
+            pattern.append("*")
+        else:
+            pattern.append(segment)
+        previous = segment
+    keys = {key for key, _ in parse_qsl(parts.query, keep_blank_values=True)}
+    keys.update(params or {})
+    query = "&".join("%s=..." % key for key in sorted(keys))
+    return "/".join(pattern) + ("?" + query if query else "")
+
+
+@dataclass
+class RequestEvent:
+    """
+    One HTTP request (attempt) as seen by request hooks.
+
+    ``status_code``, ``response_bytes``, ``elapsed`` and ``error`` are only
+    set once the request finished. Hooks may keep their own state, such
+    as a tracing span, in ``context``.
+    """
+
+    method: str
+    url: str
+    params: dict | None = None
+    attempt: int = 1
+    status_code: int | None = None
+    response_bytes: int = 0
+    elapsed: float = 0.0
+    error: Exception | None = None
+    context: dict = field(default_factory=dict)
+
+    @property
+    def pattern(self) -> str:
+        return endpoint_pattern(self.url, self.params)
+
+    @property
+    def is_retry(self) -> bool:
+        return self.attempt > 1
+
+    def set_response(self, response) -> None:
+        self.status_code = getattr(response, "status_code", None)
+        headers = getattr(response, "headers", None) or {}
+        length = headers.get("Content-Length")
+        if length is not None and str(length).isdigit():
+            self.response_bytes = int(length)
+        elif getattr(response, "_content_consumed", False):
+            self.response_bytes = len(response.content or b"")
+
+
+class RequestHook(object):
+    """
+    Base class for objects notified about every request a Requester
+    sends; override the methods you need.
+
+    A tracing hook would typically start a span in ``request_started``,
+    keep it in ``event.context`` and end it in ``request_finished``.
+    """
+
+    def request_started(self, event: RequestEvent) -> None:
+        pass
+
+    def request_finished(self, event: RequestEvent) -> None:
+        pass
+
+    def response_decoded(self, event: RequestEvent, seconds) -> None:
+        """
+        Called after JenkinsBase decoded the payload of a response; event
+        is the one of the request that returned the response.
+        """
+        pass
+
+
+class _EndpointStats(object):
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_codes = Counter()
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.response_bytes = 0
+        self.decode_count = 0
+        self.decode_seconds = 0.0
+
+    def snapshot(self, buckets) -> dict:
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip(
+            list(buckets) + [float("inf")], self.bucket_counts
+        ):
+            cumulative += count
+            histogram[bound] = cumulative
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "status_codes": dict(self.status_codes),
+            "latency": {
+                "sum": self.latency_sum,
+                "count": self.count,
+                "buckets": histogram,
+            },
+            "response_bytes": self.response_bytes,
+            "decode": {
+                "count": self.decode_count,
+                "seconds": self.decode_seconds,
+            },
+        }
+
+
+class RequestMetrics(RequestHook):
+    """
+    A request hook aggregating request count, latency histogram, response
+    bytes, decode time, status codes and retries per method and endpoint
+    pattern (see :func:`endpoint_pattern`).
+
+    Usage::
+
+        metrics = RequestMetrics()
+        requester = Requester(baseurl=url, hooks=[metrics])
+        jenkins = Jenkins(url, requester=requester)
+        ...
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        :param buckets: sorted upper bounds (seconds) of the latency
+            histogram buckets
+        """
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, method, pattern) -> _EndpointStats:
+        key = (method, pattern)
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = _EndpointStats(self.buckets)
+        return stats
+
+    def request_finished(self, event: RequestEvent) -> None:
+        pattern = event.pattern
+        with self._lock:
+            stats = self._stats(event.method, pattern)
+            stats.count += 1
+            if event.error is not None:
+                stats.errors += 1
+                stats.status_codes["error"] += 1
+            else:
+                stats.status_codes[str(event.status_code)] += 1
+            if event.is_retry:
+                stats.retries += 1
+            stats.bucket_counts[
+                bisect.bisect_left(self.buckets, event.elapsed)
+            ] += 1
+            stats.latency_sum += event.elapsed
+            stats.response_bytes += event.response_bytes
+
+    def response_decoded(self, event: RequestEvent, seconds) -> None:
+        pattern = event.pattern
+        with self._lock:
+            stats = self._stats(event.method, pattern)
+            stats.decode_count += 1
+            stats.decode_seconds += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the metrics as ``{"<METHOD> <pattern>": {...}}``.
+        """
+        with self._lock:
+            return {
+                "%s %s" % key: stats.snapshot(self.buckets)
+                for key, stats in sorted(self._endpoints.items())
+            }
+
+    def to_prometheus(self, prefix="jenkinsapi") -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            endpoints = sorted(
+                (key, stats.snapshot(self.buckets))
+                for key, stats in self._endpoints.items()
+            )
+        families = [
+            ("requests_total", "counter", "Requests sent to Jenkins."),
+            (
+                "request_retries_total",
+                "counter",
+                "Requests that were retries.",
+            ),
+            (
+                "response_bytes_total",
+                "counter",
+                "Response body bytes received.",
+            ),
+            (
+                "request_duration_seconds",
+                "histogram",
+                "Time until the response headers were received.",
+            ),
+            (
+                "decode_duration_seconds",
+                "summary",
+                "Time spent decoding API responses.",
+            ),
+        ]
+        samples = {name: [] for name, _, _ in families}
+        for (method, pattern), stats in endpoints:
+            labels = 'method="%s",endpoint="%s"' % (
+                _escape(method),
+                _escape(pattern),
+            )
+            for status, count in sorted(stats["status_codes"].items()):
+                samples["requests_total"].append(
+                    '{%s,status="%s"} %d' % (labels, _escape(status), count)
+                )
+            samples["request_retries_total"].append(
+                "{%s} %d" % (labels, stats["retries"])
+            )
+            samples["response_bytes_total"].append(
+                "{%s} %d" % (labels, stats["response_bytes"])
+            )
+            latency = stats["latency"]
+            for bound, count in latency["buckets"].items():
+                samples["request_duration_seconds"].append(
+                    '_bucket{%s,le="%s"} %d'
+                    % (labels, _format_bound(bound), count)
+                )
+            samples["request_duration_seconds"].append(
+                "_sum{%s} %r" % (labels, latency["sum"])
+            )
+            samples["request_duration_seconds"].append(
+                "_count{%s} %d" % (labels, latency["count"])
+            )
+            if stats["decode"]["count"]:
+                samples["decode_duration_seconds"].append(
+                    "_sum{%s} %r" % (labels, stats["decode"]["seconds"])
+                )
+                samples["decode_duration_seconds"].append(
+                    "_count{%s} %d" % (labels, stats["decode"]["count"])
+                )
+        lines = []
+        for name, kind, help_text in families:
+            metric = "%s_%s" % (prefix, name)
+            lines.append("# HELP %s %s" % (metric, help_text))
+            lines.append("# TYPE %s %s" % (metric, kind))
+            lines.extend(metric + sample for sample in samples[name])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _format_bound(bound) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
@@ -0,0 +1,543 @@
+"""
+A local SQLite mirror of the build history of a Jenkins server.
+
+Completed builds never change, so they are only fetched once: every job
+keeps a watermark, the number below which all its builds are mirrored, and
+a sync only requests the builds above it. The job listing tells which jobs
+have new builds, so a sync of an unchanged server is one request.
+
+Usage::
+
+    with JenkinsMirror(jenkins, "/var/cache/myapp/jenkins.db") as mirror:
+        mirror.sync()
+        failures = mirror.builds(job="my-job", result="FAILURE")
+        history = mirror.test_case_history("my-job", "tests.test_x.test_y")
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from urllib.parse import quote, urljoin
+
+import pytz
+from requests import HTTPError
+
+from jenkinsapi import config
+from jenkinsapi.custom_exceptions import JenkinsAPIException
+
+log = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS jobs (
+    name TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    watermark INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS builds (
+    job TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    result TEXT,
+    timestamp INTEGER,
+    duration INTEGER,
+    PRIMARY KEY (job, number)
+);
+CREATE INDEX IF NOT EXISTS builds_timestamp ON builds (timestamp);
+CREATE TABLE IF NOT EXISTS test_cases (
+    job TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    class_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT,
+    duration REAL,
+    PRIMARY KEY (job, number, class_name, name)
+);
+CREATE INDEX IF NOT EXISTS test_cases_case
+    ON test_cases (job, class_name, name);
+CREATE TABLE IF NOT EXISTS artifacts (
+    job TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    relative_path TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    PRIMARY KEY (job, number, relative_path)
+);
+"""
+
+BUILDS_TREE = (
+    "allBuilds[number,url,result,building,timestamp,duration,"
+    "artifacts[fileName,relativePath],actions[totalCount]]{%d,%d}"
+)
+CASES_TREE = "cases[className,name,status,duration]"
+TEST_REPORT_TREE = "suites[%s],childReports[result[suites[%s]]]" % (
+    CASES_TREE,
+    CASES_TREE,
+)
+
+
+@dataclass(frozen=True)
+class MirroredBuild:
+    """A completed build, as kept by a JenkinsMirror"""
+
+    job: str
+    number: int
+    url: str
+    result: str | None
+    timestamp: datetime.datetime
+    duration: datetime.timedelta
+
+
+@dataclass(frozen=True)
+class MirroredTestCase:
+    """The outcome of a test case in a build, as kept by a JenkinsMirror"""
+
+    job: str
+    number: int
+    class_name: str
+    name: str
+    status: str | None
+    duration: float | None
+
+    def identifier(self) -> str:
+        """The id of the case, as Result.identifier()"""
+        return "%s.%s" % (self.class_name, self.name)
+
+
+@dataclass(frozen=True)
+class MirroredArtifact:
+    """An artifact of a build, as kept by a JenkinsMirror"""
+
+    job: str
+    number: int
+    relative_path: str
+    file_name: str
+    url: str
+
+
+@dataclass
+class SyncStats:
+    """What a JenkinsMirror.sync() fetched"""
+
+    jobs: int = 0
+    updated_jobs: int = 0
+    builds: int = 0
+    test_cases: int = 0
+    seconds: float = 0.0
+
+
+class _JobSync(object):
+    """The builds of one job fetched by a sync, newest first"""
+
+    def __init__(self, name, url, watermark, last_number):
+        self.name = name
+        self.url = url
+        self.watermark = watermark
+        self.last_number = last_number
+        self.builds = []
+        self.done = False
+
+    def add_page(self, page, page_size):
+        for build in page:
+            if build["number"] <= self.watermark:
+                self.done = True
+                return
+            self.builds.append(build)
+        self.done = len(page) < page_size
+
+    def new_watermark(self):
+        """
+        The number below which every build is now mirrored: below the
+        oldest build still running.
+        """
+        running = [b["number"] for b in self.builds if b.get("building")]
+        if running:
+            return min(running) - 1
+        return max(
+            [self.last_number, self.watermark]
+            + [b["number"] for b in self.builds]
+        )
+
+    def completed_builds(self):
+        watermark = self.new_watermark()
+        return [
+            build
+            for build in self.builds
+            if build["number"] <= watermark and not build.get("building")
+        ]
+
+
+class JenkinsMirror(object):
+    """
+    Keep the builds, results, durations, test cases and artifacts of the
+    jobs of a Jenkins server in a local SQLite file, and query them without
+    contacting the server.
+
+    :param jenkins: Jenkins obj of the server to mirror
+    :param path: path of the SQLite file, created if missing
+    :param test_reports: also mirror the test cases of every build
+    :param page_size: builds requested at once for a job, default
+        config.MIRROR_PAGE_SIZE
+    :param max_workers: maximum number of requests in flight
+    """
+
+    def __init__(
+        self,
+        jenkins: "Jenkins",
+        path: str,
+        test_reports: bool = True,
+        page_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self.jenkins = jenkins
+        self.path = path
+        self.test_reports = test_reports
+        self.page_size = page_size or config.MIRROR_PAGE_SIZE
+        self.max_workers = max_workers
+        self.connection = sqlite3.connect(path)
+        self._init_schema()
+
+    def _init_schema(self):
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise JenkinsAPIException(
+                "%s is a mirror of schema version %d, not %d"
+                % (self.path, version, SCHEMA_VERSION)
+            )
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(
+                "PRAGMA user_version = %d" % SCHEMA_VERSION
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('baseurl', ?)",
+                (self.jenkins.baseurl,),
+            )
+        (baseurl,) = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'baseurl'"
+        ).fetchone()
+        if baseurl != self.jenkins.baseurl:
+            raise JenkinsAPIException(
+                "%s is a mirror of %s, not of %s"
+                % (self.path, baseurl, self.jenkins.baseurl)
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Sync
+
+    def sync(self, jobs=None) -> SyncStats:
+        """
+        Fetch the builds completed since the previous sync.
+
+        Jobs whose last build is mirrored cost nothing besides the job
+        listing; the others are fetched concurrently, one page of builds
+        at a time. Builds deleted on the server are kept in the mirror. A
+        job whose last build number went back (it was recreated) is
+        mirrored again from scratch.
+
+        :param jobs: full names of the jobs to sync, default all jobs
+        :return: SyncStats
+        """
+        start = time.perf_counter()
+        stats = SyncStats()
+        wanted = set(jobs) if jobs is not None else None
+        watermarks = dict(
+            self.connection.execute("SELECT name, watermark FROM jobs")
+        )
+        pending = []
+        for job in self.jenkins.iter_jobs(fields=["lastBuild[number]"]):
+            name = job.get_full_name()
+            if wanted is not None and name not in wanted:
+                continue
+            stats.jobs += 1
+            last_build = job._data.get("lastBuild")
+            last_number = last_build["number"] if last_build else 0
+            watermark = watermarks.get(name, 0)
+            if last_number < watermark:
+                log.info("%s was recreated, mirroring it again", name)
+                self._forget_job(name)
+                watermark = 0
+            if last_number > watermark or name not in watermarks:
+                pending.append(
+                    _JobSync(name, job.baseurl, watermark, last_number)
+                )
+        stats.updated_jobs = len(pending)
+        offset = 0
+        while pending:
+            self._fetch_pages(pending, offset)
+            self._store([sync for sync in pending if sync.done], stats)
+            pending = [sync for sync in pending if not sync.done]
+            offset += self.page_size
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _fetch_pages(self, syncs, offset):
+        urls = [self.jenkins.python_api_url(sync.url) for sync in syncs]
+        tree = BUILDS_TREE % (offset, offset + self.page_size)
+        results = self.jenkins.get_data_many(
+            urls, tree=tree, max_workers=self.max_workers
+        )
+        for sync, result in zip(syncs, results):
+            if result.error is not None:
+                raise result.error
+            sync.add_page(result.data.get("allBuilds", []), self.page_size)
+
+    def _store(self, syncs, stats):
+        completed = [(sync, sync.completed_builds()) for sync in syncs]
+        reports = self._fetch_test_reports(
+            [
+                build
+                for _, builds in completed
+                for build in builds
+                if _total_count(build)
+            ]
+        )
+        for sync, builds in completed:
+            with self.connection:
+                for build in builds:
+                    stats.test_cases += self._insert_build(
+                        sync.name, build, reports.get(build["url"], [])
+                    )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?)",
+                    (sync.name, sync.url, sync.new_watermark(), time.time()),
+                )
+            stats.builds += len(builds)
+
+    def _fetch_test_reports(self, builds):
+        """Return the test cases of builds, by build url"""
+        if not self.test_reports or not builds:
+            return {}
+        urls = [
+            self.jenkins.python_api_url(urljoin(build["url"], "testReport"))
+            for build in builds
+        ]
+        reports = {}
+        for build, result in zip(
+            builds,
+            self.jenkins.get_data_many(
+                urls, tree=TEST_REPORT_TREE, max_workers=self.max_workers
+            ),
+        ):
+            error = result.error
+            if error is None:
+                reports[build["url"]] = list(_iter_cases(result.data))
+            elif (
+                isinstance(error, HTTPError)
+                and error.response is not None
+                and error.response.status_code == 404
+            ):
+                log.info("%s has no test report", build["url"])
+            else:
+                raise error
+        return reports
+
+    def _insert_build(self, job_name, build, cases):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                job_name,
+                build["number"],
+                build["url"],
+                build.get("result"),
+                build.get("timestamp"),
+                build.get("duration"),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?)",
+            [
+                (
+                    job_name,
+                    build["number"],
+                    artifact["relativePath"],
+                    artifact["fileName"],
+                )
+                for artifact in build.get("artifacts") or []
+            ],
+        )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO test_cases VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    job_name,
+                    build["number"],
+                    case.get("className", ""),
+                    case.get("name", ""),
+                    case.get("status"),
+                    case.get("duration"),
+                )
+                for case in cases
+            ],
+        )
+        return len(cases)
+
+    def _forget_job(self, job_name):
+        with self.connection:
+            for table in ("test_cases", "artifacts", "builds"):
+                self.connection.execute(
+                    "DELETE FROM %s WHERE job = ?" % table, (job_name,)
+                )
+            self.connection.execute(
+                "DELETE FROM jobs WHERE name = ?", (job_name,)
+            )
+
+    # Queries
+
+    def job_names(self) -> list[str]:
+        """Full names of the mirrored jobs"""
+        return [
+            row[0]
+            for row in self.connection.execute(
+                "SELECT name FROM jobs ORDER BY name"
+            )
+        ]
+
+    def get_watermark(self, job_name: str) -> int:
+        """
+        The build number of job_name below which every build is mirrored,
+        0 if the job is not mirrored.
+        """
+        row = self.connection.execute(
+            "SELECT watermark FROM jobs WHERE name = ?", (job_name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def builds(
+        self,
+        job: str | None = None,
+        result: str | None = None,
+        since: datetime.datetime | None = None,
+        until: datetime.datetime | None = None,
+    ) -> list[MirroredBuild]:
+        """
+        Return the mirrored builds, oldest first.
+
+        :param job: full name of a job, default all jobs
+        :param result: a build result such as "FAILURE"
+        :param since: only builds started at or after this time (naive
+            datetimes are taken as UTC)
+        :param until: only builds started before this time
+        """
+        conditions = []
+        args = []
+        if job is not None:
+            conditions.append("job = ?")
+            args.append(job)
+        if result is not None:
+            conditions.append("result = ?")
+            args.append(result)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            args.append(_to_millis(since))
+        if until is not None:
+            conditions.append("timestamp < ?")
+            args.append(_to_millis(until))
+        query = "SELECT * FROM builds"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY timestamp, job, number"
+        return [
+            MirroredBuild(
+                job=row[0],
+                number=row[1],
+                url=row[2],
+                result=row[3],
+                timestamp=_from_millis(row[4] or 0),
+                duration=datetime.timedelta(milliseconds=row[5] or 0),
+            )
+            for row in self.connection.execute(query, args)
+        ]
+
+    def test_case_history(
+        self, job: str, identifier: str
+    ) -> list[MirroredTestCase]:
+        """
+        Return the outcomes of a test case in the builds of a job, oldest
+        build first.
+
+        :param job: full name of the job
+        :param identifier: id of the case, ``<className>.<name>`` (see
+            Result.identifier())
+        """
+        # the class name may hold dots, and so may the test name: look the
+        # case up (through the test_cases_case index) at every split
+        cases = []
+        start = identifier.find(".")
+        while start != -1:
+            cases.extend(
+                self.connection.execute(
+                    "SELECT * FROM test_cases WHERE job = ? "
+                    "AND class_name = ? AND name = ?",
+                    (job, identifier[:start], identifier[start + 1 :]),
+                )
+            )
+            start = identifier.find(".", start + 1)
+        cases.sort(key=lambda row: row[1])
+        return [MirroredTestCase(*row) for row in cases]
+
+    def artifacts(
+        self, job: str, number: int | None = None
+    ) -> list[MirroredArtifact]:
+        """
+        Return the artifacts of a build of a job, or of all its builds.
+        """
+        query = (
+            "SELECT artifacts.*, builds.url FROM artifacts "
+            "JOIN builds USING (job, number) WHERE job = ?"
+        )
+        args = [job]
+        if number is not None:
+            query += " AND number = ?"
+            args.append(number)
+        query += " ORDER BY number, relative_path"
+        return [
+            MirroredArtifact(
+                job=row[0],
+                number=row[1],
+                relative_path=row[2],
+                file_name=row[3],
+                url="%sartifact/%s" % (row[4], quote(row[2])),
+            )
+            for row in self.connection.execute(query, args)
+        ]
+
+
+def _total_count(build):
+    for action in build.get("actions") or []:
+        if action and action.get("totalCount"):
+            return action["totalCount"]
+    return 0
+
+
+def _iter_cases(report):
+    """The cases of a test report, as ResultSet.iteritems() reads them"""
+    for suite in report.get("suites", []):
+        yield from suite.get("cases", [])
+    for child in report.get("childReports", []):
+        if child.get("result"):
+            for suite in child["result"].get("suites", []):
+                yield from suite.get("cases", [])
+
+
+def _to_millis(moment):
+    if moment.tzinfo is None:
+        moment = pytz.utc.localize(moment)
+    return int(moment.timestamp() * 1000)
+
+
+def _from_millis(millis):
+    return datetime.datetime.fromtimestamp(millis / 1000.0, pytz.utc)
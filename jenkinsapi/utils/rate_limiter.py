@@ -0,0 +1,295 @@
+"""
+Client-side rate limiting and concurrency caps for the Requester
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+ALL = "all"
+API_READ = "api"
+CONSOLE_READ = "console"
+MUTATION = "mutation"
+ENDPOINT_CLASSES = (API_READ, CONSOLE_READ, MUTATION)
+
+CONSOLE_ENDPOINTS = frozenset(["console", "consoleText", "consoleFull"])
+READ_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+
+def classify(method, url) -> str:
+    """
+    Return the endpoint class of a request: MUTATION for anything but
+    reads, CONSOLE_READ for build logs and API_READ for the rest.
+    """
+    if method.upper() not in READ_METHODS:
+        return MUTATION
+    path = urlsplit(url).path.rstrip("/")
+    if path.rsplit("/", 1)[-1] in CONSOLE_ENDPOINTS or "/logText/" in path:
+        return CONSOLE_READ
+    return API_READ
+
+
+@dataclass(frozen=True)
+class Limit:
+    """
+    :param rate: sustained requests per second, None for no rate limit
+    :param burst: requests allowed back to back before the rate applies,
+        defaults to the rate rounded up
+    :param max_in_flight: maximum concurrent requests, None for no cap
+    """
+
+    rate: float | None = None
+    burst: int | None = None
+    max_in_flight: int | None = None
+
+    def __post_init__(self):
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+
+class TokenBucket(object):
+    """
+    A token bucket handing out reservations: a caller takes a token even
+    when the bucket is empty and is told how long to wait for it, so that
+    waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, return the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+def base_key(url) -> str:
+    """
+    Return the ``host[:port]/path`` of a url, without the trailing slash:
+    the key of the limits of a Jenkins base url.
+    """
+    parts = urlsplit(url if "//" in url else "//" + url)
+    return parts.netloc + parts.path.rstrip("/")
+
+
+class _Slot(object):
+    """Rate and concurrency limit of one (base url, endpoint class) pair."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.bucket = None
+        if limit.rate is not None:
+            burst = limit.burst or max(1, math.ceil(limit.rate))
+            self.bucket = TokenBucket(limit.rate, burst)
+        self.semaphore = None
+        if limit.max_in_flight is not None:
+            self.semaphore = threading.BoundedSemaphore(limit.max_in_flight)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.wait_time = 0.0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def acquire(self) -> None:
+        start = time.monotonic()
+        delay = self.bucket.reserve() if self.bucket is not None else 0.0
+        if delay:
+            time.sleep(delay)
+        if self.semaphore is not None:
+            self.semaphore.acquire()
+        waited = time.monotonic() - start
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if delay or waited > 0.001:
+                self.throttled += 1
+                self.wait_time += waited
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "wait_time": self.wait_time,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+            }
+
+
+class RateLimiter(object):
+    """
+    Token-bucket rate limits and max-in-flight caps, applied per Jenkins
+    base url and per endpoint class (API_READ, CONSOLE_READ, MUTATION),
+    plus an optional cap (ALL) on every request to a base url.
+
+    A request counts against the longest base url it is under: one
+    configured in base_limits, or the base url of the Requester sending
+    it. Requests under neither are limited per host.
+
+    One limiter is meant to be shared by every client talking to the same
+    controller(s) from a process; Jenkins objects created with
+    ``_clone()`` or ``get_jenkins_obj_from_url()`` share their parent's
+    requester and therefore its limiter.
+
+    Usage::
+
+        limiter = RateLimiter(
+            limits={
+                ALL: Limit(max_in_flight=16),
+                API_READ: Limit(rate=20, burst=40),
+                CONSOLE_READ: Limit(rate=2, max_in_flight=2),
+                MUTATION: Limit(rate=1, max_in_flight=1),
+            },
+            base_limits={
+                "https://ci.example.com/jenkins": {ALL: Limit(max_in_flight=4)}
+            },
+        )
+        jenkins = Jenkins(url, rate_limiter=limiter)
+        ...
+        print(limiter.stats())
+    """
+
+    def __init__(self, limits=None, base_limits=None):
+        """
+        :param limits: dict mapping ALL or an endpoint class to a Limit,
+            applied to every base url
+        :param base_limits: dict mapping a Jenkins base url (or a
+            ``host[:port]``) to a dict like limits, overriding it for the
+            requests under that url
+        """
+        self.limits = dict(limits or {})
+        self.base_limits = {
+            base_key(base): dict(base_limit)
+            for base, base_limit in (base_limits or {}).items()
+        }
+        for key in list(self.limits) + [
+            key
+            for base_limit in self.base_limits.values()
+            for key in base_limit
+        ]:
+            if key != ALL and key not in ENDPOINT_CLASSES:
+                raise ValueError("Unknown endpoint class %r" % key)
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, base, endpoint_class) -> Limit | None:
+        base_limit = self.base_limits.get(base_key(base), {})
+        if endpoint_class in base_limit:
+            return base_limit[endpoint_class]
+        return self.limits.get(endpoint_class)
+
+    def base_for(self, url, base=None) -> str:
+        """
+        Return the key of the base url the limits of a request to url
+        apply to; base is the base url of the requester sending it.
+        """
+        key = base_key(url)
+        candidates = list(self.base_limits)
+        if base:
+            candidates.append(base_key(base))
+        matches = [
+            candidate
+            for candidate in candidates
+            if key == candidate or key.startswith(candidate + "/")
+        ]
+        return max(matches, key=len) if matches else urlsplit(url).netloc
+
+    def _slot(self, base, endpoint_class) -> _Slot | None:
+        key = (base, endpoint_class)
+        with self._lock:
+            if key not in self._slots:
+                limit = self.limit_for(base, endpoint_class)
+                self._slots[key] = _Slot(limit) if limit else None
+            return self._slots[key]
+
+    def acquire(self, method, url, base=None):
+        """
+        Wait until a request may be sent and take its in-flight slots.
+
+        :param base: base url of the requester sending the request
+        :return: a function releasing the slots; calls after the first do
+            nothing
+        """
+        base = self.base_for(url, base)
+        # Always acquire the endpoint class before ALL so that concurrent
+        # callers cannot deadlock on the two semaphores.
+        slots = [
+            slot
+            for slot in (
+                self._slot(base, classify(method, url)),
+                self._slot(base, ALL),
+            )
+            if slot is not None
+        ]
+        acquired = []
+        try:
+            for slot in slots:
+                slot.acquire()
+                acquired.append(slot)
+        except BaseException:
+            for slot in reversed(acquired):
+                slot.release()
+            raise
+        lock = threading.Lock()
+
+        def release():
+            with lock:
+                held = list(acquired)
+                acquired.clear()
+            for slot in reversed(held):
+                slot.release()
+
+        return release
+
+    @contextmanager
+    def limit(self, method, url, base=None):
+        """
+        Wait until a request may be sent and hold its in-flight slots
+        until the block exits.
+        """
+        release = self.acquire(method, url, base)
+        try:
+            yield
+        finally:
+            release()
+
+    def stats(self) -> dict:
+        """
+        Return ``{base url: {endpoint class: counters}}`` for every
+        limited pair that has seen a request. Base urls are given as
+        ``host[:port]/path``.
+        """
+        with self._lock:
+            slots = list(self._slots.items())
+        stats = {}
+        for (base, endpoint_class), slot in slots:
+            if slot is not None:
+                stats.setdefault(base, {})[endpoint_class] = slot.stats()
+        return stats
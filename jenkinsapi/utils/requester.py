@@ -2,13 +2,21 @@
 Module for jenkinsapi requester (which is a wrapper around python-requests)
 """
 
+from __future__ import annotations
+
+import itertools
 import logging
 import time
 import requests
 import urllib.parse as urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Iterator
 
 from jenkinsapi.custom_exceptions import JenkinsAPIException, PostRequired
 from jenkinsapi.utils.logging import configure_logging
+from jenkinsapi.utils.metrics import RequestEvent
+from jenkinsapi.utils.trace import jenkinsapi_stack, submitted_from
 
 # import logging
 
@@ -29,6 +37,38 @@ from jenkinsapi.utils.logging import configure_logging
 # requests_log.propagate = True
 
 
+def request_key(url, params=None) -> tuple:
+    """
+    Return a hashable key identifying a GET of url with params.
+    """
+    if not params:
+        return (url,)
+    return (url,) + tuple(
+        sorted((str(key), str(value)) for key, value in params.items())
+    )
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one request issued by :meth:`Requester.get_many`.
+
+    Exactly one of ``response`` and ``error`` is set. ``data`` is only
+    filled in by :meth:`jenkinsapi.jenkinsbase.JenkinsBase.get_data_many`.
+    """
+
+    index: int
+    url: str
+    params: dict | None = None
+    response: requests.Response | None = None
+    error: Exception | None = None
+    data: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class Requester(object):
     """
     A class which carries out HTTP requests. You can replace this
@@ -42,6 +82,7 @@ class Requester(object):
         200,
     ]
     AUTH_COOKIE = None
+    MAX_WORKERS = 8
 
     def __init__(self, *args, **kwargs):
         username = None
@@ -68,6 +109,7 @@ class Requester(object):
             raise ValueError("To much positional arguments given!")
 
         baseurl = kwargs.get("baseurl", baseurl)
+        self.baseurl = baseurl
         self.base_scheme = (
             urlparse.urlsplit(baseurl).scheme if baseurl else None
         )
@@ -86,14 +128,17 @@ class Requester(object):
         self.ssl_verify = kwargs.get("ssl_verify", ssl_verify)
         self.cert = kwargs.get("cert", cert)
         self.timeout = kwargs.get("timeout", timeout)
+        self.cache = kwargs.get("cache", None)
+        self.retry_policy = kwargs.get("retry_policy", None)
+        self.rate_limiter = kwargs.get("rate_limiter", None)
+        self.hooks = list(kwargs.get("hooks", None) or [])
+        self.single_flight = kwargs.get("single_flight", None)
         self.session = requests.Session()
         self.max_retries = kwargs.get("max_retries", max_retries)
+        self.pool_maxsize = requests.adapters.DEFAULT_POOLSIZE
+        self._adapter = None
         if self.max_retries is not None:
-            retry_adapter = requests.adapters.HTTPAdapter(
-                max_retries=self.max_retries
-            )
-            self.session.mount("http://", retry_adapter)
-            self.session.mount("https://", retry_adapter)
+            self._mount_adapter()
         configure_logging()
         self._log = logging.getLogger(__name__)
         self._sensitive_keys = {
@@ -107,6 +152,48 @@ class Requester(object):
             "crumb",
         }
 
+    def _mount_adapter(self):
+        retry_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_maxsize,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries
+            if self.max_retries is not None
+            else 0,
+        )
+        self.session.mount("http://", retry_adapter)
+        self.session.mount("https://", retry_adapter)
+        self._adapter = retry_adapter
+
+    def ensure_pool_size(self, size):
+        """
+        Grow the connection pool of the session so that size concurrent
+        requests to one host can each keep a connection alive.
+
+        Only the adapter mounted by this requester is resized, in place:
+        its open connections are kept. A session whose adapters were
+        mounted by the caller is left alone.
+        """
+        adapter = self._adapter
+        if size <= self.pool_maxsize or adapter is None:
+            return
+        if any(
+            self.session.adapters.get(prefix) is not adapter
+            for prefix in ("http://", "https://")
+        ):
+            return
+        self.pool_maxsize = size
+        manager = adapter.poolmanager
+        if not len(manager.pools):
+            adapter.init_poolmanager(size, size, block=adapter._pool_block)
+            return
+        # pools are keyed by their settings, maxsize included: the open
+        # pools are grown rather than replaced by new ones
+        adapter._pool_maxsize = size
+        for key in manager.pools.keys():
+            pool = manager.pools.get(key)
+            if pool is not None and pool.pool is not None:
+                pool.pool.maxsize = size
+
     def get_request_dict(
         self, params=None, data=None, files=None, headers=None, **kwargs
     ):
@@ -222,6 +309,151 @@ class Requester(object):
             )
         return url
 
+    def _send(self, method, url, requestKwargs):
+        """
+        Send a request through the session, applying the rate limiter and
+        the retry policy (if any) to connection errors and retryable
+        responses. Every attempt counts against the rate limits.
+        """
+        session_send = getattr(self.session, method.lower())
+        attempts = itertools.count(1)
+
+        def send(url, **requestKwargs):
+            attempt = next(attempts)
+            if self.rate_limiter is None:
+                return self._observe(
+                    session_send, method, url, requestKwargs, attempt
+                )
+            release = self.rate_limiter.acquire(method, url, self.baseurl)
+            try:
+                response = self._observe(
+                    session_send, method, url, requestKwargs, attempt
+                )
+            except BaseException:
+                release()
+                raise
+            if not (
+                requestKwargs.get("stream")
+                and self._release_when_read(response, release)
+            ):
+                release()
+            return response
+
+        if self.retry_policy is None:
+            return send(url, **requestKwargs)
+
+        retry_state = self.retry_policy.begin(method, url)
+        while True:
+            retry_state.before_attempt()
+            try:
+                response = send(url, **requestKwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not retry_state.should_retry(error=error):
+                    raise
+                self._log.warning(
+                    "%s %s failed: %s, retrying",
+                    method,
+                    self._redact_url(url),
+                    error,
+                )
+            else:
+                if not retry_state.should_retry(response=response):
+                    return response
+                self._log.warning(
+                    "%s %s returned %s, retrying",
+                    method,
+                    self._redact_url(url),
+                    response.status_code,
+                )
+                response.close()
+            retry_state.check_retry()
+
+    @staticmethod
+    def _release_when_read(response, release) -> bool:
+        """
+        Call release once the body of a streamed response is read or the
+        response closed, when its connection goes back to the pool.
+        Return False if the response gives no way to know that.
+        """
+        raw = getattr(response, "raw", None)
+        release_conn = getattr(raw, "release_conn", None)
+        if release_conn is None:
+            return False
+
+        def release_conn_and_slots():
+            try:
+                release_conn()
+            finally:
+                release()
+
+        raw.release_conn = release_conn_and_slots
+        return True
+
+    def _observe(self, session_send, method, url, requestKwargs, attempt):
+        """
+        Send one request attempt, notifying the request hooks.
+        """
+        if not self.hooks:
+            return session_send(url, **requestKwargs)
+
+        event = RequestEvent(
+            method, url, requestKwargs.get("params"), attempt=attempt
+        )
+        started = []
+        try:
+            for hook in self.hooks:
+                hook.request_started(event)
+                started.append(hook)
+        except Exception as error:
+            # a hook refused the request (e.g. RequestBudgetExceeded): the
+            # hooks already notified still see it finish, with the error
+            event.error = error
+            for hook in reversed(started):
+                hook.request_finished(event)
+            raise
+        start = time.perf_counter()
+        try:
+            response = session_send(url, **requestKwargs)
+            event.set_response(response)
+            # kept for response_decoded()
+            response.request_event = event
+            return response
+        except Exception as error:
+            event.error = error
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - start
+            for hook in reversed(self.hooks):
+                hook.request_finished(event)
+
+    def add_hook(self, hook):
+        """
+        Register a RequestHook (e.g. RequestMetrics) for every request.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """
+        Unregister a RequestHook added with add_hook.
+        """
+        self.hooks.remove(hook)
+
+    def response_decoded(self, url, params, seconds, response=None):
+        """
+        Report the time spent decoding the payload of a response, to the
+        hooks notified about the request that returned it.
+        """
+        if not self.hooks:
+            return
+        event = getattr(response, "request_event", None)
+        if event is None:
+            request = getattr(response, "request", None)
+            event = RequestEvent(
+                getattr(request, "method", None) or "GET", url, params
+            )
+        for hook in self.hooks:
+            hook.response_decoded(event, seconds)
+
     def get_url(
         self,
         url,
@@ -229,6 +461,35 @@ class Requester(object):
         headers=None,
         allow_redirects=True,
         stream=False,
+    ):
+        final_url = self._update_url_scheme(url)
+        if self.cache is None or stream:
+            return self._get_url(
+                final_url, params, headers, allow_redirects, stream
+            )
+
+        key = self.cache.make_key(final_url, params)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if self.cache.is_fresh(entry, final_url):
+                self.cache.record_hit(entry)
+                return entry.response
+            headers = dict(headers or {})
+            headers.update(entry.conditional_headers())
+
+        response = self._get_url(final_url, params, headers, allow_redirects)
+        if entry is not None and response.status_code == 304:
+            self.cache.record_hit(entry, revalidated=True)
+            return entry.response
+        self.cache.record_miss()
+        if response.status_code == 200:
+            self.cache.store(key, response, final_url)
+        else:
+            self.cache.discard(key)
+        return response
+
+    def _get_url(
+        self, final_url, params, headers, allow_redirects, stream=False
     ):
         requestKwargs = self.get_request_dict(
             params=params,
@@ -236,14 +497,86 @@ class Requester(object):
             allow_redirects=allow_redirects,
             stream=stream,
         )
-        final_url = self._update_url_scheme(url)
         self._log_request("GET", final_url, params, headers, None, None)
         start = time.time()
-        response = self.session.get(final_url, **requestKwargs)
+        response = self._send("GET", final_url, requestKwargs)
         status_code = getattr(response, "status_code", "unknown")
         self._log_response("GET", final_url, status_code, time.time() - start)
         return response
 
+    def get_many(
+        self,
+        urls,
+        params=None,
+        headers=None,
+        max_workers=None,
+        ordered=True,
+    ) -> Iterator[BatchResult]:
+        """
+        Issue GET requests for many urls on a bounded pool of threads which
+        share this requester's session (and connection pool).
+
+        :param urls: iterable of urls
+        :param params: a dict of query parameters used for every url, or a
+            sequence with one dict (or None) per url
+        :param headers: dict of headers used for every url
+        :param max_workers: maximum number of requests in flight, defaults
+            to MAX_WORKERS
+        :param ordered: if True results are yielded in the order of urls,
+            otherwise as soon as they complete
+        :return: iterator of BatchResult; failed requests carry the
+            exception in BatchResult.error instead of raising it.
+            Closing the iterator early cancels requests not yet started.
+        :raises ValueError: when the call is made, if params is a sequence
+            without one entry per url
+        """
+        urls = list(urls)
+        if params is None or isinstance(params, dict):
+            params_list = [params] * len(urls)
+        else:
+            params_list = list(params)
+            if len(params_list) != len(urls):
+                raise ValueError("One params entry is required per url")
+        return self._get_many(
+            urls,
+            params_list,
+            headers,
+            max_workers or self.MAX_WORKERS,
+            ordered,
+        )
+
+    def _get_many(self, urls, params_list, headers, max_workers, ordered):
+        if not urls:
+            return
+        self.ensure_pool_size(max_workers)
+        # the worker threads have none of the frames of the caller: hand
+        # its stack over to the request hooks (see RequestTrace)
+        caller_stack = jenkinsapi_stack() if self.hooks else ()
+
+        def fetch(index):
+            url = urls[index]
+            url_params = params_list[index]
+            # requests must not share (and mutate) the same params dict
+            url_params = dict(url_params) if url_params else None
+            result = BatchResult(index=index, url=url, params=url_params)
+            try:
+                with submitted_from(caller_stack):
+                    result.response = self.get_url(url, url_params, headers)
+            except Exception as error:  # pylint: disable=broad-except
+                result.error = error
+            return result
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(urls)),
+            thread_name_prefix="jenkinsapi-batch",
+        )
+        try:
+            futures = [executor.submit(fetch, idx) for idx in range(len(urls))]
+            for future in futures if ordered else as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def post_url(
         self,
         url,
@@ -265,7 +598,7 @@ class Requester(object):
         final_url = self._update_url_scheme(url)
         self._log_request("POST", final_url, params, headers, data, files)
         start = time.time()
-        response = self.session.post(final_url, **requestKwargs)
+        response = self._send("POST", final_url, requestKwargs)
         status_code = getattr(response, "status_code", "unknown")
         self._log_response("POST", final_url, status_code, time.time() - start)
         return response
@@ -0,0 +1,172 @@
+"""
+Conditional-request (ETag / Last-Modified) cache for the Requester
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from jenkinsapi.utils.requester import request_key
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response and its validators."""
+
+    response: object
+    etag: str | None = None
+    last_modified: str | None = None
+    validated_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        content = getattr(self.response, "content", None) or b""
+        return len(content)
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """
+    A size-bounded LRU cache of GET responses.
+
+    Within ``ttl`` seconds of being fetched (or revalidated) a response is
+    served without contacting Jenkins at all. Once stale, the request is
+    sent with ``If-None-Match`` / ``If-Modified-Since`` and a
+    ``304 Not Modified`` answer is served from the cache. Because the
+    cached response object is reused, the payload decoded by
+    :meth:`JenkinsBase.get_data` is reused as well.
+
+    Usage::
+
+        cache = ResponseCache(
+            max_entries=512,
+            ttl=0,
+            ttl_overrides={r"/testReport/": 3600, r"/computer/": 5},
+        )
+        jenkins = Jenkins(url, requester=Requester(baseurl=url, cache=cache))
+        ...
+        print(cache.stats())
+
+    Data returned for a cached response shares nested lists and dicts with
+    the cache, so callers must not modify it in place.
+    """
+
+    def __init__(self, max_entries=256, ttl=0, ttl_overrides=None):
+        """
+        :param max_entries: maximum number of responses kept, int
+        :param ttl: seconds a response is served without revalidation,
+            0 revalidates on every request
+        :param ttl_overrides: dict mapping regular expressions, searched in
+            the request url, to a ttl for the matching endpoints; the first
+            matching pattern wins
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttl_overrides = [
+            (re.compile(pattern), seconds)
+            for pattern, seconds in (ttl_overrides or {}).items()
+        ]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters as a dict.
+
+        ``hits`` counts every response served from the cache, of which
+        ``revalidations`` needed a (bodiless) 304 round-trip.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def make_key(url, params=None) -> tuple:
+        return request_key(url, params)
+
+    def ttl_for(self, url) -> float:
+        for pattern, seconds in self.ttl_overrides:
+            if pattern.search(url):
+                return seconds
+        return self.ttl
+
+    def get(self, key) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry, url) -> bool:
+        ttl = self.ttl_for(url)
+        return bool(ttl) and time.monotonic() - entry.validated_at < ttl
+
+    def store(self, key, response, url) -> CacheEntry | None:
+        """
+        Cache a 200 response if it carries validators or its endpoint has
+        a ttl. Returns the new entry, or None if it was not cacheable.
+        """
+        headers = getattr(response, "headers", None) or {}
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified or self.ttl_for(url)):
+            self.discard(key)
+            return None
+        entry = CacheEntry(response, etag=etag, last_modified=last_modified)
+        # Marks the response as cached; JenkinsBase keeps the decoded
+        # payload here so that cache hits are not decoded again.
+        response.cached_data = None
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def discard(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def record_hit(self, entry, revalidated=False) -> None:
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += entry.size
+            if revalidated:
+                self.revalidations += 1
+                entry.validated_at = time.monotonic()
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
@@ -1,6 +1,19 @@
+from __future__ import annotations
+
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from jenkinsapi.custom_exceptions import CircuitOpen
+
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
 
 
 class RetryConfig(ABC):
@@ -63,3 +76,292 @@ class SimpleRetryState(RetryState):
         if curr_time - self.start_time > self.config.timeout:
             raise TimeoutError("Retry timed out")
         time.sleep(self.config.sleep_period)
+
+
+def parse_retry_after(value) -> float | None:
+    """
+    Convert a ``Retry-After`` header (seconds or an HTTP date) to seconds.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryMetrics:
+    """Counters shared by every request using one RetryPolicy."""
+
+    retries: int = 0
+    gave_up: int = 0
+    retry_after_honoured: int = 0
+    breaker_trips: int = 0
+    breaker_rejections: int = 0
+    sleep_time: float = 0.0
+    retries_by_reason: dict = field(default_factory=dict)
+
+
+class CircuitBreaker(object):
+    """
+    Error-rate circuit breaker for a single host.
+
+    The breaker opens when at least ``threshold`` of the last ``window``
+    requests (and no fewer than ``min_requests``) failed. While open every
+    request is refused; after ``cooldown`` seconds a single trial request
+    is let through (half-open) which either closes or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold, window, min_requests, cooldown):
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.outcomes = deque(maxlen=window)
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.trial_started = None
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        if self.state == self.OPEN:
+            if now - self.opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+            self.trial_started = None
+        if self.state == self.HALF_OPEN:
+            if (
+                self.trial_started is not None
+                and now - self.trial_started < self.cooldown
+            ):
+                return False
+            self.trial_started = now
+        return True
+
+    def record(self, failed) -> bool:
+        """
+        Record the outcome of a request, return True if the breaker tripped.
+        """
+        if self.state == self.HALF_OPEN:
+            if failed:
+                self._open()
+                return True
+            self.state = self.CLOSED
+            self.outcomes.clear()
+            return False
+        self.outcomes.append(failed)
+        if (
+            self.state == self.CLOSED
+            and len(self.outcomes) >= self.min_requests
+            and sum(self.outcomes) >= self.threshold * len(self.outcomes)
+        ):
+            self._open()
+            return True
+        return False
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.outcomes.clear()
+
+
+@dataclass
+class RetryPolicy(RetryConfig):
+    """
+    Status-aware retries with exponential backoff, jitter and a per-host
+    circuit breaker, used by :class:`Requester` when given as
+    ``retry_policy``.
+
+    Usage::
+
+        policy = RetryPolicy(max_retries=5, backoff_factor=1)
+        requester = Requester(baseurl=url, retry_policy=policy)
+        ...
+        print(policy.stats())
+
+    Requests with a method in ``methods`` are retried after a connection
+    error or a response status in ``status_codes``, waiting
+    ``backoff_factor * 2 ** (retry - 1)`` seconds (capped by
+    ``backoff_max``, randomised with full jitter) or as long as the
+    ``Retry-After`` header asks for. Set ``breaker_threshold`` to None to
+    disable the circuit breaker.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30
+    jitter: bool = True
+    status_codes: frozenset = RETRY_STATUS_CODES
+    methods: frozenset = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    retry_after_max: float = 120
+    timeout: float | None = None
+    breaker_threshold: float | None = 0.5
+    breaker_window: int = 20
+    breaker_min_requests: int = 10
+    breaker_cooldown: float = 30
+    metrics: RetryMetrics = field(
+        default_factory=RetryMetrics, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def begin(self, method="GET", url=None) -> "RetryPolicyState":
+        return RetryPolicyState(self, method, url)
+
+    def backoff(self, retry_number) -> float:
+        """
+        Return the delay before the given (1-based) retry.
+        """
+        delay = min(
+            self.backoff_max, self.backoff_factor * 2 ** (retry_number - 1)
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def breaker_for(self, url) -> CircuitBreaker | None:
+        if self.breaker_threshold is None or not url:
+            return None
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    self.breaker_threshold,
+                    self.breaker_window,
+                    self.breaker_min_requests,
+                    self.breaker_cooldown,
+                )
+            return breaker
+
+    def allow(self, breaker) -> bool:
+        with self._lock:
+            if breaker.allow():
+                return True
+            self.metrics.breaker_rejections += 1
+            return False
+
+    def record(self, breaker, failed) -> None:
+        with self._lock:
+            if breaker is not None and breaker.record(failed):
+                self.metrics.breaker_trips += 1
+
+    def count_retry(self, reason, retry_after) -> None:
+        with self._lock:
+            metrics = self.metrics
+            metrics.retries += 1
+            metrics.retries_by_reason[reason] = (
+                metrics.retries_by_reason.get(reason, 0) + 1
+            )
+            if retry_after:
+                metrics.retry_after_honoured += 1
+
+    def count_sleep(self, delay) -> None:
+        with self._lock:
+            self.metrics.sleep_time += delay
+
+    def count_give_up(self) -> None:
+        with self._lock:
+            self.metrics.gave_up += 1
+
+    def stats(self) -> dict:
+        """
+        Return the retry and breaker counters, and the state of every
+        host's breaker, as a dict.
+        """
+        with self._lock:
+            stats = asdict(self.metrics)
+            stats["breakers"] = {
+                host: breaker.state for host, breaker in self._breakers.items()
+            }
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.metrics = RetryMetrics()
+
+
+class RetryPolicyState(RetryState):
+    """Retry state of one request made under a RetryPolicy."""
+
+    def __init__(self, policy, method="GET", url=None):
+        self.policy = policy
+        self.method = method.upper()
+        self.url = url
+        self.retries = 0
+        self.delay = None
+        self.start_time = time.monotonic()
+        self.breaker = policy.breaker_for(url)
+
+    def before_attempt(self) -> None:
+        """Raise `CircuitOpen` if the host's breaker refuses the request"""
+        if self.breaker is not None and not self.policy.allow(self.breaker):
+            raise CircuitOpen(
+                "Circuit breaker open for %s" % urlsplit(self.url).netloc
+            )
+
+    def should_retry(self, response=None, error=None) -> bool:
+        """
+        Record the outcome of an attempt and decide whether to retry it;
+        the delay is then waited for by `check_retry`.
+        """
+        status = getattr(response, "status_code", None)
+        retryable = error is not None or status in self.policy.status_codes
+        failed = retryable or (isinstance(status, int) and status >= 500)
+        self.policy.record(self.breaker, failed)
+        if not retryable or self.method not in self.policy.methods:
+            return False
+
+        retry_after = None
+        if response is not None and self.policy.respect_retry_after:
+            retry_after = parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+        delay = self._next_delay(retry_after)
+        if delay is None:
+            self.policy.count_give_up()
+            return False
+        reason = str(status) if error is None else type(error).__name__
+        self.policy.count_retry(reason, retry_after is not None)
+        return True
+
+    def _next_delay(self, retry_after=None) -> float | None:
+        if self.retries >= self.policy.max_retries:
+            return None
+        if retry_after is not None:
+            delay = min(retry_after, self.policy.retry_after_max)
+        else:
+            delay = self.policy.backoff(self.retries + 1)
+        elapsed = time.monotonic() - self.start_time
+        if (
+            self.policy.timeout is not None
+            and elapsed + delay > self.policy.timeout
+        ):
+            return None
+        self.retries += 1
+        self.delay = delay
+        return delay
+
+    def check_retry(self) -> None:
+        delay, self.delay = self.delay, None
+        if delay is None:
+            delay = self._next_delay()
+            self.delay = None
+            if delay is None:
+                raise TimeoutError("Retry budget exhausted")
+        self.policy.count_sleep(delay)
+        time.sleep(delay)
@@ -0,0 +1,180 @@
+"""
+Coalescing (single-flight) of identical concurrent API requests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class _Call(object):
+    __slots__ = ("event", "future", "result", "error", "done_at")
+
+    def __init__(self, event=None, future=None):
+        self.event = event
+        self.future = future
+        self.result = None
+        self.error = None
+        self.done_at = None
+
+
+class _SingleFlightBase(object):
+    def __init__(self, reuse_window=0.0):
+        """
+        :param reuse_window: seconds during which the result of a finished
+            call is returned to new callers, 0 to only share calls still in
+            flight
+        """
+        if reuse_window < 0:
+            raise ValueError("reuse_window must not be negative")
+        self.reuse_window = reuse_window
+        self._calls = {}
+        self._last_sweep = time.monotonic()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.executed = 0
+        self.coalesced = 0
+        self.reused = 0
+
+    def stats(self) -> dict:
+        """
+        ``executed`` calls were made, ``coalesced`` callers waited for a
+        call in flight and ``reused`` callers got a recent result.
+        """
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "reused": self.reused,
+            "in_flight": sum(
+                1
+                for call in list(self._calls.values())
+                if call.done_at is None
+            ),
+        }
+
+    def _reusable(self, call, now) -> bool:
+        return (
+            call.done_at is not None
+            and call.error is None
+            and now - call.done_at < self.reuse_window
+        )
+
+    def _finish(self, key, call, now) -> None:
+        call.done_at = now
+        if call.error is not None or not self.reuse_window:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        if now - self._last_sweep > self.reuse_window:
+            self._last_sweep = now
+            for stale_key, stale in list(self._calls.items()):
+                if stale.done_at is not None and not self._reusable(
+                    stale, now
+                ):
+                    del self._calls[stale_key]
+
+
+class SingleFlight(_SingleFlightBase):
+    """
+    Thread-safe single-flight: concurrent calls with the same key share
+    one execution of the function and its result (or exception).
+
+    Usage::
+
+        requester = Requester(
+            baseurl=url, single_flight=SingleFlight(reuse_window=0.3)
+        )
+        jenkins = Jenkins(url, requester=requester)
+
+    :meth:`JenkinsBase.get_data` then coalesces identical GETs (same url,
+    params and tree); every caller gets a shallow copy of the decoded
+    payload.
+    """
+
+    def __init__(self, reuse_window=0.0):
+        super().__init__(reuse_window)
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """
+        Call func(), unless a call for key is in flight (or finished within
+        the reuse window), in which case its result is returned instead.
+        """
+        with self._lock:
+            now = time.monotonic()
+            call = self._calls.get(key)
+            if call is not None and call.done_at is None:
+                self.coalesced += 1
+                leader = False
+            elif call is not None and self._reusable(call, now):
+                self.reused += 1
+                return call.result
+            else:
+                call = self._calls[key] = _Call(event=threading.Event())
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                self._finish(key, call, time.monotonic())
+            call.event.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return super().stats()
+
+
+class AsyncSingleFlight(_SingleFlightBase):
+    """
+    Single-flight for coroutines running on one event loop, used by
+    :class:`AsyncRequester` (``single_flight=AsyncSingleFlight()``).
+    """
+
+    async def do(self, key, func):
+        """
+        Await func(), unless a call for key is in flight (or finished within
+        the reuse window), in which case its result is returned instead.
+        """
+        now = time.monotonic()
+        call = self._calls.get(key)
+        if call is not None and call.done_at is None:
+            self.coalesced += 1
+            return await asyncio.shield(call.future)
+        if call is not None and self._reusable(call, now):
+            self.reused += 1
+            return call.result
+
+        call = self._calls[key] = _Call(
+            future=asyncio.get_running_loop().create_future()
+        )
+        self.executed += 1
+        try:
+            call.result = await func()
+            call.future.set_result(call.result)
+            return call.result
+        except asyncio.CancelledError as error:
+            call.error = error
+            call.future.cancel()
+            raise
+        except BaseException as error:
+            call.error = error
+            call.future.set_exception(error)
+            # Followers re-raise it; do not warn when there are none
+            call.future.exception()
+            raise
+        finally:
+            self._finish(key, call, time.monotonic())
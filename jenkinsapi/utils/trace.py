@@ -0,0 +1,205 @@
+"""
+Tracing of the requests made by jenkinsapi operations
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from jenkinsapi.custom_exceptions import RequestBudgetExceeded
+from jenkinsapi.utils.metrics import RequestEvent, RequestHook
+
+# The jenkinsapi stack of the thread that handed the current request over
+# to a worker thread, see submitted_from()
+_submitter_stack = ContextVar("jenkinsapi_submitter_stack", default=())
+
+
+@dataclass
+class TraceEntry:
+    """
+    One request recorded by a RequestTrace.
+
+    ``caller`` is the outermost jenkinsapi method on the stack (the one
+    called by your code); ``stack`` lists the jenkinsapi methods from
+    that one down to the method that sent the request.
+    """
+
+    method: str
+    url: str
+    params: dict | None
+    pattern: str
+    caller: str
+    stack: tuple
+    attempt: int = 1
+    status_code: int | None = None
+    response_bytes: int = 0
+    elapsed: float = 0.0
+
+
+def _qualname(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", None)
+    if name is None:
+        owner = frame.f_locals.get("self", frame.f_locals.get("cls"))
+        name = code.co_name
+        if owner is not None:
+            owner = owner if isinstance(owner, type) else type(owner)
+            name = "%s.%s" % (owner.__name__, name)
+    return name
+
+
+def jenkinsapi_stack(frame=None) -> tuple:
+    """
+    Return the qualified names of the jenkinsapi methods (outside of
+    jenkinsapi.utils) on the stack, outermost first. In a worker thread,
+    the stack of the submitting thread comes first.
+    """
+    frame = frame or sys._getframe(1)
+    names = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("jenkinsapi.") and not module.startswith(
+            "jenkinsapi.utils."
+        ):
+            names.append(_qualname(frame))
+        frame = frame.f_back
+    return _submitter_stack.get() + tuple(reversed(names))
+
+
+@contextmanager
+def submitted_from(stack):
+    """
+    Attribute the requests sent in the block, e.g. by a worker thread, to
+    the jenkinsapi methods of stack, as returned by jenkinsapi_stack() in
+    the thread that submitted the work.
+    """
+    token = _submitter_stack.set(stack)
+    try:
+        yield
+    finally:
+        _submitter_stack.reset(token)
+
+
+class RequestTrace(RequestHook):
+    """
+    A request hook recording every request, tagged with the jenkinsapi
+    method that caused it. Usually created by :meth:`Jenkins.trace`::
+
+        with jenkins.trace(max_requests=5) as trace:
+            job.get_build(42)
+        print(trace.report())
+
+    :param max_requests: raise RequestBudgetExceeded instead of sending
+        more requests than this, None for no budget
+    :param n_plus_one_threshold: number of requests to the same endpoint
+        pattern reported as an N+1 pattern
+    """
+
+    def __init__(self, max_requests=None, n_plus_one_threshold=5):
+        self.max_requests = max_requests
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.entries = []
+        self._lock = threading.Lock()
+
+    def request_started(self, event: RequestEvent) -> None:
+        stack = jenkinsapi_stack()
+        entry = TraceEntry(
+            event.method,
+            event.url,
+            event.params,
+            event.pattern,
+            caller=stack[0] if stack else "",
+            stack=stack,
+            attempt=event.attempt,
+        )
+        with self._lock:
+            if (
+                self.max_requests is not None
+                and len(self.entries) >= self.max_requests
+            ):
+                raise RequestBudgetExceeded(
+                    "Request budget of %d exceeded by %s %s (from %s)"
+                    % (
+                        self.max_requests,
+                        event.method,
+                        event.pattern,
+                        entry.caller or "unknown caller",
+                    )
+                )
+            self.entries.append(entry)
+        event.context["trace_entry"] = entry
+
+    def request_finished(self, event: RequestEvent) -> None:
+        entry = event.context.get("trace_entry")
+        if entry is not None:
+            entry.status_code = event.status_code
+            entry.response_bytes = event.response_bytes
+            entry.elapsed = event.elapsed
+
+    @property
+    def request_count(self) -> int:
+        return len(self.entries)
+
+    @property
+    def response_bytes(self) -> int:
+        return sum(entry.response_bytes for entry in self.entries)
+
+    def by_caller(self) -> Counter:
+        """Return the number of requests per calling jenkinsapi method"""
+        return Counter(entry.caller for entry in self.entries)
+
+    def by_pattern(self) -> Counter:
+        """Return the number of requests per (method, endpoint pattern)"""
+        return Counter((entry.method, entry.pattern) for entry in self.entries)
+
+    def n_plus_one(self, threshold=None) -> list:
+        """
+        Return the endpoint patterns requested at least threshold times
+        (default: n_plus_one_threshold), most requested first, as dicts
+        with ``method``, ``pattern``, ``count`` and ``callers``.
+        """
+        threshold = threshold or self.n_plus_one_threshold
+        found = []
+        for (method, pattern), count in self.by_pattern().most_common():
+            if count < threshold:
+                break
+            callers = Counter(
+                entry.caller
+                for entry in self.entries
+                if entry.method == method and entry.pattern == pattern
+            )
+            found.append(
+                {
+                    "method": method,
+                    "pattern": pattern,
+                    "count": count,
+                    "callers": dict(callers),
+                }
+            )
+        return found
+
+    def report(self) -> str:
+        """Return a human readable summary of the trace"""
+        lines = [
+            "%d requests, %d bytes" % (self.request_count, self.response_bytes)
+        ]
+        for entry in self.entries:
+            lines.append(
+                "  %s %s -> %s (%s)"
+                % (
+                    entry.method,
+                    entry.pattern,
+                    entry.status_code,
+                    " > ".join(entry.stack) or "unknown caller",
+                )
+            )
+        for suspect in self.n_plus_one():
+            lines.append(
+                "Possible N+1: %(count)d x %(method)s %(pattern)s" % suspect
+            )
+        return "\n".join(lines)
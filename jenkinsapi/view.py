@@ -11,6 +11,7 @@ import logging
 from jenkinsapi.jenkinsbase import JenkinsBase
 from jenkinsapi.job import Job
 from jenkinsapi.custom_exceptions import NotFound
+from jenkinsapi.utils.collection_cache import collection_changed
 
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -21,10 +22,16 @@ class View(JenkinsBase):
     View class
     """
 
-    def __init__(self, url: str, name: str, jenkins_obj: "Jenkins") -> None:
+    def __init__(
+        self,
+        url: str,
+        name: str,
+        jenkins_obj: "Jenkins",
+        lazy: bool | None = None,
+    ) -> None:
         self.name: str = name
         self.jenkins_obj: "Jenkins" = jenkins_obj
-        JenkinsBase.__init__(self, url)
+        JenkinsBase.__init__(self, url, lazy=lazy)
         self.deleted: bool = False
 
     def __len__(self) -> int:
@@ -54,6 +61,7 @@ class View(JenkinsBase):
         """
         url: str = f"{self.baseurl}/doDelete"
         self.jenkins_obj.requester.post_and_confirm_status(url, data="")
+        collection_changed(self.jenkins_obj, None, "views")
         self.jenkins_obj.poll()
         self.deleted = True
 
@@ -73,8 +81,9 @@ class View(JenkinsBase):
         return [a for a in self.iteritems()]
 
     def _get_jobs(self) -> Iterator[Tuple[str, str]]:
-        if "jobs" in self._data:
-            for viewdict in self._data["jobs"]:
+        data = self._fields("jobs[name,url]")
+        if "jobs" in data:
+            for viewdict in data["jobs"]:
                 yield viewdict["name"], viewdict["url"]
 
     def get_job_dict(self) -> dict:
@@ -6,6 +6,7 @@ import logging
 import json
 from jenkinsapi.view import View
 from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.utils.collection_cache import collection_changed
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +36,19 @@ class Views(object):
             tree="views[name,url]" if tree is None else tree
         )
 
+    def _load(self):
+        """
+        Poll, unless these views are cached by the Jenkins object and
+        within their ttl
+        """
+        cache = getattr(self.jenkins, "collection_cache", None)
+        if (
+            self._data is None
+            or cache is None
+            or not cache.is_current("views", self)
+        ):
+            self.poll()
+
     def __len__(self):
         return len(self.keys())
 
@@ -45,6 +59,7 @@ class Views(object):
         if view_name in self:
             self[view_name].delete()
             self.poll()
+            collection_changed(self.jenkins, self, "views")
 
     def __setitem__(self, view_name, job_names_list):
         new_view = self.create(view_name)
@@ -57,7 +72,7 @@ class Views(object):
                 raise TypeError("Job %s does not exist in Jenkins" % job_name)
 
     def __getitem__(self, view_name):
-        self.poll()
+        self._load()
         for row in self._data.get("views", []):
             if row["name"] == view_name:
                 return View(row["url"], row["name"], self.jenkins)
@@ -68,7 +83,7 @@ class Views(object):
         """
         Get the names & objects for all views
         """
-        self.poll()
+        self._load()
         for row in self._data.get("views", []):
             name = row["name"]
             url = row["url"]
@@ -85,7 +100,7 @@ class Views(object):
         """
         Get the names of all available views
         """
-        self.poll()
+        self._load()
         for row in self._data.get("views", []):
             yield row["name"]
 
@@ -136,4 +151,5 @@ class Views(object):
             )
 
         self.poll()
+        collection_changed(self.jenkins, self, "views")
         return self[view_name]
@@ -0,0 +1,7 @@
+"""
+Benchmarks for jenkinsapi.
+
+These are not collected by pytest; run them as modules, e.g.::
+
+    python -m jenkinsapi_tests.benchmarks.bench_async
+"""
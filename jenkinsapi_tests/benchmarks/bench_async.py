@@ -0,0 +1,68 @@
+"""
+Compare the throughput of the synchronous client with AsyncJenkins when
+fetching every job (and its last build) of a server.
+
+    python -m jenkinsapi_tests.benchmarks.bench_async [num_jobs] [latency]
+"""
+
+import argparse
+import asyncio
+import time
+
+from jenkinsapi.async_jenkins import AsyncJenkins
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.fake_jenkins import FakeJenkins
+
+
+def run_sync(baseurl):
+    jenkins = Jenkins(baseurl, use_crumb=False)
+    for _, job in jenkins.get_jobs():
+        job.get_last_build()
+
+
+async def run_async(baseurl, max_concurrency):
+    async with AsyncJenkins(
+        baseurl, use_crumb=False, max_concurrency=max_concurrency
+    ) as jenkins:
+        jobs = await jenkins.get_jobs()
+        await asyncio.gather(*(job.get_last_build() for _, job in jobs))
+
+
+def measure(server, func, *args):
+    start_count = server.request_count
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start, server.request_count - start_count
+
+
+def run(num_jobs=200, latency=0.02):
+    with FakeJenkins(jobs=num_jobs, builds=1, latency=latency) as server:
+        print(
+            "%d jobs, %.0f ms simulated latency per request"
+            % (num_jobs, latency * 1000)
+        )
+        elapsed, requests = measure(server, run_sync, server.baseurl)
+        print(
+            "sync          %7.2fs %6d requests %8.1f req/s"
+            % (elapsed, requests, requests / elapsed)
+        )
+        for concurrency in (8, 32, 128):
+            elapsed, requests = measure(
+                server,
+                lambda: asyncio.run(run_async(server.baseurl, concurrency)),
+            )
+            print(
+                "async (%3d)   %7.2fs %6d requests %8.1f req/s"
+                % (concurrency, elapsed, requests, requests / elapsed)
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("num_jobs", type=int, nargs="?", default=200)
+    parser.add_argument("latency", type=float, nargs="?", default=0.02)
+    run(**vars(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Measure decode time and peak memory of large API payloads: the former
+``api/python`` text path (``response.text``, failing ``json.loads`` and the
+True/False/None replace fallback) against ``api/json`` bytes decoded by
+every available decoder.
+
+    python -m jenkinsapi_tests.benchmarks.bench_decode [scale]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import requests
+
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils import json_decoder
+
+
+def computer_payload(scale):
+    """Roughly what ``computer/api/json?depth=2`` returns."""
+    executor = {
+        "currentExecutable": None,
+        "idle": True,
+        "likelyStuck": False,
+        "number": 0,
+        "progress": -1,
+    }
+    return {
+        "busyExecutors": 0,
+        "computer": [
+            {
+                "actions": [{}, {"_class": "hudson.slaves.NodeProvisioner"}],
+                "assignedLabels": [{"name": "agent-%d" % idx}],
+                "description": "Agent %d running True builds" % idx,
+                "displayName": "agent-%d" % idx,
+                "executors": [dict(executor, number=n) for n in range(8)],
+                "idle": idx % 2 == 0,
+                "jnlpAgent": True,
+                "monitorData": {
+                    "hudson.node_monitors.DiskSpaceMonitor": {
+                        "path": "/var/lib/jenkins",
+                        "size": 123456789012,
+                    },
+                    "hudson.node_monitors.ResponseTimeMonitor": {
+                        "average": 42
+                    },
+                },
+                "numExecutors": 8,
+                "offline": False,
+                "offlineCause": None,
+                "temporarilyOffline": False,
+            }
+            for idx in range(scale)
+        ],
+        "totalExecutors": 8 * scale,
+    }
+
+
+def testreport_payload(scale):
+    """Roughly what ``<build>/testReport/api/json`` returns."""
+    return {
+        "duration": 1234.5,
+        "failCount": 3,
+        "passCount": 40 * scale - 3,
+        "skipCount": 0,
+        "suites": [
+            {
+                "cases": [
+                    {
+                        "className": "pkg.module%d.TestCase" % idx,
+                        "duration": 0.01 * case,
+                        "errorDetails": None,
+                        "errorStackTrace": None,
+                        "name": "test_%d_returns_None_or_False" % case,
+                        "skipped": False,
+                        "status": "PASSED",
+                        "stdout": "x" * 80,
+                    }
+                    for case in range(40)
+                ],
+                "name": "pkg.module%d" % idx,
+            }
+            for idx in range(scale)
+        ],
+    }
+
+
+def make_response(payload, python_syntax=False):
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    text = json.dumps(payload)
+    if python_syntax:
+        # api/python uses JSON quoting with Python's True, False and None
+        text = (
+            text.replace("true", "True")
+            .replace("false", "False")
+            .replace("null", "None")
+        )
+    response._content = text.encode("utf-8")
+    return response
+
+
+def legacy_decode(response):
+    text = response.text
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(
+            text.replace("True", "true")
+            .replace("False", "false")
+            .replace("None", "null")
+        )
+
+
+def current_decode(response):
+    return JenkinsBase._parse_data_response("bench", response)
+
+
+def measure(func, response, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(response)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(response)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(scale=1500):
+    previous = json_decoder.get_decoder()
+    for name, payload in (
+        ("computer?depth=2", computer_payload(scale)),
+        ("testReport", testreport_payload(scale)),
+    ):
+        python_response = make_response(payload, python_syntax=True)
+        json_response = make_response(payload)
+        print("%s: %.1f MB" % (name, len(json_response.content) / 1024.0**2))
+        elapsed, peak = measure(legacy_decode, python_response)
+        rows = [("api/python text + replace", elapsed, peak)]
+        for decoder in sorted(json_decoder.DECODERS):
+            json_decoder.set_decoder(decoder)
+            elapsed, peak = measure(current_decode, json_response)
+            rows.append(("api/json bytes, %s" % decoder, elapsed, peak))
+        json_decoder.set_decoder(previous)
+        for label, elapsed, peak in rows:
+            print(
+                "  %-28s %8.1f ms %8.1f MB peak"
+                % (label, elapsed * 1000, peak / 1024.0**2)
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("scale", type=int, nargs="?", default=1500)
+    run(**vars(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure folder resolution on a synthetic deep folder tree: requests, bytes
+and wall time of Jenkins() for several nested tree depths (depth 1 is the
+former one-request-per-folder strategy, parallelised per level), and the
+scaling of the in-memory flattening.
+
+    python -m jenkinsapi_tests.benchmarks.bench_folders \
+        [folders] [folder_depth] [latency]
+"""
+
+import argparse
+import time
+
+from jenkinsapi import config
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils.fake_jenkins import FakeJenkins
+
+
+def nested_listing(folders, depth, jobs_per_folder):
+    """A root listing as returned for a deep enough jobs_tree()."""
+
+    def folder(level):
+        jobs = [
+            {"name": "job_%d" % idx, "color": "blue", "url": "u"}
+            for idx in range(jobs_per_folder)
+        ]
+        if level < depth:
+            jobs.append(folder(level + 1))
+        return {"name": "sub_%d" % level, "jobs": jobs}
+
+    return [folder(1) for _ in range(folders)]
+
+
+def bench_flatten(jobs_per_folder=10, depth=4):
+    base = JenkinsBase("http://localhost:8080", poll=False)
+    print(
+        "flattening (%d jobs per folder, depth %d)" % (jobs_per_folder, depth)
+    )
+    for folders in (250, 500, 1000, 2000):
+        listing = nested_listing(folders, depth, jobs_per_folder)
+        start = time.perf_counter()
+        jobs = base.resolve_job_folders(listing)
+        elapsed = time.perf_counter() - start
+        print(
+            "  %5d folders %7d jobs %8.1f ms %6.2f us/job"
+            % (
+                folders * depth,
+                len(jobs),
+                elapsed * 1000,
+                elapsed * 1e6 / len(jobs),
+            )
+        )
+
+
+def bench_requests(folders, folder_depth, latency):
+    print(
+        "Jenkins() with %d top level folders, %d levels deep, "
+        "%.0f ms latency" % (folders, folder_depth, latency * 1000)
+    )
+    default_depth = config.FOLDER_TREE_DEPTH
+    with FakeJenkins(
+        jobs=100,
+        folders=folders,
+        folder_depth=folder_depth,
+        jobs_per_folder=5,
+        builds=1,
+        latency=latency,
+    ) as server:
+        for depth in sorted({1, 2, default_depth, folder_depth + 1}):
+            config.FOLDER_TREE_DEPTH = depth
+            try:
+                server.reset_stats()
+                start = time.perf_counter()
+                jenkins = Jenkins(server.baseurl, use_crumb=False)
+                elapsed = time.perf_counter() - start
+            finally:
+                config.FOLDER_TREE_DEPTH = default_depth
+            print(
+                "  tree depth %2d %8.1f ms %6d requests %10d bytes %6d jobs"
+                % (
+                    depth,
+                    elapsed * 1000,
+                    server.request_count,
+                    server.bytes_sent,
+                    len(jenkins.jobs.keys()),
+                )
+            )
+
+
+def run(folders=200, folder_depth=6, latency=0.005):
+    bench_requests(folders, folder_depth, latency)
+    bench_flatten()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("folders", type=int, nargs="?", default=200)
+    parser.add_argument("folder_depth", type=int, nargs="?", default=6)
+    parser.add_argument("latency", type=float, nargs="?", default=0.005)
+    run(**vars(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure job name lookups on a large server: 20k ``in``, has_job() and
+get_job() calls through the hashed name index, against the former linear
+scan of the job list (timed on a sample and extrapolated).
+
+    python -m jenkinsapi_tests.benchmarks.bench_jobs_index [num_jobs] [lookups]
+"""
+
+import argparse
+import random
+import time
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.fake_jenkins import FakeJenkins
+
+SAMPLE = 200
+
+
+def timed(label, func, names, total):
+    start = time.perf_counter()
+    for name in names:
+        func(name)
+    elapsed = (time.perf_counter() - start) * total / len(names)
+    print(
+        "  %-20s %10.1f ms %8.2f us/lookup"
+        % (label, elapsed * 1000, elapsed * 1e6 / total)
+    )
+    return elapsed
+
+
+def run(num_jobs=20000, lookups=20000):
+    with FakeJenkins(jobs=num_jobs, builds=1) as server:
+        jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+        jobs = jenkins.jobs
+        jobs.keys()
+        rng = random.Random(0)
+        names = ["job_%05d" % rng.randrange(num_jobs) for _ in range(lookups)]
+
+        def linear(name):
+            return any(
+                jobs._job_row_matches_name(row, name) for row in jobs._data
+            )
+
+        print("%d lookups over %d jobs" % (lookups, num_jobs))
+        server.reset_stats()
+        start = time.perf_counter()
+        jobs._get_index()
+        print(
+            "  %-20s %10.1f ms"
+            % ("build index", (time.perf_counter() - start) * 1000)
+        )
+        indexed = timed("in (index)", jobs.__contains__, names, lookups)
+        timed("has_job (index)", jenkins.has_job, names, lookups)
+        timed("get_job (index)", jenkins.get_job, names, lookups)
+        scan = timed("in (linear scan)", linear, names[:SAMPLE], lookups)
+        print(
+            "  %.0fx faster, %d requests"
+            % (scan / indexed, server.request_count)
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("num_jobs", type=int, nargs="?", default=20000)
+    parser.add_argument("lookups", type=int, nargs="?", default=20000)
+    run(**vars(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
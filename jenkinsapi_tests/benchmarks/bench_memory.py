@@ -0,0 +1,96 @@
+"""
+Measure the memory held by the job listing and the build listings of a
+large server: the decoded lists of dicts against the compact JobRow and
+BuildList types, with tracemalloc.
+
+    python -m jenkinsapi_tests.benchmarks.bench_memory [num_jobs] [builds]
+
+builds is the number of builds of every job (default: 50000 jobs with 20
+builds each, 1M builds). The times include generating the listings and
+the overhead of tracemalloc.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from jenkinsapi.utils.compact_index import BuildList, compact_job_rows
+from jenkinsapi.utils.fake_jenkins import FakeJenkinsData, materialize
+
+BASEURL = "http://jenkins.example.com:8080"
+
+
+def retained(factory):
+    """Return the result of factory and the bytes it holds"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = factory()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def report(label, count, unit, size, elapsed):
+    print(
+        "  %-26s %9.1f MB %8.1f bytes/%s %8.2f s"
+        % (label, size / 1e6, size / count, unit, elapsed)
+    )
+
+
+def run(num_jobs=50000, builds=20):
+    data = FakeJenkinsData(jobs=num_jobs, builds=builds, nodes=0)
+    data.baseurl = BASEURL
+    listing = json.dumps(materialize(data.root_document()["jobs"]))
+    items = data.jobs()
+
+    def build_listings():
+        # one listing decoded at a time, as Job.poll() does
+        for item in items:
+            yield json.dumps(
+                [
+                    materialize(data.build_ref(item, number))
+                    for number in range(item.builds, 0, -1)
+                ]
+            )
+
+    total_builds = num_jobs * builds
+    print("%d jobs, %d builds" % (num_jobs, total_builds))
+    rows, jobs_before, seconds = retained(lambda: json.loads(listing))
+    report("job rows (dicts)", num_jobs, "job", jobs_before, seconds)
+    del rows
+    rows, jobs_after, seconds = retained(
+        lambda: compact_job_rows(json.loads(listing))
+    )
+    report("job rows (JobRow)", num_jobs, "job", jobs_after, seconds)
+    del rows
+
+    lists, builds_before, seconds = retained(
+        lambda: [json.loads(text) for text in build_listings()]
+    )
+    report("builds (dicts)", total_builds, "build", builds_before, seconds)
+    del lists
+    lists, builds_after, seconds = retained(
+        lambda: [BuildList(json.loads(text)) for text in build_listings()]
+    )
+    report("builds (BuildList)", total_builds, "build", builds_after, seconds)
+    del lists
+    print(
+        "  %.1fx smaller job rows, %.1fx smaller build listings"
+        % (jobs_before / jobs_after, builds_before / builds_after)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("num_jobs", type=int, nargs="?", default=50000)
+    parser.add_argument("builds", type=int, nargs="?", default=20)
+    run(**vars(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Measure how soon a client of a large server can look up a job: a plain
+Jenkins(), one with a background prefetch of the job list, and one
+warm-started from a job snapshot.
+
+    python -m jenkinsapi_tests.benchmarks.bench_startup [num_jobs] [latency]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.fake_jenkins import FakeJenkins
+
+
+def measure(label, server, **kwargs):
+    start = time.perf_counter()
+    jenkins = Jenkins(server.baseurl, use_crumb=False, **kwargs)
+    ready = time.perf_counter() - start
+    jenkins.get_job("job_00042")
+    lookup = time.perf_counter() - start
+    jenkins.jobs.keys()
+    complete = time.perf_counter() - start
+    print(
+        "  %-18s %8.1f ms returned %8.1f ms first lookup "
+        "%8.1f ms job list"
+        % (label, ready * 1000, lookup * 1000, complete * 1000)
+    )
+
+
+def run(num_jobs=50000, latency=0.05):
+    print("startup with %d jobs, %.0f ms latency" % (num_jobs, latency * 1000))
+    with FakeJenkins(jobs=num_jobs, builds=1, latency=latency) as server:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "jobs.json")
+            measure("Jenkins()", server)
+            measure("prefetch", server, prefetch=True)
+            measure(
+                "no snapshot yet", server, prefetch=True, snapshot_path=path
+            )
+            measure("warm start", server, prefetch=True, snapshot_path=path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("num_jobs", type=int, nargs="?", default=50000)
+    parser.add_argument("latency", type=float, nargs="?", default=0.05)
+    run(**vars(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Measure wall time, request count and response bytes of common client
+workflows against an in-process fake Jenkins.
+
+    python -m jenkinsapi_tests.benchmarks.bench_workflows \
+        [--scenario small|large] [--repeat N] [--latency S] [--json PATH]
+
+Save the ``--json`` output of two revisions to compare them.
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.fake_jenkins import FakeJenkins
+
+SCENARIOS = {
+    "small": dict(
+        jobs=100,
+        folders=2,
+        folder_depth=2,
+        jobs_per_folder=10,
+        builds=200,
+        nodes=4,
+        queue_items=10,
+        artifacts=3,
+    ),
+    "large": dict(
+        jobs=5000,
+        folders=50,
+        folder_depth=3,
+        jobs_per_folder=20,
+        builds=100000,
+        nodes=100,
+        queue_items=500,
+        artifacts=20,
+    ),
+}
+RUNNING_POLLS = 3
+FOLDER_JOB = "folder_000/job_00001"
+
+
+def connect(server):
+    return Jenkins(server.baseurl, use_crumb=False)
+
+
+def jenkins_init(server):
+    return lambda: connect(server)
+
+
+def jobs_keys(server):
+    jenkins = connect(server)
+    return lambda: list(jenkins.jobs.keys())
+
+
+def get_job(server):
+    jenkins = connect(server)
+    return lambda: jenkins.get_job(FOLDER_JOB)
+
+
+def get_build(server):
+    job = connect(server).get_job(FOLDER_JOB)
+    return lambda: job.get_build(server.data.builds // 2)
+
+
+def get_artifacts(server):
+    build = connect(server).get_job(FOLDER_JOB).get_last_good_build()
+    return lambda: list(build.get_artifacts())
+
+
+def block_until_complete(server):
+    server.data.reset_running()
+    build = connect(server).get_job(FOLDER_JOB).get_last_build()
+    return lambda: build.block_until_complete(delay=0.001)
+
+
+def scan_jobs(server):
+    jenkins = connect(server)
+    return lambda: [
+        job.get_last_buildnumber() for job in jenkins.jobs.itervalues()
+    ]
+
+
+def iter_jobs(server):
+    jenkins = connect(server)
+    return lambda: [job.get_last_buildnumber() for job in jenkins.iter_jobs()]
+
+
+WORKFLOWS = [
+    ("Jenkins()", jenkins_init),
+    ("jobs.keys()", jobs_keys),
+    ("get_job(folder job)", get_job),
+    ("job.get_build(n)", get_build),
+    ("build.get_artifacts()", get_artifacts),
+    ("block_until_complete()", block_until_complete),
+    ("scan jobs (itervalues)", scan_jobs),
+    ("scan jobs (iter_jobs)", iter_jobs),
+]
+
+
+def measure(server, setup, repeat=1):
+    """
+    Run setup(server) and time the callable it returns; return wall time
+    (median of repeat runs), requests and response bytes of one run.
+    """
+    times = []
+    for _ in range(repeat):
+        action = setup(server)
+        server.reset_stats()
+        start = time.perf_counter()
+        action()
+        times.append(time.perf_counter() - start)
+        requests, sent = server.request_count, server.bytes_sent
+    return {
+        "seconds": statistics.median(times),
+        "requests": requests,
+        "bytes": sent,
+    }
+
+
+def run(scenario="small", repeat=3, latency=0.0):
+    with FakeJenkins(
+        latency=latency, running_polls=RUNNING_POLLS, **SCENARIOS[scenario]
+    ) as server:
+        return {
+            name: measure(server, setup, repeat) for name, setup in WORKFLOWS
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scenario", choices=SCENARIOS, default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args(argv)
+
+    results = run(args.scenario, args.repeat, args.latency)
+    print(
+        "%s scenario: %s"
+        % (
+            args.scenario,
+            ", ".join(
+                "%s=%s" % item for item in SCENARIOS[args.scenario].items()
+            ),
+        )
+    )
+    for name, result in results.items():
+        print(
+            "%-24s %10.1f ms %6d requests %12d bytes"
+            % (
+                name,
+                result["seconds"] * 1000,
+                result["requests"],
+                result["bytes"],
+            )
+        )
+    if args.json_path:
+        with open(args.json_path, "w") as handle:
+            json.dump(
+                {"scenario": args.scenario, "results": results},
+                handle,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
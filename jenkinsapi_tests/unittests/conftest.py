@@ -0,0 +1,20 @@
+"""
+Fixtures shared by the unit tests
+"""
+
+import pytest
+
+from jenkinsapi.utils.fake_jenkins import FakeJenkins
+
+
+@pytest.fixture
+def server(request):
+    """
+    A FakeJenkins server, created with the options of the closest
+    fake_jenkins mark of the test, e.g. at the top of a module::
+
+        pytestmark = pytest.mark.fake_jenkins(jobs=1, builds=25)
+    """
+    marker = request.node.get_closest_marker("fake_jenkins")
+    with FakeJenkins(**(marker.kwargs if marker else {})) as fake:
+        yield fake
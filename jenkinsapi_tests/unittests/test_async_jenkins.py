@@ -0,0 +1,411 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from jenkinsapi.async_jenkins import (
+    AsyncBuild,
+    AsyncJenkins,
+    AsyncJob,
+    AsyncNode,
+)
+from jenkinsapi.custom_exceptions import (
+    NoBuildData,
+    NotFound,
+    NotSupportSCM,
+    UnknownJob,
+    UnknownNode,
+)
+from jenkinsapi.utils.async_requester import AsyncRequester
+from jenkinsapi.utils.requester import Requester
+from jenkinsapi.utils.single_flight import AsyncSingleFlight
+
+BASEURL = "http://localhost:8080"
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=1, builds=12, queue_items=1, artifacts=2
+)
+
+DATA = {
+    BASEURL + "/api/json": {
+        "jobs": [
+            {"name": "foo", "url": BASEURL + "/job/foo/", "color": "blue"},
+            {"name": "folder", "url": BASEURL + "/job/folder/"},
+        ]
+    },
+    BASEURL + "/job/folder/api/json": {
+        "jobs": [{"name": "bar", "color": "red"}]
+    },
+    BASEURL + "/job/foo/api/json": {
+        "name": "foo",
+        "description": "foo job",
+        "builds": [{"number": 2, "url": BASEURL + "/job/foo/2/"}],
+        "firstBuild": {"number": 2},
+        "lastBuild": {"number": 2, "url": BASEURL + "/job/foo/2/"},
+        "inQueue": False,
+        "color": "blue",
+    },
+    BASEURL + "/job/folder/job/bar/api/json": {
+        "name": "bar",
+        "builds": [],
+        "color": "red",
+    },
+    BASEURL + "/job/foo/2/injectedEnvVars/api/json": {
+        "envMap": {"BUILD_NUMBER": "2"}
+    },
+    BASEURL + "/job/foo/2/wfapi/pendingInputActions": [{"id": "approve"}],
+    BASEURL + "/job/foo/2/api/json": {
+        "number": 2,
+        "result": "SUCCESS",
+        "building": False,
+        "fullDisplayName": "foo #2",
+        "artifacts": [{"relativePath": "out/a.txt", "fileName": "a.txt"}],
+    },
+    BASEURL + "/queue/api/json": {
+        "items": [
+            {"id": 7, "task": {"name": "foo", "url": BASEURL + "/job/foo/"}}
+        ]
+    },
+    BASEURL + "/queue/item/7/api/json": {
+        "id": 7,
+        "task": {"name": "foo", "url": BASEURL + "/job/foo/"},
+        "executable": {"number": 2},
+    },
+    BASEURL + "/computer/api/json": {
+        "computer": [{"displayName": "Built-In Node"}]
+    },
+    BASEURL + "/computer/(built-in)/api/json": {
+        "displayName": "Built-In Node",
+        "offline": False,
+        "idle": True,
+    },
+}
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.status_code = 200 if data is not None else 404
+        self.text = json.dumps(data)
+        self.content = self.text.encode("utf-8")
+        self.encoding = "utf-8"
+        self.headers = {"X-Jenkins": "2.400"}
+
+    def raise_for_status(self):
+        raise NotFound(self.status_code)
+
+
+class FakeRequester(Requester):
+    def __init__(self):
+        super().__init__(baseurl=BASEURL)
+        self.calls = []
+        self.threads = set()
+
+    def get_url(self, url, params=None, headers=None, **kwargs):
+        self.calls.append((url, (params or {}).get("tree")))
+        self.threads.add(threading.current_thread().name)
+        return FakeResponse(DATA.get(url))
+
+    def get_and_confirm_status(self, url, **kwargs):
+        return self.get_url(url)
+
+
+@pytest.fixture(scope="function")
+def jenkins():
+    requester = AsyncRequester(requester=FakeRequester(), max_concurrency=4)
+    new_jenkins = AsyncJenkins(BASEURL, requester=requester)
+    yield new_jenkins
+    new_jenkins.close()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_requester_runs_off_the_event_loop(jenkins):
+    run(jenkins.poll())
+    threads = jenkins.requester.requester.threads
+    assert threads
+    assert all(name.startswith("jenkinsapi-async") for name in threads)
+
+
+def test_requester_sizes_connection_pool():
+    requester = AsyncRequester(baseurl=BASEURL, max_concurrency=16)
+    adapter = requester.requester.session.get_adapter(BASEURL)
+    assert adapter._pool_maxsize == 16
+    requester.close()
+
+
+def test_requester_rejects_bad_concurrency():
+    with pytest.raises(ValueError):
+        AsyncRequester(max_concurrency=0)
+
+
+def test_construction_does_not_poll(jenkins):
+    assert jenkins._data is None
+    assert jenkins.requester.requester.calls == []
+
+
+def test_keys_resolve_folders(jenkins):
+    assert run(jenkins.keys()) == ["foo", "folder/bar"]
+
+
+def test_has_job(jenkins):
+    assert run(jenkins.has_job("folder/bar"))
+    assert not run(jenkins.has_job("baz"))
+
+
+def test_contains_is_not_supported(jenkins):
+    with pytest.raises(TypeError):
+        "foo" in jenkins.jobs  # pylint: disable=pointless-statement
+
+
+def test_get_job(jenkins):
+    job = run(jenkins.get_job("foo"))
+    assert isinstance(job, AsyncJob)
+    assert job.get_description() == "foo job"
+
+
+def test_get_unknown_job(jenkins):
+    with pytest.raises(UnknownJob):
+        run(jenkins.get_job("baz"))
+
+
+def test_get_jobs_polls_every_job(jenkins):
+    jobs = dict(run(jenkins.get_jobs()))
+    assert sorted(jobs) == ["folder/bar", "foo"]
+    assert jobs["folder/bar"]._data["color"] == "red"
+
+
+def test_get_last_build(jenkins):
+    async def last_build():
+        job = await jenkins.get_job("foo")
+        return await job.get_last_build()
+
+    build = run(last_build())
+    assert isinstance(build, AsyncBuild)
+    assert build.get_number() == 2
+    assert build.get_status() == "SUCCESS"
+    assert not run(build.is_running())
+
+
+def test_get_missing_build(jenkins):
+    async def missing_build():
+        job = await jenkins.get_job("foo")
+        return await job.get_build(5)
+
+    with pytest.raises(NotFound):
+        run(missing_build())
+
+
+def test_build_artifacts(jenkins):
+    async def artifacts():
+        job = await jenkins.get_job("foo")
+        build = await job.get_build(2)
+        return await build.get_artifacts()
+
+    (artifact,) = run(artifacts())
+    assert artifact.url == BASEURL + "/job/foo/2/artifact/out/a.txt"
+
+
+def test_job_is_queued_or_running(jenkins):
+    job = run(jenkins.get_job("foo"))
+    assert not run(job.is_queued_or_running())
+
+
+def test_queue_items_for_job(jenkins):
+    async def queued_build():
+        queue = await jenkins.get_queue()
+        (item,) = await queue.get_queue_items_for_job("foo")
+        return await item.get_build()
+
+    assert run(queued_build()).get_number() == 2
+
+
+def test_nodes(jenkins):
+    node = run(jenkins.get_node("Built-In Node"))
+    assert isinstance(node, AsyncNode)
+    assert run(node.is_online())
+    assert run(node.is_idle())
+    with pytest.raises(UnknownNode):
+        run(jenkins.get_node("missing"))
+
+
+def test_version(jenkins):
+    assert run(jenkins.get_version()) == "2.400"
+
+
+def test_single_flight_coalesces_polls():
+    requester = AsyncRequester(
+        requester=FakeRequester(), single_flight=AsyncSingleFlight()
+    )
+    jenkins = AsyncJenkins(BASEURL, requester=requester)
+
+    async def poll_twice():
+        job = await jenkins.get_job("foo")
+        before = len(requester.requester.calls)
+        await asyncio.gather(job.poll(), job.poll())
+        return len(requester.requester.calls) - before
+
+    assert run(poll_twice()) == 1
+    assert requester.single_flight.stats()["coalesced"] == 1
+    jenkins.close()
+
+
+def test_build_plugin_data(jenkins):
+    async def plugin_data():
+        job = await jenkins.get_job("foo")
+        build = await job.get_build(2)
+        return (
+            await build.get_env_vars(),
+            await build.get_pending_input_actions(),
+        )
+
+    assert run(plugin_data()) == ({"BUILD_NUMBER": "2"}, [{"id": "approve"}])
+
+
+class LogResponse:
+    def __init__(self, content, size, more):
+        self.content = content
+        self.encoding = "utf-8"
+        self.headers = {"X-Text-Size": size}
+        if more:
+            self.headers["X-More-Data"] = "true"
+
+
+def test_build_stream_logs(jenkins, monkeypatch):
+    responses = iter(
+        [LogResponse(b"Started\n", 8, True), LogResponse(b"Done\n", 13, 0)]
+    )
+    requested = []
+
+    def get_url(url, params=None, **kwargs):
+        if url.endswith("progressiveText"):
+            requested.append(params["start"])
+            return next(responses)
+        return FakeRequester.get_url(jenkins.requester.requester, url, params)
+
+    monkeypatch.setattr(jenkins.requester.requester, "get_url", get_url)
+
+    async def stream():
+        job = await jenkins.get_job("foo")
+        build = await job.get_build(2)
+        return [part async for part in build.stream_logs()]
+
+    assert run(stream()) == ["Started\n", "Done\n"]
+    assert requested == [0, 8]
+
+
+def run_on_job(server, method, *args, job_name="job_00000"):
+    async def call():
+        async with AsyncJenkins(server.baseurl, use_crumb=False) as jen:
+            job = await jen.get_job(job_name)
+            return await getattr(job, method)(*args)
+
+    return run(call())
+
+
+def run_on_build(server, method, *args, buildnumber=4):
+    async def call():
+        async with AsyncJenkins(server.baseurl, use_crumb=False) as jen:
+            job = await jen.get_job("job_00000")
+            build = await job.get_build(buildnumber)
+            return await getattr(build, method)(*args)
+
+    return run(call())
+
+
+def test_get_artifact_dict(server):
+    artifacts = run_on_build(server, "get_artifact_dict")
+    assert sorted(artifacts) == ["out/artifact_0.txt", "out/artifact_1.txt"]
+
+
+def test_build_links_without_upstream_or_runs(server):
+    assert run_on_build(server, "get_stages") == []
+    assert run_on_build(server, "get_upstream_job") is None
+    assert run_on_build(server, "get_upstream_build") is None
+    assert run_on_build(server, "get_downstream_jobs") == []
+    assert run_on_build(server, "get_downstream_builds") == []
+    assert run_on_build(server, "get_matrix_runs") == []
+    assert run_on_build(server, "block") is None
+
+
+def test_get_build_by_params(server):
+    build = run_on_job(server, "get_build_by_params", {"BRANCH": "branch-2"})
+    assert isinstance(build, AsyncBuild)
+    assert build.get_number() == 2
+    build = run_on_job(
+        server, "get_build_by_params", {"BRANCH": "branch-2"}, -1
+    )
+    assert build.get_number() == 12
+    with pytest.raises(NoBuildData):
+        run_on_job(server, "get_build_by_params", {"BRANCH": "other"})
+
+
+def test_revisions(server):
+    revisions = run_on_job(server, "get_revision_dict")
+    assert len(revisions) == 12
+    revision, numbers = next(iter(revisions.items()))
+    assert numbers == [12]
+    assert run_on_job(server, "get_buildnumber_for_revision", revision) == [12]
+    with pytest.raises(NotFound):
+        run_on_job(server, "get_buildnumber_for_revision", "0" * 40)
+
+
+def test_get_queue_item(server):
+    item = run_on_job(server, "get_queue_item")
+    assert item.get_job_name() == "job_00000"
+    assert run_on_job(server, "has_queued_build", [])
+    assert not run_on_job(server, "has_queued_build", {"A": "1"})
+
+
+def test_job_links(server):
+    assert run_on_job(server, "get_downstream_jobs") == []
+    assert run_on_job(server, "get_upstream_jobs") == []
+
+
+def test_config_is_loaded_explicitly(server):
+    async def scm_type(load):
+        async with AsyncJenkins(server.baseurl, use_crumb=False) as jen:
+            job = await jen.get_job("job_00000")
+            if load:
+                await job.load_config()
+            return job.get_scm_type()
+
+    with pytest.raises(TypeError):
+        run(scm_type(False))
+    with pytest.raises(NotSupportSCM):
+        run(scm_type(True))
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_history_index",
+        "iter_builds",
+        "get_builds",
+        "invoke",
+        "delete_build",
+        "toggle_keep_build",
+        "delete_from_queue",
+        "enable",
+        "disable",
+        "update_config",
+        "recreate",
+        "change_description",
+        "restrict_to_node",
+    ],
+)
+def test_synchronous_job_methods_are_blocked(jenkins, method):
+    job = AsyncJob(BASEURL + "/job/foo", "foo", jenkins)
+    with pytest.raises(TypeError):
+        getattr(job, method)()
+    assert jenkins.requester.requester.calls == []
+
+
+@pytest.mark.parametrize("method", ["get_resultset", "stop", "toggle_keep"])
+def test_synchronous_build_methods_are_blocked(jenkins, method):
+    job = AsyncJob(BASEURL + "/job/foo", "foo", jenkins)
+    build = AsyncBuild(BASEURL + "/job/foo/2", 2, job)
+    with pytest.raises(TypeError):
+        getattr(build, method)()
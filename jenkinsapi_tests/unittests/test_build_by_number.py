@@ -0,0 +1,101 @@
+import pytest
+
+from jenkinsapi.custom_exceptions import NotFound
+from jenkinsapi.jenkins import Jenkins
+
+
+pytestmark = pytest.mark.fake_jenkins(jobs=2, builds=2000)
+
+
+def test_build_in_one_request(server):
+    job = Jenkins(server.baseurl, use_crumb=False)["job_00000"]
+    server.reset_stats()
+    build = job.get_build(1234)
+    assert build.get_number() == 1234
+    assert build.baseurl == server.baseurl + "/job/job_00000/1234"
+    assert server.request_log == [
+        ("GET", "/job/job_00000/1234/api/json?depth=1")
+    ]
+    assert job[1234].get_params() == {"BRANCH": "branch-4"}
+
+    server.reset_stats()
+    assert job.get_build_metadata(1).depth == 0
+    assert server.request_log == [("GET", "/job/job_00000/1/api/json?depth=0")]
+
+
+def test_missing_build(server):
+    job = Jenkins(server.baseurl, use_crumb=False)["job_00000"]
+    server.reset_stats()
+    with pytest.raises(NotFound):
+        job.get_build(2001)
+    with pytest.raises(NotFound):
+        job.get_build_metadata(2001)
+    assert server.request_count == 2
+
+
+def test_missing_build_is_not_logged_as_error(server, caplog):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    job = jenkins.get_job("job_00000")
+    with pytest.raises(NotFound):
+        job.get_build(2001)
+    job = Jenkins(server.baseurl, use_crumb=False)["job_00000"]
+    with pytest.raises(NotFound):
+        job.get_build(2001)
+    assert not [r for r in caplog.records if r.levelname == "ERROR"]
+
+
+def test_lazy_build_checked_once(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    job = jenkins.get_job("job_00001")
+    server.reset_stats()
+    build = job.get_build(7)
+    assert server.request_log == [
+        ("GET", "/job/job_00001/7/api/json?depth=1&tree=number")
+    ]
+    # the check is kept as the partial data of the build
+    assert not build._data.is_complete
+    assert build.get_number() == 7
+    assert server.request_count == 1
+    server.reset_stats()
+    job.get_build(7)
+    assert server.request_count == 0
+    with pytest.raises(NotFound):
+        job.get_build(2001)
+
+
+def test_delete_missing_build(server, mocker):
+    job = Jenkins(server.baseurl, use_crumb=False)["job_00000"]
+    post = mocker.patch.object(
+        job.jenkins.requester,
+        "post_and_confirm_status",
+        return_value=mocker.Mock(status_code=404),
+    )
+    with pytest.raises(NotFound):
+        del job[2001]
+    assert post.call_args.args[0] == (
+        server.baseurl + "/job/job_00000/2001/doDelete"
+    )
+
+
+def test_downstream_builds_fetched_by_number(server, mocker):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    build = jenkins.get_job("job_00000").get_build(5)
+    mocker.patch.object(
+        build.job, "get_downstream_job_names", return_value=["job_00001"]
+    )
+    usage = {
+        "name": "job_00001",
+        "ranges": {"ranges": [{"start": 3, "end": 6}]},
+    }
+    build._data["fingerprint"] = [{"usage": [usage]}]
+    server.reset_stats()
+    builds = build.get_downstream_builds()
+    assert [downstream.buildno for downstream in builds] == [3, 4, 5]
+    assert builds[0].get_number() == 3
+    # the job is found by its url; its builds are not listed
+    assert sorted(path for _, path in server.request_log) == [
+        "/job/job_00001/3/api/json?depth=1",
+        "/job/job_00001/4/api/json?depth=1",
+        "/job/job_00001/5/api/json?depth=1",
+        "/job/job_00001/api/json?tree=name%2Ccolor",
+    ]
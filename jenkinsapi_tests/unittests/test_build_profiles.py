@@ -0,0 +1,90 @@
+from urllib.parse import unquote
+
+import pytest
+
+from jenkinsapi import config
+from jenkinsapi.build import Build
+from jenkinsapi.jenkins import Jenkins
+
+
+pytestmark = pytest.mark.fake_jenkins(jobs=1, builds=20)
+
+
+@pytest.fixture
+def job(server):
+    job = Jenkins(server.baseurl, use_crumb=False)["job_00000"]
+    server.reset_stats()
+    return job
+
+
+def requested_trees(server):
+    return [
+        unquote(path).partition("tree=")[2] for _, path in server.request_log
+    ]
+
+
+def test_fields_outside_the_profile_are_fetched_one_at_a_time(job, server):
+    build = job.get_build(5, profile="minimal")
+    assert requested_trees(server) == ["number,url,result,building"]
+    assert build.get_status() == "SUCCESS"
+    assert server.request_count == 1
+
+    assert build.get_duration().total_seconds() == 1.005
+    assert build.get_params() == {"BRANCH": "branch-0"}
+    assert requested_trees(server)[1:] == [
+        "duration",
+        Build.FIELD_TREES["actions"],
+    ]
+    assert build.get_params() == {"BRANCH": "branch-0"}
+    assert (
+        build.get_revision()
+        == build._data["actions"][2]["lastBuiltRevision"]["SHA1"]
+    )
+    # changeSet was fetched, changeSets is missing from freestyle builds
+    assert "changeSets" not in build._data
+    assert "changeSets" not in build._data
+    assert server.request_count == 5
+
+
+def test_job_and_global_profiles(job, server, monkeypatch):
+    job.build_profile = "status"
+    build = job.get_build(7)
+    assert requested_trees(server) == [Build.PROFILES["status"]]
+    assert build.get_timestamp().year >= 2020
+    assert str(build) == "job_00000 #7"
+    assert server.request_count == 1
+
+    job.build_profile = None
+    monkeypatch.setattr(config, "BUILD_PROFILE", "scm")
+    build = job.get_build(8)
+    assert build.get_revision_branch()[0]["name"] == (
+        "refs/remotes/origin/main"
+    )
+    assert server.request_count == 2
+
+
+def test_custom_tree_and_unknown_fields(job, server):
+    build = job.get_build(9, profile="number,result")
+    assert build._data == {
+        "_class": "hudson.model.FreeStyleBuild",
+        "number": 9,
+        "result": "SUCCESS",
+    }
+    # a field without a tree of its own fetches all the data
+    assert build._data["executor"] is None
+    assert requested_trees(server) == ["number,result", ""]
+    assert build.get_slave() == ""
+    assert server.request_count == 2
+
+
+def test_full_profile_is_the_default(job, server):
+    build = job.get_build(3)
+    assert requested_trees(server) == [""]
+    assert isinstance(build._data, dict)
+    assert "fullDisplayName" in build._data
+
+
+def test_get_builds_with_a_profile(job, server):
+    builds = list(job.get_builds([1, 2], profile="minimal"))
+    assert [build.get_status() for build in builds] == ["SUCCESS"] * 2
+    assert requested_trees(server)[-2:] == ["number,url,result,building"] * 2
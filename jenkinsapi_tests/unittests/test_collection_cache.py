@@ -0,0 +1,113 @@
+import pytest
+
+from jenkinsapi.credentials import Credentials2x
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.collection_cache import CollectionCache
+
+
+pytestmark = pytest.mark.fake_jenkins(jobs=3, nodes=3)
+
+
+def connect(server, **kwargs):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy=True, **kwargs)
+    server.reset_stats()
+    return jenkins
+
+
+def test_collections_are_not_cached_by_default(server):
+    jenkins = connect(server)
+    assert jenkins.nodes is not jenkins.nodes
+    assert jenkins.plugins is not jenkins.plugins
+    assert jenkins.collection_cache.stats()["entries"] == 0
+
+
+def test_nodes_fetched_once_within_ttl(server):
+    jenkins = connect(server, lazy_poll=True, collection_ttl=30)
+    for _ in range(10):
+        jenkins.nodes["agent-001"]
+        assert jenkins.has_node("agent-002")
+    assert [path for _, path in server.request_log] == [
+        "/computer/api/json?tree=computer%5BdisplayName%5D"
+    ]
+    stats = jenkins.collection_cache.stats()
+    assert (stats["misses"], stats["hits"]) == (1, 19)
+
+
+def test_zero_ttl_disables_caching(server):
+    jenkins = connect(server, collection_ttl=0)
+    jenkins.plugins
+    jenkins.plugins
+    assert server.request_count == 2
+    assert jenkins.collection_cache.stats()["entries"] == 0
+
+
+def test_ttl_expiry(server, monkeypatch):
+    jenkins = connect(server, collection_ttl={"plugins": 60})
+    now = [1000.0]
+    monkeypatch.setattr(
+        "jenkinsapi.utils.collection_cache.time.monotonic", lambda: now[0]
+    )
+    plugins = jenkins.plugins
+    now[0] += 30
+    assert jenkins.plugins is plugins
+    now[0] += 31
+    assert jenkins.plugins is not plugins
+    assert jenkins.collection_cache.stats()["expirations"] == 1
+
+
+def test_writes_invalidate(server, mocker):
+    jenkins = connect(server, collection_ttl=30)
+    nodes = jenkins.nodes
+    views = jenkins.views
+    post = mocker.patch.object(jenkins.requester, "post_and_confirm_status")
+    jenkins.delete_view_by_url(server.baseurl + "/view/foo")
+    assert jenkins.views is not views
+    assert jenkins.nodes is nodes
+
+    post.side_effect = lambda *args, **kwargs: server.data.nodes.append(
+        "agent-new"
+    )
+    try:
+        # the collection making the change re-polled itself and is kept
+        jenkins.create_node_with_config("agent-new", {})
+        assert jenkins.nodes is nodes
+        assert "agent-new" in nodes
+        server.data.nodes.remove("agent-new")
+        # a change through another object drops the cached collection
+        jenkins.get_nodes().create_node_with_config("agent-new", {})
+        assert jenkins.nodes is not nodes
+    finally:
+        server.data.nodes.remove("agent-new")
+
+
+def test_changed():
+    cache = CollectionCache({"views": 10})
+    views = cache.get("views", object)
+    cache.changed(views, "views")
+    assert cache.get("views", object) is views
+    cache.changed(None, "views")
+    assert cache.get("views", object) is not views
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_credentials_check_the_plugin_once(server, mocker):
+    jenkins = connect(server)
+    get_data = mocker.patch.object(
+        jenkins,
+        "get_data",
+        return_value={
+            "plugins": [{"shortName": "credentials", "version": "2.6.1"}]
+        },
+    )
+    mocker.patch.object(Credentials2x, "poll")
+    assert isinstance(jenkins.credentials, Credentials2x)
+    get_data.assert_called_once_with(
+        server.baseurl + "/pluginManager/api/json",
+        tree="plugins[shortName,version]",
+    )
+
+
+def test_clones_share_the_cache(server):
+    jenkins = connect(server, collection_ttl=30)
+    nodes = jenkins.nodes
+    assert jenkins._clone().nodes is nodes
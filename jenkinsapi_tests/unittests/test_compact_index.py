@@ -0,0 +1,93 @@
+import pickle
+from array import array
+
+import pytest
+
+from jenkinsapi import config
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.compact_index import BuildList, JobRow, compact_job_rows
+
+ROW = {
+    "_class": "hudson.model.FreeStyleProject",
+    "name": "b",
+    "url": "http://localhost:8080/job/a/job/b/",
+    "color": "blue",
+}
+
+
+def builds(*numbers, url="http://localhost:8080/job/a/"):
+    return [
+        {
+            "_class": "hudson.model.FreeStyleBuild",
+            "number": n,
+            "url": "%s%d/" % (url, n),
+        }
+        for n in numbers
+    ]
+
+
+def test_job_row_behaves_as_a_dict():
+    row = JobRow(dict(ROW, lastBuild={"number": 3}))
+    assert row == dict(ROW, lastBuild={"number": 3})
+    assert row["url"] == ROW["url"]
+    assert row.get("jobs") is None
+    assert "color" in row and "jobs" not in row
+
+    row.update({"color": "red", "url": "http://localhost:8080/job/c/"})
+    assert row["color"] == "red"
+    assert row["url"] == "http://localhost:8080/job/c/"
+    del row["color"]
+    assert "color" not in row
+    with pytest.raises(KeyError):
+        row["color"]
+    assert pickle.loads(pickle.dumps(row)) == row
+
+
+def test_job_rows_share_strings():
+    first, second = compact_job_rows(
+        [dict(ROW), dict(ROW, name="c", url=ROW["url"] + "job/c/")]
+    )
+    assert first._prefix is second._prefix
+    assert first._color is second._color
+    assert first["url"] == ROW["url"]
+
+
+def test_build_list_behaves_as_a_list():
+    rows = builds(5, 4, 2) + [{"number": 1, "url": "http://mirror/1/"}]
+    listed = BuildList(rows)
+    assert listed == rows
+    assert listed.numbers == array("l", [5, 4, 2, 1])
+    assert listed[-1] == rows[-1]
+    assert listed[1:3] == rows[1:3]
+    assert listed.get_url(2) == "http://localhost:8080/job/a/2/"
+    assert listed.get_url(1) == "http://mirror/1/"
+    assert listed.get_url(3) is None
+    assert listed.to_dict() == {row["number"]: row["url"] for row in rows}
+
+    del listed[0], rows[0]
+    listed.insert(0, {"number": 9, "url": "x"})
+    rows.insert(0, {"number": 9, "url": "x"})
+    listed.append(builds(0)[0])
+    rows.append(builds(0)[0])
+    assert listed == rows
+    assert listed.get_url(1) == "http://mirror/1/"
+
+
+@pytest.mark.fake_jenkins(jobs=3, builds=150)
+def test_polled_listings_are_compact(server, monkeypatch):
+    monkeypatch.setattr(config, "COMPACT_LISTINGS", True)
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    assert all(isinstance(row, JobRow) for row in jenkins._data["jobs"])
+    job = jenkins["job_00001"]
+    assert isinstance(job._data["builds"], BuildList)
+    assert len(job._data["builds"]) == 150
+    assert job.get_build_dict()[1] == (server.baseurl + "/job/job_00001/1/")
+
+
+@pytest.mark.fake_jenkins(jobs=3, builds=5)
+def test_polled_listings_are_plain_by_default(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    assert all(type(row) is dict for row in jenkins._data["jobs"])
+    assert type(jenkins.jobs._load()) is list
+    job = jenkins["job_00001"]
+    assert type(job._data["builds"]) is list
@@ -0,0 +1,155 @@
+import json
+
+import pytest
+import requests
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils.fake_jenkins import (
+    TreeError,
+    apply_tree,
+    parse_tree,
+    to_python_literal,
+)
+
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=5,
+    folders=2,
+    folder_depth=2,
+    jobs_per_folder=3,
+    builds=1000,
+    nodes=2,
+    queue_items=2,
+    artifacts=2,
+)
+
+
+def get(server, path, **params):
+    return requests.get(server.baseurl + path, params=params, timeout=10)
+
+
+def test_parse_tree():
+    assert parse_tree("jobs[name,builds[number]{0,10}],description") == [
+        (
+            "jobs",
+            [
+                ("name", None, None),
+                ("builds", [("number", None, None)], slice(0, 10)),
+            ],
+            None,
+        ),
+        ("description", None, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("{2,5}", [2, 3, 4]),
+        ("{7,}", [7, 8, 9]),
+        ("{,2}", [0, 1]),
+        ("{4}", [4]),
+    ],
+)
+def test_tree_ranges(spec, expected):
+    document = {"items": [{"n": idx, "x": 1} for idx in range(10)]}
+    projected = apply_tree(document, parse_tree("items[n]" + spec))
+    assert projected == {"items": [{"n": idx} for idx in expected]}
+
+
+@pytest.mark.parametrize("spec", ["jobs[name", "builds{1,x}", "a]"])
+def test_invalid_tree(spec):
+    with pytest.raises(TreeError):
+        parse_tree(spec)
+
+
+def test_to_python_literal():
+    text = json.dumps({"a": True, "b": None, "c": "true null", "d": False})
+    assert to_python_literal(text) == (
+        '{"a": True, "b": None, "c": "true null", "d": False}'
+    )
+
+
+def test_root_listing_with_tree(server):
+    data = get(server, "/api/json", tree="jobs[name,color]").json()
+    assert [job["name"] for job in data["jobs"]] == [
+        "job_00000",
+        "job_00001",
+        "job_00002",
+        "job_00003",
+        "job_00004",
+        "folder_000",
+        "folder_001",
+    ]
+    assert "color" not in data["jobs"][-1]
+    assert set(data) == {"_class", "jobs"}
+
+
+def test_all_builds_only_with_tree(server):
+    path = "/job/folder_000/job/sub_1/job/job_00002/api/json"
+    data = get(server, path).json()
+    assert "allBuilds" not in data
+    assert len(data["builds"]) == 100
+    assert data["lastBuild"]["number"] == 1000
+
+    data = get(server, path, tree="allBuilds[number]{990,}").json()
+    assert [build["number"] for build in data["allBuilds"]] == list(
+        range(10, 0, -1)
+    )
+
+
+def test_api_python(server):
+    response = get(server, "/job/job_00001/7/api/python")
+    assert "True" in response.text or "False" in response.text
+    data = JenkinsBase._decode_data_response(response.url, response)
+    assert data["number"] == 7
+    assert data["building"] is False
+
+
+def test_not_found_and_head(server):
+    assert get(server, "/job/missing/api/json").status_code == 404
+    assert get(server, "/job/job_00001/1001/api/json").status_code == 404
+    response = requests.head(
+        server.baseurl + "/job/job_00001/api/json", timeout=10
+    )
+    assert response.status_code == 200
+    assert int(response.headers["Content-Length"]) > 0
+
+
+def test_nodes_queue_and_artifacts(server):
+    nodes = get(server, "/computer/api/json").json()["computer"]
+    assert [node["displayName"] for node in nodes] == [
+        "Built-In Node",
+        "agent-000",
+        "agent-001",
+    ]
+    assert get(server, "/computer/(built-in)/api/json").status_code == 200
+    assert len(get(server, "/queue/api/json").json()["items"]) == 2
+    artifact = get(server, "/job/job_00000/3/artifact/out/artifact_1.txt")
+    assert artifact.content == b"contents of out/artifact_1.txt\n"
+
+
+def test_client_workflow_request_counts(server):
+    server.reset_stats()
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    # nested folders are listed by the root request
+    assert server.request_count == 1
+    assert "folder_001/sub_1/job_00002" in jenkins.jobs
+
+    job = jenkins.get_job("job_00003")
+    server.reset_stats()
+    build = job.get_build(500)
+    assert build.get_number() == 500
+    assert build.get_params() == {"BRANCH": "branch-0"}
+    assert server.bytes_sent > 0
+    assert all(method == "GET" for method, _ in server.request_log)
+
+
+@pytest.mark.fake_jenkins(jobs=1, builds=3, running_polls=2)
+def test_running_build_completes(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    build = jenkins["job_00000"].get_last_build()
+    assert build.is_running()
+    build.block_until_complete(delay=0.001)
+    assert not build.is_running()
@@ -0,0 +1,100 @@
+from urllib.parse import unquote
+
+import pytest
+
+from jenkinsapi.custom_exceptions import NoBuildData, NotFound
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.history_index import params_key
+
+
+pytestmark = pytest.mark.fake_jenkins(jobs=1, builds=25)
+
+
+@pytest.fixture
+def job(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy=True)
+    job = jenkins.get_job("job_00000")
+    server.reset_stats()
+    return job
+
+
+def test_index_is_built_from_one_page(job, server):
+    index = job.get_history_index()
+    assert len(index) == 25
+    # the last build number and one page of builds
+    assert server.request_count == 2
+    assert index.builds_with_params({"BRANCH": "branch-3"}) == [
+        3,
+        8,
+        13,
+        18,
+        23,
+    ]
+    assert index.builds_with_params({"BRANCH": "other"}) == []
+    assert len(index.revisions()) == 25
+
+
+def test_lookups(job, server, monkeypatch):
+    assert job.get_build_by_params({"BRANCH": "branch-3"}).buildno == 3
+    server.reset_stats()
+    build = job.get_build_by_params({"BRANCH": "branch-3"}, order=-1)
+    assert build.buildno == 23
+    assert build.get_params() == {"BRANCH": "branch-3"}
+    # the last build number and the build
+    assert server.request_count == 2
+    with pytest.raises(NoBuildData):
+        job.get_build_by_params({"BRANCH": "other"})
+
+    revision = build.get_revision()
+    monkeypatch.setattr(job, "get_scm_type", lambda: "git")
+    server.reset_stats()
+    assert job.get_buildnumber_for_revision(revision) == [23]
+    assert server.request_count == 0
+    assert job.get_revision_dict()[revision] == [23]
+    with pytest.raises(NotFound):
+        job.get_buildnumber_for_revision("0" * 40)
+
+
+def test_incremental_update(job, server):
+    index = job.get_history_index()
+    server.data.add_build("job_00000")
+    server.data.add_build("job_00000")
+    server.reset_stats()
+    assert index.update() == 2
+    assert server.request_count == 2
+    assert "{0,2}" in unquote(server.request_log[-1][1])
+    assert index.builds_with_params({"BRANCH": "branch-1"})[-1] == 26
+
+    server.reset_stats()
+    assert index.update() == 0
+    assert server.request_count == 1
+
+
+def test_running_builds_are_read_again(job, server):
+    server.data.running_polls = 1
+    index = job.get_history_index()
+    assert index.update() == 1
+    server.data.is_running(server.data.items["job_00000"], 25, True)
+    assert index.update() == 1
+    assert index.update() == 0
+    assert 25 in index
+
+
+def test_deleted_builds_are_discarded(job, server):
+    index = job.get_history_index()
+    index.discard(3)
+    assert 3 not in index
+    assert index.builds_with_params({"BRANCH": "branch-3"})[0] == 8
+    server.data.remove_item("job_00000")
+    server.data.add_job("job_00000", builds=2)
+    assert index.update() == 2
+    assert len(index) == 2
+    with pytest.raises(NoBuildData):
+        job.get_build_by_params({"BRANCH": "branch-3"})
+
+
+def test_params_key():
+    assert params_key({"A": "1", "B": ["x", "y"]}) == params_key(
+        {"B": ["x", "y"], "A": "1"}
+    )
+    assert params_key({}) != params_key({"A": None})
@@ -0,0 +1,85 @@
+from urllib.parse import unquote
+
+import pytest
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.job import Job
+from jenkinsapi.utils.fake_jenkins import apply_tree, parse_tree
+
+
+pytestmark = pytest.mark.fake_jenkins(jobs=1, builds=25)
+
+
+@pytest.fixture
+def job(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy=True)
+    job = jenkins.get_job("job_00000")
+    server.reset_stats()
+    return job
+
+
+def test_pages_are_fetched_as_consumed(job, server):
+    builds = job.iter_builds(page_size=10)
+    assert server.request_count == 0
+    first = [next(builds) for _ in range(12)]
+    assert [build.buildno for build in first] == list(range(25, 13, -1))
+    assert server.request_count == 2
+    assert "allBuilds[number,url,result,timestamp,building]{10,20}" in (
+        unquote(server.request_log[-1][1])
+    )
+    rest = [build.buildno for build in builds]
+    assert rest == list(range(13, 0, -1))
+    assert server.request_count == 3
+
+
+def test_builds_hold_the_fields_of_their_page(job, server):
+    build = next(job.iter_builds())
+    assert build.baseurl == server.baseurl + "/job/job_00000/25"
+    assert build.get_status() == "SUCCESS"
+    assert build._data["building"] is False
+    assert server.request_count == 1
+    assert build.get_duration().total_seconds() == 1.025
+    assert server.request_count == 2
+
+
+def test_oldest_first(job, server):
+    numbers = [b.buildno for b in job.iter_builds(newest_first=False)]
+    assert numbers == list(range(1, 26))
+    # first and last build numbers, one probe and one page
+    assert server.request_count == 3
+
+
+def test_oldest_first_with_builds_started(job, server):
+    builds = job.iter_builds(newest_first=False, page_size=5)
+    numbers = [next(builds).buildno for _ in range(7)]
+    for _ in range(3):
+        server.data.add_build("job_00000")
+    numbers += [build.buildno for build in builds]
+    assert numbers[:25] == list(range(1, 26))
+    assert len(set(numbers)) == len(numbers)
+
+
+def test_oldest_first_with_deleted_builds(monkeypatch):
+    numbers = [30, 29, 20, 12, 11, 5]
+    data = {
+        "firstBuild": {"number": 5},
+        "lastBuild": {"number": 30},
+        "allBuilds": [
+            {"number": n, "url": "http://localhost/job/foo/%d/" % n}
+            for n in numbers
+        ],
+    }
+
+    def fake_poll(cls, tree=None):  # pylint: disable=unused-argument
+        return apply_tree(data, parse_tree(tree)) if tree else data
+
+    monkeypatch.setattr(Job, "_poll", fake_poll)
+    jenkins = Jenkins("http://localhost", use_crumb=False, lazy=True)
+    job = Job("http://localhost/job/foo", "foo", jenkins)
+    builds = job.iter_builds(fields=(), newest_first=False, page_size=4)
+    assert [build.buildno for build in builds] == numbers[::-1]
+
+
+def test_build_ids(job, server):
+    assert list(job.get_build_ids()) == list(range(25, 0, -1))
+    assert server.request_count == 1
@@ -0,0 +1,67 @@
+import pytest
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.jenkinsbase import JenkinsBase
+
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=4, folders=2, folder_depth=2, jobs_per_folder=2, builds=10
+)
+
+
+@pytest.fixture
+def jenkins(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy=True)
+    server.reset_stats()
+    return jenkins
+
+
+def test_jobs_tree_fields():
+    assert JenkinsBase.jobs_tree(2, fields=["lastBuild[number]"]) == (
+        "jobs[name,color,url,lastBuild[number],"
+        "jobs[name,color,url,lastBuild[number]]]"
+    )
+
+
+def test_iter_jobs_in_one_request(jenkins, server):
+    jobs = list(jenkins.iter_jobs())
+    assert server.request_count == 1
+    assert len(jobs) == 4 + 2 * 2 * 2
+    job = jobs[-1]
+    assert job.baseurl == (
+        server.baseurl + "/job/folder_001/job/sub_1/job/job_00001"
+    )
+    assert job.name == "job_00001"
+    assert job._data["lastBuild"]["result"] == "FAILURE"
+    assert job._data["healthReport"][0]["score"] == 80
+    assert job.get_last_buildnumber() == 10
+    assert job.is_enabled()
+    assert server.request_count == 1
+
+
+def test_field_outside_projection_fetches_job(jenkins, server):
+    job = next(jenkins.iter_jobs(fields=[]))
+    assert not job._data.is_complete
+    server.reset_stats()
+    # accessors fetch their fields, other lookups the whole job
+    assert job.get_next_build_number() == 11
+    assert job.get_next_build_number() == 11
+    assert job._data["lastBuild"]["number"] == 10
+    assert [path for _, path in server.request_log] == [
+        "/job/job_00000/api/json?tree=nextBuildNumber",
+        "/job/job_00000/api/json",
+    ]
+    # fresh values are requested again once the job is complete
+    assert job.get_last_buildnumber() == 10
+    assert server.request_count == 3
+
+
+def test_write_stops_answering_from_listing(jenkins, server, mocker):
+    job = next(jenkins.iter_jobs())
+    mocker.patch.object(jenkins.requester, "post_url")
+    job.disable()
+    assert job.is_enabled()
+    assert server.request_log[-1] == (
+        "GET",
+        "/job/job_00000/api/json?tree=color",
+    )
@@ -85,6 +85,7 @@ def test_reload(monkeypatch):
     class FakeResponse(object):
         status_code = 200
         text = "{}"
+        content = b"{}"
 
     def fake_get_url(
         url,  # pylint: disable=unused-argument
@@ -142,6 +143,10 @@ def test_create_new_job_fail(mocker, monkeypatch):
     mock_requester.post_xml_and_confirm_status = mocker.MagicMock(
         return_value=""
     )
+    # no job exists at the url probed for the new job
+    mock_requester.get_url = mocker.MagicMock(
+        return_value=mocker.Mock(status_code=404)
+    )
 
     jenkins = Jenkins(
         "http://localhost:8080/",
@@ -281,6 +286,7 @@ def test_get_version_nonexistent(mocker):
         status_code = 200
         headers = {}
         text = "{}"
+        content = b"{}"
 
     mock_requester = Requester(username="foouser", password="foopassword")
     mock_requester.get_url = mocker.MagicMock(return_value=MockResponse())
@@ -298,6 +304,7 @@ def test_get_master_data(mocker):
         status_code = 200
         headers = {}
         text = "{}"
+        content = b"{}"
 
     mock_requester = Requester(username="foouser", password="foopassword")
     mock_requester.get_url = mocker.MagicMock(return_value=MockResponse())
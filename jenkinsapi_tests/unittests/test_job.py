@@ -7,8 +7,10 @@ from jenkinsapi.job import Job
 from jenkinsapi.build import Build
 from jenkinsapi.jenkins import Jenkins
 from jenkinsapi.jenkinsbase import JenkinsBase
-from jenkinsapi.custom_exceptions import NoBuildData
+from jenkinsapi.custom_exceptions import NoBuildData, NotFound
 from jenkinsapi.credentials import Credentials2x
+from jenkinsapi.utils.fake_jenkins import apply_tree, parse_tree
+from jenkinsapi.utils.requester import BatchResult
 
 
 @pytest.fixture(scope="function")
@@ -163,12 +165,19 @@ def test_nobuilds_get_build_dict(job_tree_empty):
         job_tree_empty.get_build_dict()
 
 
-def test_get_build_ids(job):
-    # We don't want to deal with listreverseiterator here
+def test_get_build_ids(job, monkeypatch):
+    all_builds = {"allBuilds": [configs.JOB_DATA["lastBuild"]]}
+    all_builds["allBuilds"] += configs.JOB_DATA["allBuilds"]
+
+    def fake_get_data(cls, url, tree=None):  # pylint: disable=unused-argument
+        return apply_tree(all_builds, parse_tree(tree))
+
+    monkeypatch.setattr(JenkinsBase, "get_data", fake_get_data)
+    # We don't want to deal with the generator here
     # So we convert result to a list
     ret = list(job.get_build_ids())
     assert isinstance(ret, list)
-    assert len(ret) == 4
+    assert ret == [4, 3, 2, 1]
 
 
 def test_nobuilds_get_revision_dict(jenkins, monkeypatch):
@@ -228,17 +237,15 @@ def test__add_missing_builds_no_first_build(job, mocker):
 
 
 @mock.patch.object(JenkinsBase, "get_data")
-def test__add_missing_builds_no_builds(job, mocker):
-    mocker.spy(JenkinsBase, "get_data")
-
-    initial_call_count = job.get_data.call_count
+def test__add_missing_builds_no_builds(get_data, job):
+    initial_call_count = get_data.call_count
     mock_data = configs.JOB_DATA.copy()
     mock_data["builds"] = None
     job._data = mock_data
 
     job._add_missing_builds(mock_data)
 
-    assert initial_call_count == job.get_data.call_count
+    assert initial_call_count == get_data.call_count
 
 
 def test_get_params(job):
@@ -383,64 +390,96 @@ def test_restrict_to_node_sets_assigned_node_and_disables_roaming(job, mocker):
     assert "<canRoam>false</canRoam>" in updated_config
 
 
-def test_get_build_by_params(jenkins, monkeypatch, mocker):
-    build_params = {"param1": "value1"}
-    fake_builds = (
-        mocker.Mock(get_params=lambda: {}),
-        mocker.Mock(get_params=lambda: {}),
-        mocker.Mock(get_params=lambda: build_params),
-    )
+def _fake_builds_with_params(monkeypatch, params_by_number):
+    numbers = sorted(params_by_number, reverse=True)
+    job_data = {
+        "firstBuild": {"number": numbers[-1]},
+        "lastBuild": {"number": numbers[0]},
+        "allBuilds": [
+            {
+                "number": number,
+                "url": "http://localhost/jobs/foo/%i/" % number,
+                "actions": [
+                    {
+                        "_class": "hudson.model.ParametersAction",
+                        "parameters": [
+                            {"name": name, "value": value}
+                            for name, value in params.items()
+                        ],
+                    }
+                ],
+            }
+            for number, params in sorted(params_by_number.items())[::-1]
+        ],
+    }
 
-    build_call_count = [0]
+    def fake_poll(cls, tree=None):  # pylint: disable=unused-argument
+        if tree is None:
+            return {}
+        return apply_tree(job_data, parse_tree(tree))
+
+    def fake_build_poll(build, tree=None):  # pylint: disable=unused-argument
+        (data,) = [
+            row
+            for row in job_data["allBuilds"]
+            if row["number"] == build.buildno
+        ]
+        return data
 
-    def fake_get_build(cls, number):  # pylint: disable=unused-argument
-        build_call_count[0] += 1
-        return fake_builds[number - 1]
+    monkeypatch.setattr(Job, "_poll", fake_poll)
+    monkeypatch.setattr(Build, "_poll", fake_build_poll)
 
-    monkeypatch.setattr(Job, "_poll", lambda self, tree=None: {})
-    monkeypatch.setattr(Job, "get_first_buildnumber", lambda x: 1)
-    monkeypatch.setattr(Job, "get_last_buildnumber", lambda x: 3)
-    monkeypatch.setattr(Job, "get_build", fake_get_build)
-    mocker.spy(Build, "get_params")
-    mocker.spy(Job, "get_build")
+
+def test_get_build_by_params(jenkins, monkeypatch):
+    build_params = {"param1": "value1"}
+    _fake_builds_with_params(
+        monkeypatch, {1: {}, 2: build_params, 3: build_params}
+    )
 
     job = Job("http://localhost/jobs/foo", "foo", jenkins)
 
     result = job.get_build_by_params(build_params)
 
-    assert job.get_build.call_count == 3
-    assert build_call_count[0] == 3
-    assert result == fake_builds[2]
+    assert isinstance(result, Build)
+    assert result.buildno == 2
+    assert result.get_params() == build_params
+    assert job.get_build_by_params(build_params, order=-1).buildno == 3
 
 
-def test_get_build_by_params_not_found(jenkins, monkeypatch, mocker):
+def test_get_build_by_params_not_found(jenkins, monkeypatch):
     build_params = {"param1": "value1"}
-    fake_builds = (
-        mocker.Mock(get_params=lambda: {}),
-        mocker.Mock(get_params=lambda: {}),
-        mocker.Mock(get_params=lambda: {}),
-    )
+    _fake_builds_with_params(monkeypatch, {1: {}, 2: {}, 3: {}})
+
+    job = Job("http://localhost/jobs/foo", "foo", jenkins)
 
-    build_call_count = [0]
+    with pytest.raises(NoBuildData):
+        job.get_build_by_params(build_params)
 
-    def fake_get_build(cls, number):  # pylint: disable=unused-argument
-        build_call_count[0] += 1
-        return fake_builds[number - 1]
 
-    monkeypatch.setattr(Job, "_poll", lambda self, tree=None: {})
-    monkeypatch.setattr(Job, "get_first_buildnumber", lambda x: 1)
-    monkeypatch.setattr(Job, "get_last_buildnumber", lambda x: 3)
-    monkeypatch.setattr(Job, "get_build", fake_get_build)
-    mocker.spy(Build, "get_params")
-    mocker.spy(Job, "get_build")
+def test_get_build_by_params_bad_order(jenkins, monkeypatch):
+    _fake_builds_with_params(monkeypatch, {1: {}})
 
     job = Job("http://localhost/jobs/foo", "foo", jenkins)
 
-    with pytest.raises(NoBuildData):
-        job.get_build_by_params(build_params)
+    with pytest.raises(ValueError):
+        job.get_build_by_params({}, order=0)
+
+
+def test_get_builds_raises_batch_errors(jenkins, monkeypatch):
+    def fake_get_data_many(cls, urls, params=None, **kwargs):  # pylint: disable=unused-argument
+        yield BatchResult(index=0, url=urls[0], error=NotFound("gone"))
+
+    monkeypatch.setattr(Job, "_poll", lambda self, tree=None: {})
+    monkeypatch.setattr(
+        Job, "get_build_dict", lambda self: {1: "http://localhost/1/"}
+    )
+    monkeypatch.setattr(JenkinsBase, "get_data_many", fake_get_data_many)
+    job = Job("http://localhost/jobs/foo", "foo", jenkins)
 
-    assert job.get_build.call_count == 3
-    assert build_call_count[0] == 3
+    with pytest.raises(NotFound):
+        list(job.get_builds())
+    with pytest.raises(NotFound):
+        list(job.get_builds([7]))
 
 
 def test_credentials_property(job, monkeypatch):
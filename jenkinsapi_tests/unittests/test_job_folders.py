@@ -1,6 +1,9 @@
 import pytest
 import mock
-from jenkinsapi.jenkins import JenkinsBase
+from jenkinsapi.jenkins import Jenkins, JenkinsBase
+from jenkinsapi.utils.requester import BatchResult
+
+JOBS_TREE = JenkinsBase.jobs_tree()
 
 
 @pytest.fixture(scope="function")
@@ -85,7 +88,7 @@ def test_empty_folder(jenkinsbase, monkeypatch, mocker):
 
     assert jenkinsbase.resolve_job_folders(jobs) == []
     spy.assert_called_once_with(
-        "http://localhost:8080/job/Folder1/api/python", tree="jobs[name,color]"
+        "http://localhost:8080/job/Folder1/api/json", tree=JOBS_TREE
     )
 
 
@@ -130,7 +133,7 @@ def test_folder_job_mix(jenkinsbase, monkeypatch, mocker):
     ]
 
     spy.assert_called_once_with(
-        "http://localhost:8080/job/Folder1/api/python", tree="jobs[name,color]"
+        "http://localhost:8080/job/Folder1/api/json", tree=JOBS_TREE
     )
 
 
@@ -160,8 +163,12 @@ def test_multiple_folders(jenkinsbase, monkeypatch, mocker):
                 ]
             }
 
-    monkeypatch.setattr(JenkinsBase, "get_data", fake_get_data)
-    spy = mocker.spy(jenkinsbase, "get_data")
+    def fake_get_data_many(cls, urls, tree=None):  # pylint: disable=W0613
+        for index, url in enumerate(urls):
+            yield BatchResult(index, url, data=fake_get_data(cls, url, tree))
+
+    monkeypatch.setattr(JenkinsBase, "get_data_many", fake_get_data_many)
+    spy = mocker.spy(jenkinsbase, "get_data_many")
 
     jobs = [
         {
@@ -187,16 +194,13 @@ def test_multiple_folders(jenkinsbase, monkeypatch, mocker):
         },
     ]
 
-    assert spy.call_args_list == [
-        mock.call(
-            "http://localhost:8080/job/Folder1/api/python",
-            tree="jobs[name,color]",
-        ),
-        mock.call(
-            "http://localhost:8080/job/Folder2/api/python",
-            tree="jobs[name,color]",
-        ),
-    ]
+    spy.assert_called_once_with(
+        [
+            "http://localhost:8080/job/Folder1/api/json",
+            "http://localhost:8080/job/Folder2/api/json",
+        ],
+        tree=JOBS_TREE,
+    )
 
 
 def test_multiple_folder_levels(jenkinsbase, monkeypatch, mocker):
@@ -267,11 +271,76 @@ def test_multiple_folder_levels(jenkinsbase, monkeypatch, mocker):
 
     assert spy.call_args_list == [
         mock.call(
-            "http://localhost:8080/job/Folder1/api/python",
-            tree="jobs[name,color]",
+            "http://localhost:8080/job/Folder1/api/json",
+            tree=JOBS_TREE,
         ),
         mock.call(
-            "http://localhost:8080/job/Folder1/job/Folder2/api/python",
-            tree="jobs[name,color]",
+            "http://localhost:8080/job/Folder1/job/Folder2/api/json",
+            tree=JOBS_TREE,
         ),
     ]
+
+
+def test_nested_folders_resolved_inline(jenkinsbase, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("no request expected")
+
+    monkeypatch.setattr(JenkinsBase, "get_data", fail)
+    jobs = [
+        {
+            "name": "Folder1",
+            "jobs": [
+                {"name": "Bar", "color": "blue"},
+                {
+                    "name": "Folder 2",
+                    "jobs": [{"name": "Baz", "color": "red", "url": "x"}],
+                },
+                {"name": "Qux", "color": "blue"},
+            ],
+        },
+        {
+            "name": "Foo",
+            "url": "http://localhost:8080/job/Foo",
+            "color": "blue",
+        },
+    ]
+
+    assert jenkinsbase.resolve_job_folders(jobs) == [
+        {
+            "name": "Foo",
+            "url": "http://localhost:8080/job/Foo",
+            "color": "blue",
+        },
+        {
+            "name": "Bar",
+            "url": "http://localhost:8080/job/Folder1/job/Bar",
+            "color": "blue",
+        },
+        {
+            "name": "Baz",
+            "url": "http://localhost:8080/job/Folder1/job/Folder%202/job/Baz",
+            "color": "red",
+        },
+        {
+            "name": "Qux",
+            "url": "http://localhost:8080/job/Folder1/job/Qux",
+            "color": "blue",
+        },
+    ]
+    assert "url" not in jobs[0]["jobs"][0]
+
+
+def test_jobs_tree():
+    assert JenkinsBase.jobs_tree(1) == "jobs[name,color,url]"
+    assert JenkinsBase.jobs_tree(2) == (
+        "jobs[name,color,url,jobs[name,color,url]]"
+    )
+
+
+@pytest.mark.fake_jenkins(jobs=2, folders=3, folder_depth=5, jobs_per_folder=2)
+def test_folders_deeper_than_tree_are_fetched(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    # one listing request, then the three folders below the tree depth
+    assert server.request_count == 1 + 3
+    assert len(jenkins.jobs.keys()) == 2 + 3 * 5 * 2
+    assert "folder_002/sub_1/sub_2/sub_3/sub_4/job_00001" in jenkins.jobs
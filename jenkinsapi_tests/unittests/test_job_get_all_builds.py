@@ -9,6 +9,7 @@ except ImportError:
 from jenkinsapi import config
 from jenkinsapi.job import Job
 from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils.fake_jenkins import apply_tree, parse_tree
 
 
 class TestJobGetAllBuilds(unittest.TestCase):
@@ -61,6 +62,7 @@ class TestJobGetAllBuilds(unittest.TestCase):
     }
     JOB1_ALL_BUILDS_DATA = {
         "allBuilds": [
+            {"number": 4, "url": "http://halob:8080/job/foo/4/"},
             {"number": 3, "url": "http://halob:8080/job/foo/3/"},
             {"number": 2, "url": "http://halob:8080/job/foo/2/"},
             {"number": 1, "url": "http://halob:8080/job/foo/1/"},
@@ -190,12 +192,15 @@ class TestJobGetAllBuilds(unittest.TestCase):
         TestJobGetAllBuilds.__get_data_call_count += 1
         try:
             if args["tree"]:
-                if "builds" in args["tree"]:
+                if args["tree"].startswith("allBuilds"):
+                    data = TestJobGetAllBuilds.URL_DATA[
+                        (url, "allBuilds[number,url]")
+                    ]
+                    return apply_tree(data, parse_tree(args["tree"]))
+                elif "builds" in args["tree"]:
                     return {
                         "builds": TestJobGetAllBuilds.URL_DATA[url]["builds"]
                     }
-                elif "allBuilds" in args["tree"]:
-                    return TestJobGetAllBuilds.URL_DATA[(url, args["tree"])]
                 elif "lastBuild" in args["tree"]:
                     return {
                         "lastBuild": TestJobGetAllBuilds.URL_DATA[url][
@@ -0,0 +1,51 @@
+import dataclasses
+
+import pytest
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.job import JobStatus
+
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=2, builds=10, queue_items=1, running_polls=1
+)
+
+
+@pytest.fixture
+def jenkins(server):
+    return Jenkins(server.baseurl, use_crumb=False, lazy=True)
+
+
+def test_snapshot_is_read_in_one_request(jenkins, server):
+    job = jenkins.get_job("job_00000")
+    server.reset_stats()
+    status = job.status_snapshot()
+    assert server.request_count == 1
+    assert status.in_queue
+    assert status.queue_id == 1
+    assert status.last_build_number == 10
+    assert status.building
+    assert status.color == "red_anime"
+    assert status.timestamp is not None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        status.building = False
+
+
+def test_predicates_cost_one_request_each(jenkins, server):
+    job = jenkins.get_job("job_00001")
+    server.reset_stats()
+    assert job.is_queued_or_running()
+    assert job.is_running()
+    assert not job.is_queued()
+    assert server.request_count == 3
+
+    server.data.is_running(server.data.items["job_00001"], 10, True)
+    assert not job.is_queued_or_running()
+    assert job.status_snapshot().result == "FAILURE"
+
+
+def test_job_without_builds(jenkins, server):
+    server.data.add_job("empty", builds=0)
+    status = jenkins.get_job("empty").status_snapshot()
+    assert status == JobStatus(in_queue=False, color="notbuilt")
+    assert not status.is_queued_or_running
@@ -1,10 +1,15 @@
+from urllib.parse import quote
+
 import pytest
 
 from jenkinsapi.jenkins import Jenkins
 from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.custom_exceptions import UnknownJob
 from jenkinsapi.jobs import Jobs
 from jenkinsapi.utils.requester import Requester
 
+pytestmark = pytest.mark.fake_jenkins(jobs=5, folders=2, jobs_per_folder=2)
+
 
 @pytest.fixture(scope="function")
 def jenkins(mocker, monkeypatch):
@@ -18,6 +23,10 @@ def jenkins(mocker, monkeypatch):
     mock_requester.post_xml_and_confirm_status = mocker.MagicMock(
         return_value=""
     )
+    # no job exists at the url probed for the new job
+    mock_requester.get_url = mocker.MagicMock(
+        return_value=mocker.Mock(status_code=404)
+    )
 
     return Jenkins(
         "http://localhost:8080/",
@@ -51,6 +60,7 @@ def test_normalizes_job_name_for_contains_and_getitem():
     class DummyResponse:
         status_code = 200
         text = "{}"
+        content = b"{}"
 
     class DummyRequester:
         @staticmethod
@@ -75,3 +85,161 @@ def test_normalizes_job_name_for_contains_and_getitem():
     assert jobs["folder1/folder2/job-name"].name == (
         "folder1/folder2/job-name"
     )
+
+
+@pytest.fixture
+def fake_jenkins(server, mocker):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    mocker.patch.object(jenkins.requester, "post_and_confirm_status")
+    mocker.patch.object(jenkins.requester, "post_xml_and_confirm_status")
+    jenkins.jobs.keys()
+    server.reset_stats()
+    return jenkins
+
+
+def test_index_finds_short_and_full_names(fake_jenkins):
+    jobs = fake_jenkins.jobs
+    assert "job_00003" in jobs
+    assert "folder_001/job_00001" in jobs
+    assert "/job/folder_001/job/job_00001/" in jobs
+    assert "missing" not in jobs
+    # the short name resolves to the first job with that name
+    assert jobs["job_00001"].baseurl.endswith("/job/job_00001")
+    with pytest.raises(UnknownJob):
+        jobs["missing"]
+
+
+def test_mutations_update_index_without_polling(fake_jenkins, server):
+    jobs = fake_jenkins.jobs
+    jobs.create("folder_000/new-job", "<project/>")
+    assert "folder_000/new-job" in jobs
+    assert jobs["new-job"].baseurl.endswith("/job/folder_000/job/new-job")
+
+    jobs.copy("job_00002", "copied")
+    assert "copied" in jobs
+
+    jobs.rename("copied", "renamed")
+    assert "copied" not in jobs
+    assert jobs["renamed"].baseurl.endswith("/job/renamed")
+
+    del jobs["renamed"]
+    assert "renamed" not in jobs
+    assert len(jobs) == 5 + 2 * 2 + 1
+    assert server.request_count == 0
+
+
+def test_deleting_first_duplicate_falls_back_to_next(fake_jenkins):
+    jobs = fake_jenkins.jobs
+    del jobs["job_00001"]
+    assert "job_00001" in jobs
+    assert jobs["job_00001"].baseurl.endswith("/job/folder_000/job/job_00001")
+    del jobs["job_00001"]
+    assert jobs["job_00001"].baseurl.endswith("/job/folder_001/job/job_00001")
+    del jobs["job_00001"]
+    assert "job_00001" not in jobs
+    assert "job_00001" not in jobs._shadowed
+
+
+def test_removing_a_row_does_not_scan_the_listing(fake_jenkins, mocker):
+    jobs = fake_jenkins.jobs
+    matches = mocker.spy(jobs, "_job_row_matches_name")
+    row = jobs._get_index()["folder_000/job_00001"]
+    jobs._unindex_row(row)
+    assert matches.call_count == 0
+    assert "folder_000/job_00001" not in jobs._get_index()
+    # the job it shadowed keeps its place behind the first one
+    assert jobs._shadowed["job_00001"] == [
+        jobs._get_index()["folder_001/job_00001"]
+    ]
+
+
+def test_creating_a_folder_reloads_jobs(fake_jenkins, server):
+    jobs = fake_jenkins.jobs
+    jobs.create("new-folder", "<com.cloudbees.hudson.plugins.folder.Folder/>")
+    assert "new-folder" not in jobs
+    # probing new-folder, then listing the jobs again
+    assert [path for _, path in server.request_log] == [
+        "/job/new-folder/api/json?tree=name%2Ccolor",
+        "/api/json?tree=" + quote(jobs.jenkins.jobs_tree(), safe=""),
+    ]
+
+
+def test_get_job_by_full_name_without_listing(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    server.reset_stats()
+    job = jenkins.get_job("folder_001/job_00001")
+    assert job.baseurl == server.baseurl + "/job/folder_001/job/job_00001"
+    assert jenkins.has_job("job_00002")
+    assert not jenkins.has_job("folder_001/missing")
+    assert [path for _, path in server.request_log] == [
+        "/job/folder_001/job/job_00001/api/json?tree=name%2Ccolor",
+        "/job/job_00002/api/json?tree=name%2Ccolor",
+        "/job/folder_001/job/missing/api/json?tree=name%2Ccolor",
+    ]
+    assert not jenkins.jobs._data
+
+
+def test_folder_is_not_a_job(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    # a short name missing at the top level may name a job in a folder
+    assert "folder_001" not in jenkins.jobs
+    assert jenkins.jobs._data
+
+
+def test_refresh_yields_changes(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    jobs = jenkins.jobs
+    assert len(list(jobs.refresh())) == 5 + 2 * 2
+    assert list(jobs.refresh()) == []
+
+    row = jobs._find_row("job_00003")
+    server.data.add_job("folder_001/added", builds=1)
+    server.data.remove_item("job_00004")
+    server.data.add_build("job_00003")
+    server.reset_stats()
+    events = list(jobs.refresh())
+    assert server.request_count == 1
+
+    assert [(event.kind, event.name) for event in events] == [
+        ("changed", "job_00003"),
+        ("added", "folder_001/added"),
+        ("removed", "job_00004"),
+    ]
+    assert (events[0].previous_color, events[0].color) == ("red", "blue")
+    # kept rows are updated in place; the index is rebuilt once
+    assert jobs._find_row("job_00003") is row
+    assert "folder_001/added" in jobs
+    assert "added" in jobs
+    assert "job_00004" not in jobs
+    assert jobs._indexed_data is jobs._data
+
+
+def test_refresh_rebuilds_the_index_once(server, mocker):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    jobs = jenkins.jobs
+    jobs._load()
+    jobs._get_index()
+    for name in ("job_00000", "job_00001", "folder_000/job_00000"):
+        server.data.remove_item(name)
+    unindex = mocker.spy(jobs, "_unindex_row")
+    index = mocker.spy(jobs, "_index_row")
+    events = list(jobs.refresh())
+    assert [event.kind for event in events] == ["removed"] * 3
+    assert unindex.call_count == 0
+    assert index.call_count == len(jobs._data) == 5 + 2 * 2 - 3
+    assert jobs["job_00000"].baseurl.endswith("/job/folder_001/job/job_00000")
+
+
+def test_refresh_matches_rows_by_full_name(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    jobs = jenkins.jobs
+    jobs.keys()
+    # added by this client: the short name of the folder job is indexed
+    # before the top level job of the same name
+    for full_name in ("folder_000/dup", "dup"):
+        server.data.add_job(full_name)
+        jobs._add_row(jobs._new_row(full_name))
+    assert jobs._get_index()["dup"]["url"].endswith("/job/folder_000/job/dup")
+    events = list(jobs.refresh())
+    assert [e.kind for e in events if e.kind != "changed"] == []
+    assert jobs["folder_000/dup"].baseurl.endswith("/job/folder_000/job/dup")
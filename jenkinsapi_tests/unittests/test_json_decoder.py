@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils import json_decoder
+
+
+class FakeResponse(object):
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+
+@pytest.fixture
+def decoder():
+    previous = json_decoder.get_decoder()
+    yield json_decoder
+    json_decoder.set_decoder(previous)
+
+
+def test_default_decoder_is_fastest_installed():
+    expected = [
+        name for name in ("msgspec", "orjson") if name in json_decoder.DECODERS
+    ] or ["json"]
+    assert json_decoder.get_decoder() == expected[0]
+
+
+@pytest.mark.parametrize("name", sorted(json_decoder.DECODERS))
+def test_decoders_parse_bytes(decoder, name):
+    decoder.set_decoder(name)
+    payload = {"name": "job", "building": True, "result": None, "n": 3}
+    assert decoder.loads(json.dumps(payload).encode("utf-8")) == payload
+
+
+def test_set_callable_decoder(decoder):
+    calls = []
+
+    def my_loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    decoder.set_decoder(my_loads)
+    assert decoder.get_decoder() == "my_loads"
+    assert JenkinsBase._parse_data_response("url", FakeResponse(b"{}")) == {}
+    assert calls == [b"{}"]
+
+
+def test_set_unknown_decoder(decoder):
+    with pytest.raises(ValueError):
+        decoder.set_decoder("yaml")
+
+
+def test_python_literal_fallback_keeps_strings_intact():
+    content = b"{'building': True, 'description': 'None of True', 'x': None}"
+    assert JenkinsBase._parse_data_response("url", FakeResponse(content)) == {
+        "building": True,
+        "description": "None of True",
+        "x": None,
+    }
+
+
+def test_unparseable_content():
+    with pytest.raises(JenkinsAPIException):
+        JenkinsBase._parse_data_response("url", FakeResponse(b"<html>"))
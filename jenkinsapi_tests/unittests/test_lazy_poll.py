@@ -0,0 +1,102 @@
+import pytest
+from requests import HTTPError
+
+from jenkinsapi import config
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.jenkinsbase import tree_fields
+from jenkinsapi.job import Job
+
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=300, folders=2, jobs_per_folder=5, builds=50
+)
+
+
+def test_iterating_jobs_costs_no_extra_requests(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    server.reset_stats()
+    names = [name for name, job in jenkins.jobs.iteritems()]
+    assert len(names) == 310
+    # the job listing includes the folder contents
+    assert server.request_count == 1
+
+
+def test_global_switch(server, monkeypatch):
+    monkeypatch.setattr(config, "LAZY_POLL", True)
+    server.reset_stats()
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    assert not jenkins.is_hydrated
+    job = Job(server.baseurl + "/job/job_00001", "job_00001", jenkins)
+    assert server.request_count == 0
+    assert not job.is_hydrated
+
+
+def test_accessor_fetches_only_its_fields(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    job = Job(
+        server.baseurl + "/job/job_00001", "job_00001", jenkins, lazy=True
+    )
+    server.reset_stats()
+    assert job.get_next_build_number() == 51
+    assert not job.has_params()
+    # fetched fields are kept
+    assert job.get_next_build_number() == 51
+    assert not job.has_params()
+    assert [path for _, path in server.request_log] == [
+        "/job/job_00001/api/json?tree=nextBuildNumber",
+        "/job/job_00001/api/json?tree=actions%5BparameterDefinitions%5Bname"
+        "%5D%5D%2Cproperty%5BparameterDefinitions%5Bname%5D%5D",
+    ]
+    assert job.is_hydrated
+    assert not job._data.is_complete
+    # a partial projection of actions is not taken for the whole value
+    assert not dict.__contains__(job._data, "actions")
+
+    assert job._data["name"] == "job_00001"
+    assert isinstance(job._data["actions"], list)
+    assert server.request_count == 3
+    server.reset_stats()
+    assert job.get_description() == ""
+    assert server.request_count == 0
+
+
+def test_lazy_build(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    job = jenkins.get_job("job_00002")
+    build = job.get_build(7)
+    server.reset_stats()
+    assert build.get_status() == "SUCCESS"
+    assert server.request_log == [
+        ("GET", "/job/job_00002/7/api/json?depth=1&tree=result")
+    ]
+    assert build.get_params() == {"BRANCH": "branch-2"}
+    assert build.is_hydrated
+
+
+def test_lazy_build_fields_are_fetched_once(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False, lazy_poll=True)
+    build = jenkins.get_job("job_00002").get_build(7)
+    server.reset_stats()
+    for _ in range(5):
+        str(build)
+        build.get_timestamp()
+        build.get_duration()
+    assert server.request_count == 3
+    assert build.is_hydrated
+
+
+def test_failed_lazy_poll_is_retried(server):
+    jenkins = Jenkins(server.baseurl, use_crumb=False)
+    job = Job(server.baseurl + "/job/missing", "missing", jenkins, lazy=True)
+    with pytest.raises(HTTPError):
+        job._data
+    with pytest.raises(HTTPError):
+        job._data
+    assert not job.is_hydrated
+
+
+def test_tree_fields():
+    assert tree_fields("number,url") == {"number": False, "url": False}
+    assert tree_fields(
+        "actions[parameters[name,value]],allBuilds[number]{0,10},color"
+    ) == {"actions": True, "allBuilds": True, "color": False}
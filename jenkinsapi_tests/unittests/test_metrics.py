@@ -0,0 +1,191 @@
+import io
+
+import pytest
+import requests
+from mock import patch
+
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils.metrics import (
+    RequestEvent,
+    RequestHook,
+    RequestMetrics,
+    endpoint_pattern,
+)
+from jenkinsapi.utils.requester import Requester
+from jenkinsapi.utils.retry import RetryPolicy
+
+BASEURL = "http://dummy"
+
+
+@pytest.mark.parametrize(
+    "url, params, expected",
+    [
+        (BASEURL + "/api/json", None, "api/json"),
+        (
+            BASEURL + "/job/a/job/b/12/api/json",
+            {"tree": "builds[number]"},
+            "job/*/job/*/*/api/json?tree=...",
+        ),
+        (
+            BASEURL + "/job/a/lastBuild/api/json?depth=1",
+            {"tree": "x"},
+            "job/*/lastBuild/api/json?depth=...&tree=...",
+        ),
+        (
+            BASEURL + "/job/a/3/artifact/out/lib.jar",
+            None,
+            "job/*/*/artifact/**",
+        ),
+        (
+            BASEURL + "/computer/agent%201/api/json",
+            None,
+            "computer/*/api/json",
+        ),
+        (BASEURL + "/queue/item/42/api/json", None, "queue/item/*/api/json"),
+    ],
+)
+def test_endpoint_pattern(url, params, expected):
+    assert endpoint_pattern(url, params) == expected
+
+
+def make_response(status_code, content=b"{}"):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.raw = io.BytesIO()
+    return response
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def request_started(self, event):
+        event.context["span"] = "span-%d" % len(self.events)
+
+    def request_finished(self, event):
+        self.events.append(event)
+
+
+def test_hooks_see_every_attempt(monkeypatch):
+    responses = [make_response(503), make_response(200, b'{"jobs": []}')]
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kw: responses.pop(0)
+    )
+    hook = RecordingHook()
+    req = Requester(
+        baseurl=BASEURL,
+        hooks=[hook],
+        retry_policy=RetryPolicy(breaker_threshold=None),
+    )
+    with patch("time.sleep"):
+        req.get_url(BASEURL + "/job/a/api/json", params={"tree": "x"})
+
+    first, second = hook.events
+    assert (first.status_code, first.attempt) == (503, 1)
+    assert (second.status_code, second.attempt) == (200, 2)
+    assert second.is_retry
+    assert second.response_bytes == len(b'{"jobs": []}')
+    assert first.context == {"span": "span-0"}
+    assert second.pattern == "job/*/api/json?tree=..."
+
+
+def test_hooks_see_errors(monkeypatch):
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    hook = RecordingHook()
+    req = Requester(baseurl=BASEURL)
+    req.add_hook(hook)
+    with pytest.raises(requests.ConnectionError):
+        req.get_url(BASEURL + "/api/json")
+    (event,) = hook.events
+    assert isinstance(event.error, requests.ConnectionError)
+
+
+def test_metrics_snapshot(monkeypatch):
+    monkeypatch.setattr(
+        requests.Session,
+        "get",
+        lambda self, url, **kw: make_response(200, b'{"name": "a"}'),
+    )
+    metrics = RequestMetrics(buckets=(0.1, 1))
+    req = Requester(baseurl=BASEURL, hooks=[metrics])
+
+    base = JenkinsBase(BASEURL, poll=False)
+    for name in ("a", "b"):
+        url = BASEURL + "/job/%s/api/json" % name
+        params = {"tree": "name"}
+        response = req.get_url(url, params)
+        base._decode_and_report(req, url, response, params, "name")
+
+    snapshot = metrics.snapshot()
+    stats = snapshot["GET job/*/api/json?tree=..."]
+    assert stats["count"] == 2
+    assert stats["status_codes"] == {"200": 2}
+    assert stats["response_bytes"] == 2 * len(b'{"name": "a"}')
+    assert stats["decode"]["count"] == 2
+    assert stats["latency"]["count"] == 2
+    assert stats["latency"]["buckets"][float("inf")] == 2
+
+
+def test_decode_time_is_recorded_with_its_request(monkeypatch):
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        lambda self, url, **kw: make_response(200, b'{"id": 1}'),
+    )
+    metrics = RequestMetrics()
+    req = Requester(baseurl=BASEURL, hooks=[metrics])
+    url = BASEURL + "/job/a/build"
+    response = req.post_url(url, params={"delay": "0sec"})
+    req.response_decoded(url, None, 0.25, response)
+
+    (key,) = metrics.snapshot()
+    assert key == "POST job/*/build?delay=..."
+    stats = metrics.snapshot()[key]
+    assert stats["count"] == 1
+    assert stats["decode"] == {"count": 1, "seconds": 0.25}
+
+
+def test_metrics_prometheus_export():
+    metrics = RequestMetrics(buckets=(0.1, 1))
+    hook_events = [
+        ("GET", 200, 0.05, 1),
+        ("GET", 503, 2.0, 1),
+        ("GET", 200, 0.5, 2),
+    ]
+    for method, status, elapsed, attempt in hook_events:
+        metrics.request_finished(
+            RequestEvent(
+                method,
+                BASEURL + '/job/a"b/api/json',
+                attempt=attempt,
+                status_code=status,
+                elapsed=elapsed,
+                response_bytes=10,
+            )
+        )
+    text = metrics.to_prometheus()
+    labels = 'method="GET",endpoint="job/*/api/json"'
+    assert "# TYPE jenkinsapi_requests_total counter" in text
+    assert 'jenkinsapi_requests_total{%s,status="200"} 2' % labels in text
+    assert 'jenkinsapi_requests_total{%s,status="503"} 1' % labels in text
+    assert "jenkinsapi_request_retries_total{%s} 1" % labels in text
+    assert "jenkinsapi_response_bytes_total{%s} 30" % labels in text
+    bucket = "jenkinsapi_request_duration_seconds_bucket{%s,le=" % labels
+    assert bucket + '"0.1"} 1' in text
+    assert bucket + '"1.0"} 2' in text
+    assert bucket + '"+Inf"} 3' in text
+    assert "jenkinsapi_request_duration_seconds_count{%s} 3" % labels in text
+    assert text.endswith("\n")
+
+
+def test_metrics_reset():
+    metrics = RequestMetrics()
+    metrics.response_decoded(RequestEvent("GET", BASEURL + "/api/json"), 0.1)
+    assert metrics.snapshot()
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -0,0 +1,140 @@
+import datetime
+
+import pytest
+import pytz
+
+from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.mirror import JenkinsMirror
+
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=3, folders=1, jobs_per_folder=1, builds=25, test_cases=3
+)
+
+
+@pytest.fixture
+def jenkins(server):
+    return Jenkins(server.baseurl, use_crumb=False, lazy=True)
+
+
+@pytest.fixture
+def mirror(jenkins, tmp_path):
+    with JenkinsMirror(
+        jenkins, str(tmp_path / "mirror.db"), page_size=10
+    ) as m:
+        yield m
+
+
+def test_sync_mirrors_builds_tests_and_artifacts(mirror, server):
+    stats = mirror.sync()
+    assert (stats.jobs, stats.updated_jobs, stats.builds) == (4, 4, 100)
+    assert stats.test_cases == 300
+    assert mirror.job_names() == [
+        "folder_000/job_00000",
+        "job_00000",
+        "job_00001",
+        "job_00002",
+    ]
+    assert mirror.get_watermark("job_00001") == 25
+
+    failures = mirror.builds(job="job_00001", result="FAILURE")
+    assert [build.number for build in failures] == [10, 20]
+    assert failures[0].duration == datetime.timedelta(milliseconds=1010)
+    assert failures[0].url == server.baseurl + "/job/job_00001/10/"
+
+    history = mirror.test_case_history(
+        "job_00001", "tests.test_module_0.test_0"
+    )
+    assert len(history) == 25
+    assert history[9].status == "FAILED"
+    assert history[9].identifier() == "tests.test_module_0.test_0"
+
+    (artifact,) = mirror.artifacts("job_00001", 3)
+    assert artifact.relative_path == "out/artifact_0.txt"
+    assert artifact.url == (
+        server.baseurl + "/job/job_00001/3/artifact/out/artifact_0.txt"
+    )
+
+
+def test_test_case_history_uses_the_case_index(mirror):
+    with mirror.connection:
+        mirror.connection.executemany(
+            "INSERT INTO test_cases VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                ("job", 2, "a.b", "c", "PASSED", 1.0),
+                ("job", 1, "a", "b.c", "FAILED", 1.0),
+                ("job", 3, "a.b", "d", "PASSED", 1.0),
+            ],
+        )
+    statements = []
+    mirror.connection.set_trace_callback(statements.append)
+    try:
+        history = mirror.test_case_history("job", "a.b.c")
+    finally:
+        mirror.connection.set_trace_callback(None)
+    assert [(case.number, case.class_name) for case in history] == [
+        (1, "a"),
+        (2, "a.b"),
+    ]
+    assert len(statements) == 2
+    for statement in statements:
+        plan = mirror.connection.execute("EXPLAIN QUERY PLAN " + statement)
+        assert "(job=? AND class_name=? AND name=?)" in str(plan.fetchall())
+
+
+def test_builds_by_time_range(mirror):
+    mirror.sync(jobs=["job_00000"])
+    first = mirror.builds()[0].timestamp
+    assert first.tzinfo is not None
+    since = first + datetime.timedelta(minutes=5)
+    until = first + datetime.timedelta(minutes=10)
+    assert [build.number for build in mirror.builds(since=since)][:2] == [
+        6,
+        7,
+    ]
+    naive = until.astimezone(pytz.utc).replace(tzinfo=None)
+    numbers = [b.number for b in mirror.builds(since=since, until=naive)]
+    assert numbers == [6, 7, 8, 9, 10]
+
+
+def test_sync_only_fetches_new_builds(mirror, server):
+    mirror.sync()
+    server.reset_stats()
+    assert mirror.sync().builds == 0
+    assert server.request_count == 1
+
+    server.data.add_build("job_00002")
+    server.reset_stats()
+    stats = mirror.sync()
+    assert (stats.updated_jobs, stats.builds, stats.test_cases) == (1, 1, 3)
+    # listing, one page of builds and one test report
+    assert server.request_count == 3
+    assert mirror.get_watermark("job_00002") == 26
+
+
+def test_running_builds_are_fetched_again(jenkins, server, tmp_path):
+    server.data.running_polls = 1
+    with JenkinsMirror(jenkins, str(tmp_path / "mirror.db")) as mirror:
+        mirror.sync(jobs=["job_00000"])
+        assert mirror.get_watermark("job_00000") == 24
+        assert mirror.builds()[-1].number == 24
+        server.data.is_running(server.data.items["job_00000"], 25, True)
+        assert mirror.sync(jobs=["job_00000"]).builds == 1
+        assert mirror.get_watermark("job_00000") == 25
+
+
+def test_recreated_job_is_mirrored_again(mirror, server):
+    mirror.sync(jobs=["job_00000"])
+    server.data.remove_item("job_00000")
+    server.data.add_job("job_00000", builds=2)
+    assert mirror.sync(jobs=["job_00000"]).builds == 2
+    assert [build.number for build in mirror.builds()] == [1, 2]
+
+
+def test_mirror_of_another_server(jenkins, tmp_path):
+    path = str(tmp_path / "mirror.db")
+    JenkinsMirror(jenkins, path).close()
+    other = Jenkins("http://127.0.0.1:9", use_crumb=False, lazy=True)
+    with pytest.raises(JenkinsAPIException):
+        JenkinsMirror(other, path)
@@ -0,0 +1,77 @@
+import json
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.job_snapshot import load_snapshot, save_snapshot
+
+LATENCY = 0.2
+
+
+pytestmark = pytest.mark.fake_jenkins(jobs=20, folders=2, jobs_per_folder=2)
+
+
+def test_prefetch_returns_before_the_job_list(server):
+    server.server.latency = LATENCY
+    try:
+        start = time.perf_counter()
+        jenkins = Jenkins(server.baseurl, use_crumb=False, prefetch=True)
+        assert time.perf_counter() - start < LATENCY
+        # the first lookup waits for the job list
+        assert "folder_001/job_00001" in jenkins.jobs
+        assert len(jenkins.jobs) == 24
+        assert jenkins._data["jobs"]
+    finally:
+        server.server.latency = 0
+
+
+def test_snapshot_warm_start(server, tmp_path):
+    path = str(tmp_path / "jobs.json")
+    jenkins = Jenkins(server.baseurl, use_crumb=False, snapshot_path=path)
+    jenkins.jobs.keys()
+    assert len(load_snapshot(path, jenkins.baseurl)) == 24
+
+    server.data.add_job("added")
+    server.server.latency = LATENCY
+    try:
+        start = time.perf_counter()
+        jenkins = Jenkins(
+            server.baseurl,
+            use_crumb=False,
+            lazy_poll=True,
+            prefetch=True,
+            snapshot_path=path,
+        )
+        # served from the snapshot
+        assert jenkins.has_job("job_00001")
+        assert jenkins.get_job("job_00002").name == "job_00002"
+        assert time.perf_counter() - start < LATENCY
+        # a job missing from the snapshot waits for the job list
+        assert "added" in jenkins.jobs
+    finally:
+        server.server.latency = 0
+        server.data.remove_item("added")
+    assert len(load_snapshot(path, jenkins.baseurl)) == 25
+
+
+def test_failed_prefetch_is_reported_by_lookups():
+    jenkins = Jenkins("http://127.0.0.1:9", use_crumb=False, prefetch=True)
+    with pytest.raises(ConnectionError):
+        jenkins.jobs.keys()
+
+
+def test_unusable_snapshots(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    assert load_snapshot(path, "http://a") is None
+    save_snapshot(path, "http://a", [{"name": "x"}])
+    assert load_snapshot(path, "http://a") == [{"name": "x"}]
+    assert load_snapshot(path, "http://b") is None
+    assert load_snapshot(path, "http://a", max_age=-1) is None
+    with open(path, "w") as snapshot:
+        snapshot.write("{")
+    assert load_snapshot(path, "http://a") is None
+    with open(path, "w") as snapshot:
+        json.dump({"version": 0}, snapshot)
+    assert load_snapshot(path, "http://a") is None
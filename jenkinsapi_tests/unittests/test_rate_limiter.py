@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+import requests
+from mock import patch
+
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.rate_limiter import (
+    ALL,
+    API_READ,
+    CONSOLE_READ,
+    MUTATION,
+    Limit,
+    RateLimiter,
+    TokenBucket,
+    base_key,
+    classify,
+)
+from jenkinsapi.utils.requester import Requester
+
+BASEURL = "http://dummy:8080"
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("GET", BASEURL + "/job/foo/api/json", API_READ),
+        ("GET", BASEURL + "/job/console/api/json", API_READ),
+        ("GET", BASEURL + "/job/foo/1/consoleText", CONSOLE_READ),
+        ("GET", BASEURL + "/job/foo/1/logText/progressiveText", CONSOLE_READ),
+        ("POST", BASEURL + "/job/foo/build", MUTATION),
+        ("post", BASEURL + "/job/foo/api/json", MUTATION),
+    ],
+)
+def test_classify(method, url, expected):
+    assert classify(method, url) == expected
+
+
+def test_bad_limits():
+    with pytest.raises(ValueError):
+        Limit(rate=0)
+    with pytest.raises(ValueError):
+        Limit(max_in_flight=0)
+    with pytest.raises(ValueError):
+        RateLimiter(limits={"reads": Limit(rate=1)})
+
+
+def test_token_bucket_reservations():
+    with patch("time.monotonic", return_value=100.0):
+        bucket = TokenBucket(rate=2, burst=2)
+        assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    with patch("time.monotonic", return_value=101.5):
+        # three tokens refilled, two of them owed to earlier reservations
+        assert bucket.reserve() == 0
+
+
+def test_rate_limit_sleeps():
+    limiter = RateLimiter(limits={MUTATION: Limit(rate=1)})
+    with patch("time.sleep") as mock_sleep:
+        for _ in range(3):
+            with limiter.limit("POST", BASEURL + "/job/foo/build"):
+                pass
+        with limiter.limit("GET", BASEURL + "/api/json"):
+            pass
+    assert mock_sleep.call_count == 2
+    stats = limiter.stats()
+    assert stats["dummy:8080"][MUTATION]["requests"] == 3
+    assert stats["dummy:8080"][MUTATION]["throttled"] == 2
+    assert API_READ not in stats["dummy:8080"]
+
+
+def test_max_in_flight_is_enforced():
+    limiter = RateLimiter(limits={ALL: Limit(max_in_flight=2)})
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def request():
+        with limiter.limit("GET", BASEURL + "/api/json"):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2
+    assert limiter.stats()["dummy:8080"][ALL]["peak_in_flight"] == 2
+    assert limiter.stats()["dummy:8080"][ALL]["in_flight"] == 0
+
+
+def test_base_limits_override():
+    limiter = RateLimiter(
+        limits={API_READ: Limit(rate=10)},
+        base_limits={"http://other/ci/": {API_READ: Limit(max_in_flight=1)}},
+    )
+    assert limiter.limit_for("dummy:8080", API_READ) == Limit(rate=10)
+    assert limiter.limit_for("other/ci", API_READ) == Limit(max_in_flight=1)
+    assert limiter.limit_for("https://other/ci", ALL) is None
+
+
+def test_limits_apply_per_base_url():
+    limiter = RateLimiter(
+        limits={ALL: Limit(max_in_flight=1)},
+        base_limits={"http://other/a": {}},
+    )
+    assert limiter.base_for("http://other/a/job/x/api/json") == "other/a"
+    assert limiter.base_for("http://other/ab/api/json") == "other"
+    # the base url of the requester, unless a longer one is configured
+    requester_base = "http://other/b/"
+    assert limiter.base_for("http://other/b/x", requester_base) == "other/b"
+    assert limiter.base_for("http://other/a/x", "http://other") == "other/a"
+    # two controllers of one host each get a slot
+    with limiter.limit("GET", "http://other/a/api/json"):
+        with limiter.limit("GET", "http://other/b/api/json", "http://other/b"):
+            pass
+    assert set(limiter.stats()) == {"other/a", "other/b"}
+
+
+def test_requester_uses_limiter(monkeypatch):
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kwargs: "SUCCESS"
+    )
+    limiter = RateLimiter(limits={ALL: Limit(max_in_flight=4)})
+    req = Requester(baseurl=BASEURL, rate_limiter=limiter)
+    assert req.get_url(BASEURL + "/api/json") == "SUCCESS"
+    assert limiter.stats()["dummy:8080"][ALL]["requests"] == 1
+
+
+def test_streamed_response_holds_its_slot(server):
+    limiter = RateLimiter(limits={ALL: Limit(max_in_flight=1)})
+    req = Requester(baseurl=server.baseurl, rate_limiter=limiter)
+    url = server.baseurl + "/api/json"
+    response = req.get_url(url, stream=True)
+    stats = limiter.stats
+    assert stats()[base_key(server.baseurl)][ALL]["in_flight"] == 1
+    response.content
+    assert stats()[base_key(server.baseurl)][ALL]["in_flight"] == 0
+
+    req.get_url(url, stream=True).close()
+    req.get_url(url)
+    assert stats()[base_key(server.baseurl)][ALL]["in_flight"] == 0
+
+
+def test_clones_share_limiter(monkeypatch):
+    monkeypatch.setattr(Jenkins, "_poll", lambda self, tree=None: {})
+    limiter = RateLimiter()
+    jenkins = Jenkins(BASEURL, rate_limiter=limiter, use_crumb=False)
+    assert jenkins.requester.rate_limiter is limiter
+    assert jenkins._clone().requester.rate_limiter is limiter
+    other = jenkins.get_jenkins_obj_from_url(BASEURL + "/job/folder")
+    assert other.requester.rate_limiter is limiter
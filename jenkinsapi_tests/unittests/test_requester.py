@@ -1,7 +1,12 @@
+import io
+import time
+
 import pytest
 import requests
 from jenkinsapi.jenkins import Requester
-from jenkinsapi.custom_exceptions import JenkinsAPIException
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.custom_exceptions import CircuitOpen, JenkinsAPIException
+from jenkinsapi.utils.retry import RetryPolicy
 from mock import patch
 
 
@@ -393,3 +398,217 @@ def test_configure_max_retries():
     )
     for adapter in req.session.adapters.values():
         assert adapter.max_retries.total == 3
+
+
+def test_get_many_ordered_results(monkeypatch):
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        if url.endswith("3"):
+            time.sleep(0.05)
+        return url + "?" + kwargs["params"]["tree"]
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    req = Requester()
+    urls = ["http://dummy/%i" % idx for idx in range(5)]
+    results = list(req.get_many(urls, params={"tree": "x"}, max_workers=3))
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.response for result in results] == [
+        url + "?x" for url in urls
+    ]
+    assert all(result.ok for result in results)
+
+
+def test_get_many_as_completed(monkeypatch):
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        if url.endswith("0"):
+            time.sleep(0.1)
+        return url
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    req = Requester()
+    urls = ["http://dummy/%i" % idx for idx in range(3)]
+    results = list(req.get_many(urls, max_workers=3, ordered=False))
+
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    assert results[-1].index == 0
+
+
+def test_get_many_attaches_errors(monkeypatch):
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        if url.endswith("1"):
+            raise requests.ConnectionError("boom")
+        return url
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    req = Requester()
+    urls = ["http://dummy/%i" % idx for idx in range(3)]
+    results = list(req.get_many(urls))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, requests.ConnectionError)
+    assert results[1].response is None
+
+
+def test_get_many_per_url_params(monkeypatch):
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        return kwargs.get("params")
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    req = Requester()
+    results = list(req.get_many(["http://a", "http://b"], [{"a": 1}, None]))
+    assert [result.response for result in results] == [{"a": 1}, None]
+
+    # raised by the call, not by the first iteration
+    with pytest.raises(ValueError):
+        req.get_many(["http://a", "http://b"], [{"a": 1}])
+
+
+def test_get_many_sizes_connection_pool(monkeypatch):
+    monkeypatch.setattr(requests.Session, "get", lambda *a, **kw: "OK")
+
+    req = Requester(max_retries=2)
+    list(req.get_many(["http://dummy"] * 3, max_workers=32))
+
+    for adapter in req.session.adapters.values():
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 2
+
+
+def test_pool_grows_in_place():
+    req = Requester(max_retries=2)
+    adapter = req.session.get_adapter("http://dummy")
+    pool = adapter.poolmanager.connection_from_url("http://dummy")
+    req.ensure_pool_size(32)
+    # the open pool, and its connections, are kept
+    assert req.session.get_adapter("http://dummy") is adapter
+    assert adapter.poolmanager.connection_from_url("http://dummy") is pool
+    assert pool.pool.maxsize == 32
+
+
+def test_pool_of_caller_adapter_is_left_alone():
+    req = Requester(max_retries=2)
+    adapter = requests.adapters.HTTPAdapter(max_retries=5)
+    req.session.mount("https://", adapter)
+    req.ensure_pool_size(32)
+    assert req.session.get_adapter("https://dummy") is adapter
+    assert adapter._pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+    assert req.pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+
+
+def test_get_data_many_decodes_and_attaches_errors(monkeypatch):
+    class FakeResponse(object):
+        def __init__(self, status_code, text):
+            self.status_code = status_code
+            self.text = text
+            self.content = text.encode("utf-8")
+
+        def raise_for_status(self):
+            raise requests.HTTPError("status %i" % self.status_code)
+
+    responses = {
+        "http://dummy/ok": FakeResponse(200, '{"number": 1}'),
+        "http://dummy/missing": FakeResponse(404, ""),
+        "http://dummy/garbage": FakeResponse(200, "<html>"),
+    }
+    seen_params = []
+
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        seen_params.append(kwargs["params"])
+        return responses[url]
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    class FakeJenkins(JenkinsBase):
+        requester = Requester()
+
+        def get_jenkins_obj(self):
+            return self
+
+    base = FakeJenkins("http://dummy", poll=False)
+    results = list(
+        base.get_data_many(list(responses), params={"depth": 0}, tree="a")
+    )
+
+    assert results[0].data == {"number": 1}
+    assert isinstance(results[1].error, requests.HTTPError)
+    assert isinstance(results[2].error, JenkinsAPIException)
+    assert seen_params == [{"depth": 0, "tree": "a"}] * 3
+
+
+def _response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b""
+    response.raw = io.BytesIO()
+    return response
+
+
+def test_get_url_retries_with_policy(monkeypatch):
+    responses = [
+        _response(503),
+        _response(429, {"Retry-After": "2"}),
+        _response(200),
+    ]
+
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    policy = RetryPolicy(backoff_factor=1, jitter=False)
+    req = Requester(baseurl="http://dummy", retry_policy=policy)
+    with patch("time.sleep") as mock_sleep:
+        assert req.get_url("http://dummy").status_code == 200
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+    assert policy.stats()["retries_by_reason"] == {"503": 1, "429": 1}
+
+
+def test_get_url_retries_connection_errors(monkeypatch):
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    policy = RetryPolicy(max_retries=2, breaker_threshold=None)
+    req = Requester(baseurl="http://dummy", retry_policy=policy)
+    with patch("time.sleep"):
+        with pytest.raises(requests.ConnectionError):
+            req.get_url("http://dummy")
+    assert policy.stats()["retries"] == 2
+    assert policy.stats()["gave_up"] == 1
+
+
+def test_post_url_is_not_retried_by_default(monkeypatch):
+    calls = []
+
+    def fake_post(self, url, **kwargs):  # pylint: disable=unused-argument
+        calls.append(url)
+        return _response(503)
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    req = Requester(baseurl="http://dummy", retry_policy=RetryPolicy())
+    assert req.post_url("http://dummy", data="x").status_code == 503
+    assert len(calls) == 1
+
+
+def test_open_circuit_sheds_load(monkeypatch):
+    calls = []
+
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        calls.append(url)
+        return _response(502)
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    policy = RetryPolicy(
+        max_retries=0, breaker_window=4, breaker_min_requests=4
+    )
+    req = Requester(baseurl="http://dummy", retry_policy=policy)
+    for _ in range(4):
+        req.get_url("http://dummy/api/json")
+    with pytest.raises(CircuitOpen):
+        req.get_url("http://dummy/api/json")
+    assert len(calls) == 4
+    assert policy.stats()["breaker_trips"] == 1
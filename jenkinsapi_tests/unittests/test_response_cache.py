@@ -0,0 +1,164 @@
+import json
+
+import pytest
+import requests
+
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils.requester import Requester
+from jenkinsapi.utils.response_cache import ResponseCache
+
+BASEURL = "http://dummy"
+
+
+def make_response(status_code=200, data=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(data).encode("utf-8") if data else b""
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession(object):
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def __call__(self, url, **kwargs):
+        self.sent_headers.append(kwargs.get("headers") or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def install(*responses):
+        fake = FakeSession(responses)
+        monkeypatch.setattr(
+            requests.Session, "get", lambda self, url, **kw: fake(url, **kw)
+        )
+        return fake
+
+    return install
+
+
+def test_no_cache_by_default():
+    assert Requester(baseurl=BASEURL).cache is None
+
+
+def test_revalidates_with_etag(session):
+    cache = ResponseCache()
+    requester = Requester(baseurl=BASEURL, cache=cache)
+    first = make_response(data={"a": 1}, headers={"ETag": '"v1"'})
+    fake = session(first, make_response(304))
+
+    assert requester.get_url(BASEURL + "/api/json") is first
+    assert requester.get_url(BASEURL + "/api/json") is first
+    assert "If-None-Match" not in fake.sent_headers[0]
+    assert fake.sent_headers[1]["If-None-Match"] == '"v1"'
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["revalidations"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes_saved"] == len(first.content)
+
+
+def test_last_modified_header(session):
+    requester = Requester(baseurl=BASEURL, cache=ResponseCache())
+    stamp = "Wed, 21 Oct 2015 07:28:00 GMT"
+    fake = session(
+        make_response(data={"a": 1}, headers={"Last-Modified": stamp}),
+        make_response(304),
+    )
+    requester.get_url(BASEURL + "/api/json")
+    requester.get_url(BASEURL + "/api/json")
+    assert fake.sent_headers[1]["If-Modified-Since"] == stamp
+
+
+def test_changed_resource_replaces_entry(session):
+    cache = ResponseCache()
+    requester = Requester(baseurl=BASEURL, cache=cache)
+    second = make_response(data={"a": 2}, headers={"ETag": '"v2"'})
+    session(
+        make_response(data={"a": 1}, headers={"ETag": '"v1"'}),
+        second,
+    )
+    requester.get_url(BASEURL + "/api/json")
+    assert requester.get_url(BASEURL + "/api/json") is second
+    assert cache.stats()["misses"] == 2
+
+
+def test_ttl_serves_without_request(session):
+    cache = ResponseCache(ttl=60)
+    requester = Requester(baseurl=BASEURL, cache=cache)
+    fake = session(make_response(data={"a": 1}))
+    requester.get_url(BASEURL + "/api/json")
+    requester.get_url(BASEURL + "/api/json")
+    assert len(fake.sent_headers) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_ttl_overrides():
+    cache = ResponseCache(ttl=0, ttl_overrides={r"/testReport/": 3600})
+    assert cache.ttl_for(BASEURL + "/job/a/1/testReport/api/json") == 3600
+    assert cache.ttl_for(BASEURL + "/job/a/api/json") == 0
+
+
+def test_params_are_part_of_the_key(session):
+    requester = Requester(baseurl=BASEURL, cache=ResponseCache(ttl=60))
+    fake = session(make_response(data={"a": 1}), make_response(data={"a": 2}))
+    requester.get_url(BASEURL + "/api/json", params={"tree": "a"})
+    requester.get_url(BASEURL + "/api/json", params={"tree": "b"})
+    assert len(fake.sent_headers) == 2
+
+
+def test_uncacheable_and_streamed_responses(session):
+    cache = ResponseCache()
+    requester = Requester(baseurl=BASEURL, cache=cache)
+    session(
+        make_response(data={"a": 1}),
+        make_response(data={"a": 1}, headers={"ETag": '"v1"'}),
+    )
+    requester.get_url(BASEURL + "/api/json")
+    requester.get_url(BASEURL + "/api/json", stream=True)
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    for name in ("a", "b"):
+        cache.store((name,), make_response(data={}), name)
+    cache.get(("a",))
+    cache.store(("c",), make_response(data={}), "c")
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_bad_max_entries():
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
+
+
+def test_decoded_data_is_reused(session, monkeypatch):
+    requester = Requester(baseurl=BASEURL, cache=ResponseCache())
+    session(
+        make_response(data={"jobs": []}, headers={"ETag": '"v1"'}),
+        make_response(304),
+    )
+    decoded = []
+    decode = JenkinsBase._decode_data_response
+
+    def counting_decode(*args):
+        decoded.append(args[0])
+        return decode(*args)
+
+    monkeypatch.setattr(
+        JenkinsBase, "_decode_data_response", staticmethod(counting_decode)
+    )
+    url = BASEURL + "/api/json"
+
+    first = JenkinsBase._parse_data_response(url, requester.get_url(url))
+    first["extra"] = True
+    second = JenkinsBase._parse_data_response(url, requester.get_url(url))
+    assert second == {"jobs": []}
+    assert len(decoded) == 1
@@ -3,7 +3,14 @@ from unittest import mock
 
 import pytest
 
-from jenkinsapi.utils.retry import RetryConfig, RetryState, SimpleRetryConfig
+from jenkinsapi.custom_exceptions import CircuitOpen
+from jenkinsapi.utils.retry import (
+    RetryConfig,
+    RetryPolicy,
+    RetryState,
+    SimpleRetryConfig,
+    parse_retry_after,
+)
 
 
 def validate_retry_check(
@@ -60,3 +67,99 @@ def test_simple_retry_check_fail():
 def test_repr():
     retry_config = SimpleRetryConfig(sleep_period=1, timeout=5)
     assert repr(retry_config) == "SimpleRetryConfig(sleep_period=1, timeout=5)"
+
+
+def test_retry_policy_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_retry_policy_backoff_jitter():
+    policy = RetryPolicy(backoff_factor=1, jitter=True)
+    for _ in range(20):
+        assert 0 <= policy.backoff(3) <= 4
+
+
+def test_retry_policy_is_a_retry_config():
+    policy = RetryPolicy(max_retries=2, backoff_factor=1, jitter=False)
+    with mock.patch("time.sleep") as mock_sleep:
+        state = policy.begin()
+        assert isinstance(state, RetryState)
+        state.check_retry()
+        state.check_retry()
+        with pytest.raises(TimeoutError):
+            state.check_retry()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+
+
+def test_retry_policy_decisions():
+    policy = RetryPolicy(max_retries=1, breaker_threshold=None)
+    ok = mock.Mock(status_code=200, headers={})
+    unavailable = mock.Mock(status_code=503, headers={})
+    assert not policy.begin("GET", "http://a").should_retry(response=ok)
+    assert not policy.begin("POST", "http://a").should_retry(
+        response=unavailable
+    )
+    state = policy.begin("GET", "http://a")
+    assert state.should_retry(response=unavailable)
+    assert not state.should_retry(response=unavailable)
+    stats = policy.stats()
+    assert stats["retries"] == 1
+    assert stats["retries_by_reason"] == {"503": 1}
+    assert stats["gave_up"] == 1
+
+
+def test_retry_policy_honours_retry_after():
+    policy = RetryPolicy(retry_after_max=10, breaker_threshold=None)
+    state = policy.begin("GET", "http://a")
+    response = mock.Mock(status_code=429, headers={"Retry-After": "7"})
+    assert state.should_retry(response=response)
+    assert state.delay == 7
+    response.headers["Retry-After"] = "3600"
+    assert state.should_retry(response=response)
+    assert state.delay == 10
+    assert policy.stats()["retry_after_honoured"] == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_retry_policy_timeout():
+    policy = RetryPolicy(
+        timeout=1, backoff_factor=5, jitter=False, breaker_threshold=None
+    )
+    state = policy.begin("GET", "http://a")
+    assert not state.should_retry(error=ConnectionError())
+
+
+def test_circuit_breaker_trips_and_recovers():
+    policy = RetryPolicy(
+        breaker_threshold=0.5,
+        breaker_window=4,
+        breaker_min_requests=4,
+        breaker_cooldown=30,
+    )
+    with mock.patch("time.monotonic", return_value=100):
+        for failed in (True, False, True, False):
+            state = policy.begin("GET", "http://a/job")
+            state.before_attempt()
+            policy.record(state.breaker, failed)
+        with pytest.raises(CircuitOpen):
+            policy.begin("GET", "http://a/other").before_attempt()
+        # other hosts are not affected
+        policy.begin("GET", "http://b/job").before_attempt()
+    with mock.patch("time.monotonic", return_value=131):
+        trial = policy.begin("GET", "http://a/job")
+        trial.before_attempt()
+        with pytest.raises(CircuitOpen):
+            policy.begin("GET", "http://a/job").before_attempt()
+        policy.record(trial.breaker, False)
+        policy.begin("GET", "http://a/job").before_attempt()
+    stats = policy.stats()
+    assert stats["breaker_trips"] == 1
+    assert stats["breaker_rejections"] == 2
+    assert stats["breakers"] == {"a": "closed", "b": "closed"}
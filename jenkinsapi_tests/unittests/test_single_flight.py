@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from mock import patch
+
+from jenkinsapi.jenkinsbase import JenkinsBase
+from jenkinsapi.utils.requester import Requester, request_key
+from jenkinsapi.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+BASEURL = "http://dummy"
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("u", {"a": 1, "b": 2}) == request_key(
+        "u", {"b": 2, "a": 1}
+    )
+    assert request_key("u") == request_key("u", {})
+    assert request_key("u", {"tree": "a"}) != request_key("u", {"tree": "b"})
+
+
+def run_concurrently(func, count=8):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = [None] * count
+
+    def worker(idx):
+        barrier.wait()
+        try:
+            results[idx] = func()
+        except Exception as error:  # pylint: disable=broad-except
+            errors[idx] = error
+
+    threads = [
+        threading.Thread(target=worker, args=(idx,)) for idx in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"n": len(calls)}
+
+    results, _ = run_concurrently(lambda: single_flight.do("k", slow))
+    assert len(calls) == 1
+    assert all(result == {"n": 1} for result in results)
+    stats = single_flight.stats()
+    assert stats["executed"] == 1
+    assert stats["coalesced"] == 7
+    assert stats["in_flight"] == 0
+
+
+def test_errors_are_shared():
+    single_flight = SingleFlight()
+
+    def failing():
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    _, errors = run_concurrently(lambda: single_flight.do("k", failing))
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert single_flight.stats()["executed"] == 1
+
+
+def test_results_are_not_reused_by_default():
+    single_flight = SingleFlight()
+    assert single_flight.do("k", lambda: 1) == 1
+    assert single_flight.do("k", lambda: 2) == 2
+
+
+def test_reuse_window():
+    single_flight = SingleFlight(reuse_window=0.5)
+    with patch("time.monotonic", return_value=100.0):
+        assert single_flight.do("k", lambda: 1) == 1
+        assert single_flight.do("k", lambda: 2) == 1
+    with patch("time.monotonic", return_value=100.6):
+        assert single_flight.do("k", lambda: 3) == 3
+    assert single_flight.stats()["reused"] == 1
+
+
+def test_bad_reuse_window():
+    with pytest.raises(ValueError):
+        SingleFlight(reuse_window=-1)
+
+
+def test_async_calls_are_coalesced():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "data"
+
+    async def main():
+        return await asyncio.gather(
+            *(single_flight.do("k", slow) for _ in range(5))
+        )
+
+    assert asyncio.run(main()) == ["data"] * 5
+    assert len(calls) == 1
+    assert single_flight.stats()["coalesced"] == 4
+
+
+def test_async_errors_are_shared():
+    single_flight = AsyncSingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(single_flight.do("k", failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(error, ValueError) for error in asyncio.run(main()))
+
+
+def test_get_data_coalesces_identical_polls(monkeypatch):
+    calls = []
+
+    def fake_get(self, url, **kwargs):  # pylint: disable=unused-argument
+        calls.append((url, kwargs.get("params")))
+        time.sleep(0.05)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"jobs": [], "name": "x"}'
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    single_flight = SingleFlight()
+
+    class Base(JenkinsBase):
+        def get_jenkins_obj(self):
+            return self
+
+    base = Base(BASEURL, poll=False)
+    base.requester = Requester(baseurl=BASEURL, single_flight=single_flight)
+    results, _ = run_concurrently(
+        lambda: base.get_data(BASEURL + "/api/json", tree="jobs[name]")
+    )
+    assert len(calls) == 1
+    assert all(result == {"jobs": [], "name": "x"} for result in results)
+    # every caller gets its own (shallow) copy
+    assert len({id(result) for result in results}) == len(results)
@@ -0,0 +1,105 @@
+import pytest
+
+from jenkinsapi.custom_exceptions import RequestBudgetExceeded
+from jenkinsapi.jenkins import Jenkins
+from jenkinsapi.utils.metrics import RequestEvent, RequestHook
+from jenkinsapi.utils.trace import RequestTrace
+
+
+pytestmark = pytest.mark.fake_jenkins(
+    jobs=3, folders=6, jobs_per_folder=2, builds=20
+)
+
+
+@pytest.fixture
+def jenkins(server):
+    return Jenkins(server.baseurl, use_crumb=False)
+
+
+def test_trace_tags_requests_with_caller(jenkins):
+    job = jenkins.get_job("job_00001")
+    with jenkins.trace() as trace:
+        job.get_build(5)
+
+    assert trace.request_count == 1
+    assert set(trace.by_caller()) == {"Job.get_build"}
+    last = trace.entries[-1]
+    assert last.pattern == "job/*/*/api/json?depth=..."
+    assert last.stack[0] == "Job.get_build"
+    assert last.stack[-1].endswith("_fetch_data")
+    assert last.status_code == 200
+    assert trace.response_bytes > 0
+    assert "Job.get_build" in trace.report()
+
+
+def test_trace_follows_requests_to_worker_threads(jenkins):
+    job = jenkins.get_job("job_00001")
+    with jenkins.trace() as trace:
+        builds = list(job.get_builds([3, 4, 5], max_workers=3))
+
+    assert len(builds) == 3
+    assert set(trace.by_caller()) == {"Job.get_builds"}
+    batched = [
+        entry
+        for entry in trace.entries
+        if entry.stack[-1] == "JenkinsBase.get_data_many"
+    ]
+    assert len(batched) == 3
+
+
+def test_trace_detects_n_plus_one(jenkins):
+    with jenkins.trace(n_plus_one_threshold=5) as trace:
+        for job in jenkins.jobs.itervalues():
+            job.get_description()
+    # 3 top level jobs stay below the threshold, 12 folder jobs do not
+    (suspect,) = trace.n_plus_one()
+    assert suspect["pattern"] == "job/*/job/*/api/json"
+    assert suspect["count"] == 12
+    assert suspect["callers"] == {"Jobs.itervalues": 12}
+    assert "Possible N+1: 12 x GET job/*/job/*/api/json" in trace.report()
+
+
+def test_trace_budget(jenkins):
+    job = jenkins.get_job("job_00001")
+    with pytest.raises(RequestBudgetExceeded, match="Job.get_build"):
+        with jenkins.trace(max_requests=0):
+            job.get_build(5)
+
+
+def test_refused_request_finishes_on_started_hooks(jenkins):
+    class Spans(RequestHook):
+        def __init__(self):
+            self.open = 0
+            self.errors = []
+
+        def request_started(self, event):
+            self.open += 1
+
+        def request_finished(self, event):
+            self.open -= 1
+            self.errors.append(event.error)
+
+    spans = Spans()
+    jenkins.requester.add_hook(spans)
+    job = jenkins.get_job("job_00001")
+    with pytest.raises(RequestBudgetExceeded):
+        with jenkins.trace(max_requests=0):
+            job.get_build(5)
+    assert spans.open == 0
+    assert isinstance(spans.errors[-1], RequestBudgetExceeded)
+
+
+def test_trace_hook_removed_on_exit(jenkins):
+    with jenkins.trace() as trace:
+        assert trace in jenkins.requester.hooks
+    assert trace not in jenkins.requester.hooks
+    jenkins.poll()
+    assert trace.request_count == 0
+
+
+def test_trace_outside_jenkinsapi():
+    trace = RequestTrace(max_requests=1)
+    trace.request_started(RequestEvent("GET", "http://x/api/json"))
+    assert trace.entries[0].caller == ""
+    with pytest.raises(RequestBudgetExceeded, match="unknown caller"):
+        trace.request_started(RequestEvent("GET", "http://x/api/json"))